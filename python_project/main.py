@@ -1,16 +1,33 @@
 import os
+import sys
+import argparse
+import multiprocessing
+import pickle
+import queue
 import re
+import bisect
+import shutil
+import threading
+import time
 import difflib
+import heapq
+import hashlib
 import html
 import json
 import urllib.parse
 import urllib.request
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
+import streamlit.config
+import streamlit.logger
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import plotly.express as px
 import plotly.io as pio
 from fpdf import FPDF, XPos, YPos
@@ -31,6 +48,24 @@ TEXAS_JUNIOR_COLLEGE_LAYER_URL = "https://services1.arcgis.com/hVMNhMnY75fwfIFy/
 TEXAS_NAVIGATION_DISTRICT_LAYER_URL = "https://services1.arcgis.com/YWG34dhJxrbxQWdF/arcgis/rest/services/Navigation_Districts2/FeatureServer/29"
 NCTCOG_TRANSIT_PROVIDERS_LAYER_URL = "https://geospatial.nctcog.org/map/rest/services/Transportation/DFWMaps_Transit/MapServer/10"
 TXDOT_SEAPORTS_LAYER_URL = "https://services.arcgis.com/KTcxiTD9dsQw4r7Z/arcgis/rest/services/TxDOT_Seaports/FeatureServer/0"
+# Send all ArcGIS requests to a stand-in server (scheme://host[:port]); request paths are kept.
+ARCGIS_BASE_URL = os.environ.get("ARCGIS_BASE_URL", "").strip().rstrip("/")
+ARCGIS_LAYER_WORKERS = max(1, int(os.environ.get("ARCGIS_LAYER_WORKERS", "6") or 6))
+ARCGIS_PAGE_WORKERS = max(1, int(os.environ.get("ARCGIS_PAGE_WORKERS", "4") or 4))
+# Kaleido renderer processes kept warm for PDF report charts (rendered concurrently).
+REPORT_CHART_WORKERS = max(1, int(os.environ.get("REPORT_CHART_WORKERS", "3") or 3))
+# PDF reports are built by this many background jobs at a time, shared by all sessions.
+REPORT_JOB_WORKERS = max(1, int(os.environ.get("REPORT_JOB_WORKERS", "2") or 2))
+# Fuzzy name matching: "ratio" scores exactly like difflib; "indel" is the faster
+# bit-parallel LCS similarity on the same 0-1 scale (never lower than "ratio").
+FUZZY_SCORER = os.environ.get("FUZZY_SCORER", "ratio").strip().lower()
+# Opt-in: parquet text columns are kept as Arrow strings and the name normalizers
+# run on pyarrow.compute kernels instead of per-row Python str objects.
+ARROW_STRINGS = os.environ.get("ARROW_STRINGS", "off").strip().lower() in {"1", "on", "true", "yes"}
+FUZZY_NAME_CUTOFF = 0.78
+FUZZY_SUBDIVISION_CUTOFF = 0.93
+FUZZY_SUBDIVISION_CONFIRM = 0.95
+FUZZY_OVERLAP_CUTOFF = 0.90
 MAP_BASEMAP_OPTIONS = {
     "Gray Canvas": "gray-vector",
     "Street Detail": "streets-vector",
@@ -199,6 +234,15 @@ def _resolve_data_path() -> str:
 
 PATH = _resolve_data_path()
 
+# `python main.py report-batch SPECS.csv` builds PDF reports without the Streamlit
+# runtime (see report_batch_main); the page chrome and body are skipped.
+REPORT_BATCH_CLI = __name__ == "__main__" and sys.argv[1:2] == ["report-batch"]
+if REPORT_BATCH_CLI:
+    # Bare-mode st calls warn about the missing script context; keep the CLI output readable.
+    # Reading the option first loads the config, which would otherwise reset the level later.
+    streamlit.config.get_option("logger.level")
+    streamlit.logger.set_log_level("error")
+
 st.set_page_config(page_title="Texas Taxpayer Lobbying Transparency Center", layout="wide")
 
 # =========================================================
@@ -2641,6 +2685,8 @@ def _page_client_lookup():
         st.caption(f"Data path: {PATH}")
         health = data_health_table(data)
         st.dataframe(health, width="stretch", height=260, hide_index=True)
+        st.caption("Load timings")
+        st.dataframe(load_report_table(data), width="stretch", height=260, hide_index=True)
 
     st.markdown('<div id="filter-bar-marker"></div>', unsafe_allow_html=True)
     top1, top2, top3 = st.columns([2.2, 1.2, 1.2])
@@ -2681,10 +2727,11 @@ def _page_client_lookup():
         )
         st.session_state.client_session = label_to_session.get(chosen_label, default_session)
 
-    client_index = build_client_index(Lobby_TFL_Client_All)
+    client_entry = data["nav_search_index"]["client"]
     resolved_client, client_suggestions = resolve_client_name(
         st.session_state.client_query,
-        client_index,
+        client_entry["frame"],
+        client_entry["index"],
     )
 
     if client_suggestions:
@@ -2785,6 +2832,10 @@ def _page_client_lookup():
             "name_to_short": name_to_short,
             "short_to_names": short_to_names,
             "filerid_to_short": data.get("filerid_to_short", {}),
+            "filer_row_index": data.get("filer_row_index", {}),
+            "recipient_row_index": data.get("recipient_row_index", {}),
+            "activity_facts": data.get("activity_facts"),
+            "disclosure_facts": data.get("disclosure_facts"),
         },
     }
     _ = _render_pdf_report_section(
@@ -2800,15 +2851,12 @@ def _page_client_lookup():
         focus_context=focus_context,
     )
 
-    @st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+    @st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
     def build_all_clients_overview(df: pd.DataFrame, session_val: str | None, scope_val: str) -> tuple[pd.DataFrame, dict]:
         if df.empty:
             return pd.DataFrame(), {}
 
-        d = df.copy()
-        d["Session"] = d["Session"].astype(str).str.strip()
-        if scope_val == "This Session" and session_val is not None:
-            d = d[d["Session"] == str(session_val)].copy()
+        d = session_scope(df, session_val if scope_val == "This Session" else None)
 
         d = ensure_cols(d, {"IsTFL": 0, "Client": "", "Low_num": 0.0, "High_num": 0.0, "LobbyShort": ""})
         d = d[d["Client"].fillna("").astype(str).str.strip() != ""].copy()
@@ -2820,7 +2868,7 @@ def _page_client_lookup():
             .agg(
                 Low=("Low_num", "sum"),
                 High=("High_num", "sum"),
-                Lobbyists=("LobbyShort", lambda s: s.dropna().astype(str).nunique()),
+                Lobbyists=("LobbyShort", "nunique"),
                 IsTFL=("IsTFL", "max"),
             )
         )
@@ -3163,7 +3211,7 @@ def _page_client_lookup():
     client_rows_all = lt_base[lt_base["ClientNorm"] == client_norm].copy()
 
     tfl_session = str(tfl_session_val) if tfl_session_val is not None else session
-    client_lt = client_rows_all[client_rows_all["Session"].astype(str).str.strip() == tfl_session].copy()
+    client_lt = session_rows(client_rows_all, tfl_session).copy()
     client_lt = ensure_cols(
         client_lt,
         {"IsTFL": 0, "Client": "", "Low_num": 0.0, "High_num": 0.0, "LobbyShort": "", "Lobby Name": ""},
@@ -3234,12 +3282,11 @@ def _page_client_lookup():
     total_low = float(client_lt["Low_num"].sum()) if not client_lt.empty else 0.0
     total_high = float(client_lt["High_num"].sum()) if not client_lt.empty else 0.0
 
-    wit_all = Wit_All
+    wit_all = session_rows(Wit_All, session)
     if "LobbyShortNorm" not in wit_all.columns:
         wit_all = wit_all.copy()
         wit_all["LobbyShortNorm"] = norm_name_series(wit_all["LobbyShort"])
-    session_col = wit_all["Session"].astype(str).str.strip()
-    wit = wit_all[(session_col == session) & (wit_all["LobbyShortNorm"].isin(lobbyshort_norms))].copy()
+    wit = wit_all[wit_all["LobbyShortNorm"].isin(lobbyshort_norms)].copy()
     if not wit.empty:
         norm_to_short = {norm_name(s): s for s in lobbyshorts if s}
         wit["LobbyShort"] = wit["LobbyShortNorm"].map(norm_to_short).fillna(wit["LobbyShort"])
@@ -3254,18 +3301,18 @@ def _page_client_lookup():
     if not wit.empty and "org" in wit.columns:
         orgs = wit.copy()
         orgs["Organization"] = orgs.get("org", "").fillna("").astype(str).str.strip()
-        orgs = orgs.groupby(["Session", "Bill", "LobbyShort"])["Organization"].apply(
+        orgs = orgs.groupby(["Session", "Bill", "LobbyShort"], observed=True)["Organization"].apply(
             lambda s: ", ".join(sorted({x for x in s if x}))
         ).reset_index()
         bills = bills.merge(orgs, on=["Session", "Bill", "LobbyShort"], how="left")
 
     if not bills.empty:
-        fi = Fiscal_Impact[Fiscal_Impact["Session"].astype(str).str.strip() == session].copy()
+        fi = session_rows(Fiscal_Impact, session).copy()
         if not fi.empty and {"Version", "EstimatedTwoYearNetImpactGR"}.issubset(fi.columns):
             fi["Version"] = fi["Version"].astype(str).str.upper().str.strip()
             fi["EstimatedTwoYearNetImpactGR"] = pd.to_numeric(fi["EstimatedTwoYearNetImpactGR"], errors="coerce").fillna(0)
             fi_p = (
-                fi.groupby(["Session", "Bill", "Version"], as_index=False)["EstimatedTwoYearNetImpactGR"]
+                fi.groupby(["Session", "Bill", "Version"], as_index=False, observed=True)["EstimatedTwoYearNetImpactGR"]
                   .sum()
                   .pivot(index=["Session", "Bill"], columns="Version", values="EstimatedTwoYearNetImpactGR")
                   .reset_index()
@@ -3276,7 +3323,7 @@ def _page_client_lookup():
     bills = ensure_cols(bills, {"LobbyShort": "", "Organization": "", "Fiscal Impact H": 0, "Fiscal Impact S": 0})
     bills["Lobbyist"] = bills.get("LobbyShort", "").map(lobbyshort_to_name).fillna(bills.get("LobbyShort", ""))
 
-    bill_subjects = Bill_Sub_All[Bill_Sub_All["Session"].astype(str).str.strip() == session].merge(
+    bill_subjects = session_rows(Bill_Sub_All, session).merge(
         bills[["Session", "Bill"]].drop_duplicates(), on=["Session", "Bill"], how="inner"
     )
     if not bill_subjects.empty:
@@ -3293,7 +3340,7 @@ def _page_client_lookup():
 
     lobby_sub = Lobby_Sub_All.copy()
     if "Session" in lobby_sub.columns:
-        lobby_sub = lobby_sub[lobby_sub["Session"].astype(str).str.strip() == session].copy()
+        lobby_sub = session_rows(lobby_sub, session).copy()
     elif "session" in lobby_sub.columns:
         lobby_sub = lobby_sub[lobby_sub["session"].astype(str).str.strip() == session].copy()
     if "LobbyShortNorm" in lobby_sub.columns:
@@ -3338,6 +3385,8 @@ def _page_client_lookup():
         lobbyist_norms_tuple=lobbyist_norms_tuple,
         filerid_to_short=data.get("filerid_to_short", {}),
         lobbyshort_to_name=lobbyshort_to_name,
+        _row_indexes=data.get("filer_row_index"),
+        _facts=data.get("activity_facts"),
     )
 
     disclosures = build_disclosures_multi(
@@ -3348,6 +3397,8 @@ def _page_client_lookup():
         lobbyist_norms_tuple=lobbyist_norms_tuple,
         filerid_to_short=data.get("filerid_to_short", {}),
         lobbyshort_to_name=lobbyshort_to_name,
+        _row_indexes=data.get("filer_row_index"),
+        _facts=data.get("disclosure_facts"),
     )
 
     staff_df = Staff_All
@@ -3377,14 +3428,14 @@ def _page_client_lookup():
             .fillna(staff_pick.get("StaffLastNorm", pd.Series([""] * len(staff_pick))).map(last_map))
         )
 
-    @st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+    @st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
     def staff_metrics(staff_rows: pd.DataFrame, bills_df: pd.DataFrame, session_val: str, bs_all: pd.DataFrame) -> pd.DataFrame:
         if staff_rows.empty or bills_df.empty:
             return pd.DataFrame(columns=["Legislator", "% Against that Failed", "% For that Passed"])
 
         legs = sorted(staff_rows["Legislator"].dropna().astype(str).unique().tolist())
         out = []
-        bs = bs_all[bs_all["Session"].astype(str).str.strip() == str(session_val)].copy()
+        bs = session_rows(bs_all, session_val)
 
         for leg in legs:
             authored = bs[bs["Author"].fillna("").astype(str).str.contains(leg, case=False, na=False)][["Session", "Bill", "Status"]]
@@ -4365,14 +4416,11 @@ def _page_map_address():
         "gray-vector",
     )
 
-    @st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+    @st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
     def build_map_clients_overview(df: pd.DataFrame, session_val: str | None, scope_val: str) -> tuple[pd.DataFrame, dict]:
         if df.empty:
             return pd.DataFrame(), {}
-        d = df.copy()
-        d["Session"] = d["Session"].astype(str).str.strip()
-        if scope_val == "This Session" and session_val is not None:
-            d = d[d["Session"] == str(session_val)].copy()
+        d = session_scope(df, session_val if scope_val == "This Session" else None)
         d = ensure_cols(d, {"IsTFL": 0, "Client": "", "Low_num": 0.0, "High_num": 0.0, "LobbyShort": ""})
         d = d[d["Client"].fillna("").astype(str).str.strip() != ""].copy()
         if d.empty:
@@ -4383,7 +4431,7 @@ def _page_map_address():
             .agg(
                 Low=("Low_num", "sum"),
                 High=("High_num", "sum"),
-                Lobbyists=("LobbyShort", lambda s: s.dropna().astype(str).nunique()),
+                Lobbyists=("LobbyShort", "nunique"),
                 IsTFL=("IsTFL", "max"),
             )
         )
@@ -4430,6 +4478,11 @@ def _page_map_address():
         else pd.DataFrame(columns=subdivision_match_cols)
     )
     subdivision_matches = _attach_subdivision_spend_totals(subdivision_matches, all_clients)
+    tfl_spending_source = (
+        all_clients[all_clients["IsTFL"] == 1].copy()
+        if not all_clients.empty
+        else pd.DataFrame(columns=["Client", "Low", "High", "Lobbyists", "IsTFL"])
+    )
     matched_subdivision_clients = set()
     if not subdivision_matches.empty:
         for names in subdivision_matches.get("match_clients", pd.Series(dtype=object)).tolist():
@@ -4562,9 +4615,9 @@ def _page_map_address():
         selected_client_set = set(selected_clients)
         if selected_name:
             st.markdown(f'<div class="app-note"><strong>Active context:</strong> {html.escape(selected_type)} | {html.escape(selected_name)} ({html.escape(selected_code or "N/A")})</div>', unsafe_allow_html=True)
-        if st.session_state.get("map_overlap_input_mode") not in {"Street Address", "Coordinates"}:
+        if st.session_state.get("map_overlap_input_mode") not in {"Street Address", "Coordinates", "Batch (CSV)"}:
             st.session_state.map_overlap_input_mode = "Street Address"
-        mode = st.radio("Lookup mode", ["Street Address", "Coordinates"], key="map_overlap_input_mode", horizontal=True)
+        mode = st.radio("Lookup mode", ["Street Address", "Coordinates", "Batch (CSV)"], key="map_overlap_input_mode", horizontal=True)
         analysis_point = None
         if mode == "Street Address":
             a1, a2 = st.columns([5, 1.2])
@@ -4586,7 +4639,7 @@ def _page_map_address():
                     analysis_point = {"query": addr, "matched": str(g.get("matched_address", addr)).strip() or addr, "score": float(g.get("score", 0.0)), "lon": float(g.get("lon", 0.0)), "lat": float(g.get("lat", 0.0)), "region": str(g.get("region_abbr", "")).strip().upper(), "city": str(g.get("city", "")).strip(), "postal": str(g.get("postal", "")).strip()}
                 else:
                     st.warning("Could not geocode that address.")
-        else:
+        elif mode == "Coordinates":
             a1, a2, a3 = st.columns([1.2, 1.2, 1.2])
             with a1:
                 st.number_input("Latitude", min_value=24.0, max_value=37.5, step=0.000001, format="%.6f", key="map_overlap_coord_lat")
@@ -4602,7 +4655,9 @@ def _page_map_address():
                 lon = float(st.session_state.get("map_overlap_query_lon", -99.0))
                 analysis_point = {"query": f"{lat:.6f}, {lon:.6f}", "matched": f"Coordinates ({lat:.6f}, {lon:.6f})", "score": None, "lon": lon, "lat": lat, "region": "TX", "city": "", "postal": ""}
 
-        if analysis_point is None:
+        if mode == "Batch (CSV)":
+            _render_address_overlap_batch(subdivision_matches, tfl_spending_source)
+        elif analysis_point is None:
             st.info("Enter lookup details to view overlap.")
         else:
             score_txt = f"{float(analysis_point['score']):.0f}" if analysis_point["score"] is not None else "N/A"
@@ -4692,6 +4747,25 @@ def _page_map_address():
                 ],
             )
 
+    with st.expander("Boundary layers", expanded=False):
+        st.caption(
+            f"Subdivision centroids are served from the local layer store; layers older than "
+            f"{LAYER_STORE_MAX_AGE_HOURS:g} hours refresh in the background."
+        )
+        if st.button("Refresh boundary layers", key="map_layer_refresh_btn"):
+            with st.spinner("Refreshing boundary layers..."):
+                st.session_state.map_layer_refresh_report = refresh_subdivision_layers()
+            build_tfl_political_subdivision_matches.clear()
+            st.rerun()
+        refresh_report = st.session_state.get("map_layer_refresh_report")
+        if isinstance(refresh_report, pd.DataFrame) and not refresh_report.empty:
+            st.dataframe(refresh_report, width="stretch", hide_index=True)
+        layer_table = subdivision_layer_store_table()
+        if layer_table.empty:
+            st.caption("Layer store disabled (LAYER_STORE_DIR=off); layers are fetched over the network.")
+        else:
+            st.dataframe(layer_table, width="stretch", hide_index=True)
+
     st.markdown(
         """
 <style>
@@ -4828,6 +4902,8 @@ def _page_member_lookup():
         st.caption(f"Data path: {PATH}")
         health = data_health_table(data)
         st.dataframe(health, width="stretch", height=260, hide_index=True)
+        st.caption("Load timings")
+        st.dataframe(load_report_table(data), width="stretch", height=260, hide_index=True)
 
     st.markdown('<div id="filter-bar-marker"></div>', unsafe_allow_html=True)
     top1, top2, top3 = st.columns([2.2, 1.2, 1.2])
@@ -4869,10 +4945,11 @@ def _page_member_lookup():
         st.session_state.member_session = label_to_session.get(chosen_label, default_session)
 
     author_bills_all = build_author_bill_index(Bill_Status_All)
-    member_index = build_member_index(author_bills_all)
+    member_entry = data["nav_search_index"]["member"]
     resolved_member, member_suggestions = resolve_member_name(
         st.session_state.member_query,
-        member_index,
+        member_entry["frame"],
+        member_entry["index"],
     )
 
     if member_suggestions:
@@ -4968,6 +5045,10 @@ def _page_member_lookup():
             "name_to_short": name_to_short,
             "short_to_names": short_to_names,
             "filerid_to_short": data.get("filerid_to_short", {}),
+            "filer_row_index": data.get("filer_row_index", {}),
+            "recipient_row_index": data.get("recipient_row_index", {}),
+            "activity_facts": data.get("activity_facts"),
+            "disclosure_facts": data.get("disclosure_facts"),
         },
     }
     _ = _render_pdf_report_section(
@@ -4983,7 +5064,7 @@ def _page_member_lookup():
         focus_context=focus_context,
     )
 
-    @st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+    @st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
     def build_all_legislators_overview(
         author_bills: pd.DataFrame,
         wit_all: pd.DataFrame,
@@ -4996,9 +5077,7 @@ def _page_member_lookup():
         if not session:
             return pd.DataFrame(), {}
 
-        d = author_bills.copy()
-        d["Session"] = d["Session"].astype(str).str.strip()
-        d = d[d["Session"] == session].copy()
+        d = session_scope(author_bills, session)
         d = ensure_cols(d, {"Author": "", "Status": "", "Bill": ""})
         d = d[d["Author"].astype(str).str.strip() != ""].copy()
         if d.empty:
@@ -5025,10 +5104,9 @@ def _page_member_lookup():
 
         wit = pd.DataFrame(columns=["Bill", "LobbyShort"])
         if isinstance(wit_all, pd.DataFrame) and not wit_all.empty:
-            wit = wit_all.copy()
+            wit = session_rows(wit_all, session) if "Session" in wit_all.columns else wit_all.iloc[0:0]
             wit = ensure_cols(wit, {"Session": "", "Bill": "", "LobbyShort": ""})
             wit["Session"] = wit["Session"].astype(str).str.strip()
-            wit = wit[wit["Session"] == session].copy()
             wit = wit[wit["Bill"].notna()].copy()
             wit["Bill"] = wit["Bill"].astype(str)
             wit = wit[wit["Bill"].str.strip() != ""].copy()
@@ -5260,13 +5338,13 @@ def _page_member_lookup():
 
     authored = author_bills_all.copy()
     authored = authored[authored["AuthorNorm"] == member_norm].copy()
-    authored = authored[authored["Session"].astype(str).str.strip() == session].copy()
+    authored = session_rows(authored, session).copy()
     authored = authored.drop_duplicates(subset=["Session", "Bill", "Author"])
 
     tfl_session = str(tfl_session_val) if tfl_session_val is not None else session
     lt = Lobby_TFL_Client_All.copy()
     if "Session" in lt.columns:
-        lt = lt[lt["Session"].astype(str).str.strip() == tfl_session].copy()
+        lt = session_rows(lt, tfl_session).copy()
     lt = ensure_cols(lt, {"LobbyShort": "", "IsTFL": 0})
     tfl_flag = (
         lt.groupby("LobbyShort", as_index=False)["IsTFL"]
@@ -5288,16 +5366,13 @@ def _page_member_lookup():
         )
 
     bill_list = authored["Bill"].dropna().astype(str).unique().tolist()
-    wit_all = Wit_All
+    wit_all = session_rows(Wit_All, session)
     if "LobbyShortNorm" not in wit_all.columns and "LobbyShort" in wit_all.columns:
         wit_all = wit_all.copy()
         wit_all["LobbyShortNorm"] = norm_name_series(wit_all["LobbyShort"])
 
     if bill_list:
-        wit = wit_all[
-            (wit_all["Session"].astype(str).str.strip() == session) &
-            (wit_all["Bill"].astype(str).isin(bill_list))
-        ].copy()
+        wit = wit_all[wit_all["Bill"].astype(str).isin(bill_list)].copy()
     else:
         wit = wit_all.iloc[0:0].copy()
 
@@ -5312,7 +5387,7 @@ def _page_member_lookup():
         if "org" in wit.columns:
             orgs = (
                 wit.assign(Organization=wit.get("org", "").fillna("").astype(str).str.strip())
-                .groupby(["Session", "Bill", "LobbyShort"])["Organization"]
+                .groupby(["Session", "Bill", "LobbyShort"], observed=True)["Organization"]
                 .apply(lambda s: ", ".join(sorted({x for x in s if x})))
                 .reset_index()
             )
@@ -5321,7 +5396,7 @@ def _page_member_lookup():
         if "name" in wit.columns:
             names = (
                 wit.assign(WitnessName=wit.get("name", "").fillna("").astype(str).str.strip())
-                .groupby(["Session", "Bill", "LobbyShort"])["WitnessName"]
+                .groupby(["Session", "Bill", "LobbyShort"], observed=True)["WitnessName"]
                 .apply(lambda s: ", ".join(sorted({x for x in s if x})))
                 .reset_index()
                 .rename(columns={"WitnessName": "Witness Name"})
@@ -5344,6 +5419,8 @@ def _page_member_lookup():
         name_to_short=name_to_short,
         filerid_to_short=data.get("filerid_to_short", {}),
         lobbyshort_to_name=lobbyshort_to_name,
+        _facts=data.get("activity_facts"),
+        _row_indexes=data.get("recipient_row_index"),
     )
 
     if not activities.empty:
@@ -6161,24 +6238,25 @@ def _render_workspace_links(
                     unsafe_allow_html=True,
                 )
 
-_nav_items = [
-    (_about_page, "Start Here"),
-    (_lobby_page, "Lobbyists"),
-    (_client_page, "Clients"),
-    (_map_page, "Map & Address"),
-    (_member_page, "Legislators"),
-    (_solutions_page, "Policy"),
-    (_tap_page, "Media"),
-]
-_nav_links = []
-for page, label in _nav_items:
-    active = " active" if page == _active_page else ""
-    _nav_links.append(
-        f'<a class="nav-link{active}" href="{_nav_href(page)}" target="_self">{label}</a>'
-    )
+if not REPORT_BATCH_CLI:
+    _nav_items = [
+        (_about_page, "Start Here"),
+        (_lobby_page, "Lobbyists"),
+        (_client_page, "Clients"),
+        (_map_page, "Map & Address"),
+        (_member_page, "Legislators"),
+        (_solutions_page, "Policy"),
+        (_tap_page, "Media"),
+    ]
+    _nav_links = []
+    for page, label in _nav_items:
+        active = " active" if page == _active_page else ""
+        _nav_links.append(
+            f'<a class="nav-link{active}" href="{_nav_href(page)}" target="_self">{label}</a>'
+        )
 
-st.markdown(
-    f"""
+    st.markdown(
+        f"""
 <div class="custom-nav">
   <div class="nav-inner">
     <div class="brand">
@@ -6191,52 +6269,52 @@ st.markdown(
   </div>
 </div>
 """,
-    unsafe_allow_html=True,
-)
+        unsafe_allow_html=True,
+    )
 
-if "nav_search_query" not in st.session_state:
-    st.session_state.nav_search_query = ""
-if "nav_search_last" not in st.session_state:
-    st.session_state.nav_search_last = ""
-if "nav_search_trigger" not in st.session_state:
-    st.session_state.nav_search_trigger = False
-if "experience_mode" not in st.session_state:
-    st.session_state.experience_mode = "Guided"
-
-def _nav_submit() -> None:
-    st.session_state.nav_search_trigger = True
-
-nav_query_raw = st.text_input(
-    "Nav search",
-    key="nav_search_query",
-    placeholder="Global search: lobbyist, client, legislator, or bill (example: HB 4)",
-    label_visibility="collapsed",
-    on_change=_nav_submit,
-    help="Routes to the best workspace and carries your query forward.",
-)
-mode_cols = st.columns([4.8, 1.2])
-with mode_cols[0]:
-    st.caption("Mode: Guided includes onboarding guardrails; Expert reduces instructional density.")
-with mode_cols[1]:
-    st.session_state.experience_mode = st.radio(
-        "Workspace mode",
-        ["Guided", "Expert"],
-        index=0 if st.session_state.experience_mode == "Guided" else 1,
-        horizontal=True,
-        key="workspace_mode_radio",
+    if "nav_search_query" not in st.session_state:
+        st.session_state.nav_search_query = ""
+    if "nav_search_last" not in st.session_state:
+        st.session_state.nav_search_last = ""
+    if "nav_search_trigger" not in st.session_state:
+        st.session_state.nav_search_trigger = False
+    if "experience_mode" not in st.session_state:
+        st.session_state.experience_mode = "Guided"
+
+    def _nav_submit() -> None:
+        st.session_state.nav_search_trigger = True
+
+    nav_query_raw = st.text_input(
+        "Nav search",
+        key="nav_search_query",
+        placeholder="Global search: lobbyist, client, legislator, or bill (example: HB 4)",
         label_visibility="collapsed",
-        help="Guided shows onboarding aids; Expert reduces instructional density.",
+        on_change=_nav_submit,
+        help="Routes to the best workspace and carries your query forward.",
     )
-nav_query = nav_query_raw.strip()
-nav_search_submitted = False
-if nav_query and st.session_state.nav_search_trigger:
-    nav_search_submitted = True
-    st.session_state.nav_search_last = nav_query
-    st.session_state.nav_search_trigger = False
-elif not nav_query:
-    st.session_state.nav_search_trigger = False
-nav_suggest_slot = st.empty()
-nav_skip_submit = False
+    mode_cols = st.columns([4.8, 1.2])
+    with mode_cols[0]:
+        st.caption("Mode: Guided includes onboarding guardrails; Expert reduces instructional density.")
+    with mode_cols[1]:
+        st.session_state.experience_mode = st.radio(
+            "Workspace mode",
+            ["Guided", "Expert"],
+            index=0 if st.session_state.experience_mode == "Guided" else 1,
+            horizontal=True,
+            key="workspace_mode_radio",
+            label_visibility="collapsed",
+            help="Guided shows onboarding aids; Expert reduces instructional density.",
+        )
+    nav_query = nav_query_raw.strip()
+    nav_search_submitted = False
+    if nav_query and st.session_state.nav_search_trigger:
+        nav_search_submitted = True
+        st.session_state.nav_search_last = nav_query
+        st.session_state.nav_search_trigger = False
+    elif not nav_query:
+        st.session_state.nav_search_trigger = False
+    nav_suggest_slot = st.empty()
+    nav_skip_submit = False
 
 # =========================================================
 # HELPERS
@@ -6255,7 +6333,67 @@ def norm_name(x) -> str:
     s = str(x).replace("\u00A0", " ").strip().upper()
     return _RE_NONWORD.sub("", s)
 
+# Arrow string kernels (ARROW_STRINGS): RE2's \s and \w are ASCII-only, so the
+# character classes below spell out what Python's str.strip()/split() and re's \w
+# cover; both paths produce the same keys.
+_PY_WHITESPACE = "".join(chr(c) for c in range(0x3001) if chr(c).isspace())
+_ARROW_SPACE = "[" + "".join(f"\\x{{{ord(c):x}}}" for c in _PY_WHITESPACE) + "]"
+_ARROW_NONWORD = r"[^\p{L}\p{N}_]+"
+# Python's \b is a Unicode word boundary; RE2's is ASCII, so title words are
+# matched with their neighbouring non-word character captured and put back.
+_ARROW_TITLE_WORDS = r"(^|[^\p{L}\p{N}_])(?i:" + "|".join(_TITLE_WORDS) + r")(?:\.|([^\p{L}\p{N}_]|$))"
+# str.upper() expands a few characters ("ß" -> "SS"); utf8_upper maps one to one.
+_ARROW_MULTI_UPPER = "[" + "".join(f"\\x{{{c:x}}}" for c in range(0x10000) if len(chr(c).upper()) > 1) + "]"
+
+def is_arrow_string(s) -> bool:
+    dtype = getattr(s, "dtype", None)
+    if not isinstance(dtype, pd.ArrowDtype):
+        return False
+    import pyarrow as pa
+
+    return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+
+def _use_arrow_strings(s) -> bool:
+    return ARROW_STRINGS or is_arrow_string(s)
+
+def _arrow_text(s: pd.Series):
+    """Null-free Arrow string array for s; object input is decoded like .fillna("").astype(str)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if is_arrow_string(s):
+        return pc.fill_null(pa.array(s.array), "")
+    return pa.array(s.fillna("").astype(str).to_numpy(dtype=object), type=pa.large_string())
+
+def _arrow_series(arr, like: pd.Series) -> pd.Series:
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=like.index, name=like.name)
+
+def _arrow_strip(arr):
+    import pyarrow.compute as pc
+
+    return pc.utf8_trim(pc.replace_substring(arr, "\u00A0", " "), _PY_WHITESPACE)
+
+def _arrow_upper(arr):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    upper = pc.utf8_upper(arr)
+    if pc.all(pc.string_is_ascii(arr)).as_py() is not False:
+        return upper
+    special = pc.match_substring_regex(arr, _ARROW_MULTI_UPPER)
+    if pc.any(special).as_py():
+        expanded = [v.upper() for v in pc.filter(arr, special).to_pylist()]
+        upper = pc.replace_with_mask(upper, special, pa.array(expanded, type=upper.type))
+    return upper
+
+def _arrow_norm_name(arr):
+    import pyarrow.compute as pc
+
+    return pc.replace_substring_regex(_arrow_upper(_arrow_strip(arr)), _ARROW_NONWORD, "")
+
 def norm_name_series(s: pd.Series) -> pd.Series:
+    if _use_arrow_strings(s):
+        return _arrow_series(_arrow_norm_name(_arrow_text(s)), s)
     return (
         s.fillna("")
          .astype(str)
@@ -6266,6 +6404,19 @@ def norm_name_series(s: pd.Series) -> pd.Series:
     )
 
 def clean_filer_name_series(s: pd.Series) -> pd.Series:
+    if _use_arrow_strings(s):
+        import pyarrow.compute as pc
+
+        arr = pc.replace_substring_regex(_arrow_text(s), r"\([^)]*\)", "")
+        while True:
+            # A match consumes the character after the title, so adjacent titles
+            # ("Hon Dr Smith") take another pass.
+            stripped = pc.replace_substring_regex(arr, _ARROW_TITLE_WORDS, r"\1\2")
+            if stripped.equals(arr):
+                break
+            arr = stripped
+        arr = pc.replace_substring_regex(arr, _ARROW_SPACE + "+", " ")
+        return _arrow_series(pc.utf8_trim(arr, _PY_WHITESPACE), s)
     s = s.fillna("").astype(str)
     s = s.str.replace(r"\([^)]*\)", "", regex=True)
     s = s.str.replace(r"\b(" + "|".join(_TITLE_WORDS) + r")\b\.?", "", regex=True, flags=re.IGNORECASE)
@@ -6283,14 +6434,222 @@ def clean_person_name(name: str) -> str:
     s = re.sub(r"\s+", " ", s).strip()
     return s
 
+# ---------------------------------------------------------
+# Dataset handle: frames/maps returned by load_workbook are keyed in
+# st.cache_data by the dataset fingerprint instead of their contents.
+# ---------------------------------------------------------
+_DATASET_KEEP_GENERATIONS = 2  # matches load_workbook max_entries
+
+def _dataset_fingerprint(path: str) -> str:
+    """Cheap content fingerprint from source file names, sizes and mtimes."""
+    h = hashlib.md5(str(path).encode("utf-8"), usedforsecurity=False)
+    if not _is_url(path):
+        base = Path(path)
+        files = sorted(base.iterdir()) if base.is_dir() else [base]
+        for f in files:
+            try:
+                st_info = f.stat()
+            except OSError:
+                continue
+            h.update(f"{f.name}|{st_info.st_size}|{st_info.st_mtime_ns}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+@st.cache_resource(show_spinner=False)
+def _dataset_registry() -> dict:
+    return {"objects": {}, "sessions": {}, "generations": []}
+
+def _new_dataset_generation() -> list:
+    """Start a registration batch for one load; drops batches from evicted loads."""
+    reg = _dataset_registry()
+    generation = []
+    reg["generations"].append(generation)
+    while len(reg["generations"]) > _DATASET_KEEP_GENERATIONS:
+        stale = reg["generations"].pop(0)
+        live = {i for gen in reg["generations"] for i in gen}
+        for i in stale:
+            if i not in live:
+                reg["objects"].pop(i, None)
+                reg["sessions"].pop(i, None)
+    return generation
+
+def register_dataset_object(obj, token: str, generation: list) -> None:
+    """Tag a loaded frame/map so cached builders hash it by fingerprint."""
+    if isinstance(obj, (pd.DataFrame, dict)):
+        _dataset_registry()["objects"][id(obj)] = (obj, token)
+        generation.append(id(obj))
+
+def _registered_token(obj) -> str | None:
+    hit = _dataset_registry()["objects"].get(id(obj))
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    return None
+
+def _frame_cache_token(df: pd.DataFrame):
+    token = _registered_token(df)
+    if token is not None:
+        return token
+    # Same scheme Streamlit uses for unregistered (derived) frames.
+    sample = df.sample(n=10_000, random_state=0) if len(df) >= 50_000 else df
+    try:
+        return (
+            df.shape,
+            pd.util.hash_pandas_object(df.dtypes).to_numpy().tobytes(),
+            pd.util.hash_pandas_object(sample).to_numpy().tobytes(),
+        )
+    except TypeError:
+        return pickle.dumps(sample, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _mapping_cache_token(d: dict):
+    token = _registered_token(d)
+    if token is not None:
+        return token
+    return list(d.items())
+
+DATASET_HASH_FUNCS = {pd.DataFrame: _frame_cache_token, dict: _mapping_cache_token}
+
+# ---------------------------------------------------------
+# Session slices: multi-session tables are grouped by Session at load (sessions in
+# first-seen order, rows in file order within a session), so one session's rows
+# are a contiguous block. session_rows serves that block as a view, memoized and
+# registered so cached builders hash it by token; other frames get the usual mask.
+# ---------------------------------------------------------
+def _session_keys(df: pd.DataFrame) -> pd.Series:
+    return df["Session"].astype(str).str.strip()
+
+def group_by_session(df: pd.DataFrame) -> pd.DataFrame:
+    """Reorder rows so each Session is contiguous; already-grouped frames are returned as is."""
+    if not isinstance(df, pd.DataFrame) or df.empty or "Session" not in df.columns:
+        return df
+    codes, _ = pd.factorize(_session_keys(df))
+    if (np.diff(codes) >= 0).all():
+        return df
+    return df.take(np.argsort(codes, kind="stable")).reset_index(drop=True)
+
+def session_bounds(df: pd.DataFrame) -> dict | None:
+    """Session -> (start, stop) row positions, or None when sessions are not contiguous."""
+    if not isinstance(df, pd.DataFrame) or "Session" not in df.columns:
+        return None
+    keys = _session_keys(df).to_numpy(dtype=object)
+    if not len(keys):
+        return {}
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    stops = np.r_[starts[1:], len(keys)]
+    bounds = {keys[a]: (int(a), int(b)) for a, b in zip(starts, stops)}
+    return bounds if len(bounds) == len(starts) else None
+
+def register_session_bounds(df: pd.DataFrame, generation: list) -> None:
+    bounds = session_bounds(df)
+    if bounds is not None:
+        _dataset_registry()["sessions"][id(df)] = (df, bounds, {}, generation)
+
+def session_rows(df: pd.DataFrame, session) -> pd.DataFrame:
+    """Rows of df whose stripped Session equals session. Copy before modifying the result."""
+    hit = _dataset_registry()["sessions"].get(id(df))
+    if hit is None or hit[0] is not df:
+        return df[_session_keys(df) == str(session)]
+    _, bounds, views, generation = hit
+    key = str(session)
+    view = views.get(key)
+    if view is None:
+        start, stop = bounds.get(key, (0, 0))
+        view = df.iloc[start:stop]
+        token = _registered_token(df)
+        if token is not None:
+            register_dataset_object(view, f"{token}@{key}", generation)
+        views[key] = view
+    return view
+
+def session_scope(df: pd.DataFrame, session) -> pd.DataFrame:
+    """Copy of df's rows for session (all rows when session is None), with Session as stripped text."""
+    d = (df if session is None else session_rows(df, session)).copy()
+    d["Session"] = _session_keys(d)
+    return d
+
+def _script_ctx_runner(fn):
+    """Wrap fn so pool threads inherit this script run's context (needed by cached st calls)."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def run(*args, **kwargs):
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+
+    return run
+
+def _arcgis_url(url: str) -> str:
+    if not ARCGIS_BASE_URL:
+        return url
+    parts = urllib.parse.urlsplit(url)
+    return ARCGIS_BASE_URL + urllib.parse.urlunsplit(("", "", parts.path, parts.query, parts.fragment))
+
 def _arcgis_get_json(url: str, params: dict | None = None, timeout: int = 30) -> dict:
-    target = url
+    target = _arcgis_url(url)
     if params:
-        target = f"{url}?{urllib.parse.urlencode(params)}"
+        target = f"{target}?{urllib.parse.urlencode(params)}"
     req = urllib.request.Request(target, headers={"User-Agent": "Mozilla/5.0"})
     with urllib.request.urlopen(req, timeout=timeout) as resp:
         return json.loads(resp.read().decode("utf-8"))
 
+def _arcgis_query_pages_serial(query_url: str, params: dict, page_size: int) -> list[dict]:
+    features: list[dict] = []
+    offset = 0
+    while True:
+        payload = _arcgis_get_json(
+            query_url,
+            params={**params, "resultRecordCount": page_size, "resultOffset": offset},
+        )
+        page = payload.get("features", [])
+        if not page:
+            break
+        features.extend(page)
+        if len(page) < page_size:
+            break
+        offset += len(page)
+    return features
+
+def _arcgis_query_features(layer_url: str, params: dict, page_size: int) -> list[dict]:
+    """Return every feature of a layer query, fetching pages concurrently.
+
+    The feature count is requested first so page offsets are known up front;
+    layers that refuse the count query are paged serially. Any failed page
+    raises, so a layer is still all-or-nothing for its caller.
+    """
+    query_url = f"{layer_url}/query"
+    try:
+        count_payload = _arcgis_get_json(
+            query_url,
+            params={"where": params.get("where", "1=1"), "returnCountOnly": "true", "f": "json"},
+        )
+        total = int(count_payload["count"])
+    except Exception:
+        return _arcgis_query_pages_serial(query_url, params, page_size)
+    if total <= 0:
+        return []
+
+    def fetch_page(offset: int) -> list[dict]:
+        # Servers cap resultRecordCount at their own maxRecordCount, so keep
+        # reading until this page's slice is filled.
+        limit = min(page_size, total - offset)
+        page: list[dict] = []
+        while len(page) < limit:
+            payload = _arcgis_get_json(
+                query_url,
+                params={**params, "resultRecordCount": limit - len(page), "resultOffset": offset + len(page)},
+            )
+            got = payload.get("features", [])
+            if not got:
+                break
+            page.extend(got)
+        return page
+
+    offsets = list(range(0, total, page_size))
+    if len(offsets) == 1:
+        return fetch_page(0)
+    workers = min(ARCGIS_PAGE_WORKERS, len(offsets))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arcgis-page") as pool:
+        pages = list(pool.map(fetch_page, offsets))
+    return [feat for page in pages for feat in page]
+
 def _canonical_school_district_name(value: str) -> str:
     if value is None or (isinstance(value, float) and pd.isna(value)):
         return ""
@@ -6660,64 +7019,53 @@ def _attach_subdivision_spend_totals(matches: pd.DataFrame, client_totals: pd.Da
     out["high_total"] = high_vals
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_tea_school_district_centroids() -> pd.DataFrame:
     cols = ["fid", "name", "name2", "name20", "district_code", "district_code_compact", "lon", "lat"]
     rows: list[dict] = []
     page_size = 1000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TEA_ARCGIS_SCHOOL_DISTRICT_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "FID,NAME,NAME2,NAME20,DISTRICT,DISTRICT_C",
-                    "returnGeometry": "false",
-                    "returnCentroid": "true",
-                    "outSR": "4326",
-                    "orderByFields": "FID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            TEA_ARCGIS_SCHOOL_DISTRICT_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "FID,NAME,NAME2,NAME20,DISTRICT,DISTRICT_C",
+                "returnGeometry": "false",
+                "returnCentroid": "true",
+                "outSR": "4326",
+                "orderByFields": "FID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            centroid = feat.get("centroid", {}) or {}
+            fid = attrs.get("FID")
+            if fid is None:
+                continue
+            try:
+                lon = float(centroid.get("x"))
+                lat = float(centroid.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "fid": int(fid),
+                    "name": str(attrs.get("NAME", "")).strip(),
+                    "name2": str(attrs.get("NAME2", "")).strip(),
+                    "name20": str(attrs.get("NAME20", "")).strip(),
+                    "district_code": str(attrs.get("DISTRICT", "")).strip(),
+                    "district_code_compact": str(attrs.get("DISTRICT_C", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                centroid = feat.get("centroid", {}) or {}
-                fid = attrs.get("FID")
-                if fid is None:
-                    continue
-                try:
-                    lon = float(centroid.get("x"))
-                    lat = float(centroid.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "fid": int(fid),
-                        "name": str(attrs.get("NAME", "")).strip(),
-                        "name2": str(attrs.get("NAME2", "")).strip(),
-                        "name20": str(attrs.get("NAME20", "")).strip(),
-                        "district_code": str(attrs.get("DISTRICT", "")).strip(),
-                        "district_code_compact": str(attrs.get("DISTRICT_C", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
         return pd.DataFrame(columns=cols)
     return pd.DataFrame(rows, columns=cols)
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_tea_county_centroids() -> pd.DataFrame:
     cols = ["objectid", "name", "fips", "cntykey", "lon", "lat"]
     rows: list[dict] = []
@@ -6762,52 +7110,42 @@ def fetch_tea_county_centroids() -> pd.DataFrame:
         return pd.DataFrame(columns=cols)
     return pd.DataFrame(rows, columns=cols)
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_texas_city_centroids() -> pd.DataFrame:
     cols = ["objectid", "name", "basename", "geoid", "lon", "lat"]
     rows: list[dict] = []
     page_size = 2000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{CENSUS_ARCGIS_TEXAS_CITY_LAYER_URL}/query",
-                params={
-                    "where": "STATE='48'",
-                    "outFields": "OBJECTID,NAME,BASENAME,GEOID,CENTLON,CENTLAT",
-                    "returnGeometry": "false",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            CENSUS_ARCGIS_TEXAS_CITY_LAYER_URL,
+            params={
+                "where": "STATE='48'",
+                "outFields": "OBJECTID,NAME,BASENAME,GEOID,CENTLON,CENTLAT",
+                "returnGeometry": "false",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            src_id = attrs.get("OBJECTID")
+            if src_id is None:
+                continue
+            try:
+                lon = float(str(attrs.get("CENTLON", "")).strip())
+                lat = float(str(attrs.get("CENTLAT", "")).strip())
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "objectid": int(src_id),
+                    "name": str(attrs.get("NAME", "")).strip(),
+                    "basename": str(attrs.get("BASENAME", "")).strip(),
+                    "geoid": str(attrs.get("GEOID", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                src_id = attrs.get("OBJECTID")
-                if src_id is None:
-                    continue
-                try:
-                    lon = float(str(attrs.get("CENTLON", "")).strip())
-                    lat = float(str(attrs.get("CENTLAT", "")).strip())
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "objectid": int(src_id),
-                        "name": str(attrs.get("NAME", "")).strip(),
-                        "basename": str(attrs.get("BASENAME", "")).strip(),
-                        "geoid": str(attrs.get("GEOID", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -6858,7 +7196,7 @@ def _build_layer_subdivision_matches(
                 root_index.setdefault(root_key, set()).add(client)
     if not exact_index and not root_index:
         return pd.DataFrame(columns=cols)
-    known_root_keys = tuple(root_index.keys())
+    known_roots = build_fuzzy_index(root_index) if root_index else None
 
     out_rows: list[dict] = []
     for row in layer_df.itertuples(index=False):
@@ -6888,14 +7226,14 @@ def _build_layer_subdivision_matches(
             matched_clients |= root_index.get(root_key, set())
 
         # Conservative fuzzy fallback for near-identical subdivision naming variants.
-        if not matched_clients and candidate_root_keys and known_root_keys:
+        if not matched_clients and candidate_root_keys and known_roots is not None:
             for candidate_root in candidate_root_keys:
                 if len(candidate_root) < 6:
                     continue
-                close_roots = difflib.get_close_matches(candidate_root, known_root_keys, n=3, cutoff=0.93)
+                close_roots = fuzzy_close_matches(known_roots, candidate_root, n=3, cutoff=FUZZY_SUBDIVISION_CUTOFF)
                 for close_root in close_roots:
-                    ratio = difflib.SequenceMatcher(None, candidate_root, close_root).ratio()
-                    if ratio >= 0.95 or candidate_root in close_root or close_root in candidate_root:
+                    ratio = fuzzy_score(candidate_root, close_root)
+                    if ratio >= FUZZY_SUBDIVISION_CONFIRM or candidate_root in close_root or close_root in candidate_root:
                         matched_clients |= root_index.get(close_root, set())
 
         if not matched_clients:
@@ -6931,55 +7269,45 @@ def _build_layer_subdivision_matches(
     out = out.sort_values(["match_count", "subdivision_name"], ascending=[False, True])
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_tceq_water_district_centroids() -> pd.DataFrame:
     cols = ["district_name", "district_code", "type_code", "type_desc", "lon", "lat"]
     rows: list[dict] = []
     page_size = 2000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TCEQ_WATER_DISTRICTS_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "NAME,DISTRICT_ID,TYPE,TYPE_DESCRIPTION",
-                    "returnGeometry": "false",
-                    "returnCentroid": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            TCEQ_WATER_DISTRICTS_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "NAME,DISTRICT_ID,TYPE,TYPE_DESCRIPTION",
+                "returnGeometry": "false",
+                "returnCentroid": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            centroid = feat.get("centroid", {}) or {}
+            name = str(attrs.get("NAME", "")).strip()
+            if not name:
+                continue
+            try:
+                lon = float(centroid.get("x"))
+                lat = float(centroid.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "district_name": name,
+                    "district_code": str(attrs.get("DISTRICT_ID", "")).strip(),
+                    "type_code": str(attrs.get("TYPE", "")).strip(),
+                    "type_desc": str(attrs.get("TYPE_DESCRIPTION", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                centroid = feat.get("centroid", {}) or {}
-                name = str(attrs.get("NAME", "")).strip()
-                if not name:
-                    continue
-                try:
-                    lon = float(centroid.get("x"))
-                    lat = float(centroid.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "district_name": name,
-                        "district_code": str(attrs.get("DISTRICT_ID", "")).strip(),
-                        "type_code": str(attrs.get("TYPE", "")).strip(),
-                        "type_desc": str(attrs.get("TYPE_DESCRIPTION", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -6991,53 +7319,43 @@ def fetch_tceq_water_district_centroids() -> pd.DataFrame:
     )
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_tceq_groundwater_district_centroids() -> pd.DataFrame:
     cols = ["district_name", "district_code", "lon", "lat"]
     rows: list[dict] = []
     page_size = 500
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TCEQ_GROUNDWATER_DISTRICTS_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "DISTNAME,DIST_NUM,SHORTNAM",
-                    "returnGeometry": "false",
-                    "returnCentroid": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            TCEQ_GROUNDWATER_DISTRICTS_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "DISTNAME,DIST_NUM,SHORTNAM",
+                "returnGeometry": "false",
+                "returnCentroid": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            centroid = feat.get("centroid", {}) or {}
+            name = str(attrs.get("DISTNAME", "")).strip() or str(attrs.get("SHORTNAM", "")).strip()
+            if not name:
+                continue
+            try:
+                lon = float(centroid.get("x"))
+                lat = float(centroid.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "district_name": name,
+                    "district_code": str(attrs.get("DIST_NUM", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                centroid = feat.get("centroid", {}) or {}
-                name = str(attrs.get("DISTNAME", "")).strip() or str(attrs.get("SHORTNAM", "")).strip()
-                if not name:
-                    continue
-                try:
-                    lon = float(centroid.get("x"))
-                    lat = float(centroid.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "district_name": name,
-                        "district_code": str(attrs.get("DIST_NUM", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -7049,7 +7367,6 @@ def fetch_tceq_groundwater_district_centroids() -> pd.DataFrame:
     )
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_texas_rma_centroids() -> pd.DataFrame:
     cols = ["district_name", "district_code", "lon", "lat"]
     rows: list[dict] = []
@@ -7092,114 +7409,94 @@ def fetch_texas_rma_centroids() -> pd.DataFrame:
         return pd.DataFrame(columns=cols)
     return pd.DataFrame(rows, columns=cols)
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_texas_junior_college_centroids() -> pd.DataFrame:
     cols = ["district_name", "district_code", "name2", "lon", "lat"]
     rows: list[dict] = []
     page_size = 500
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TEXAS_JUNIOR_COLLEGE_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "OBJECTID,DISTRICT,NAME1,NAME2,NAME3",
-                    "returnGeometry": "false",
-                    "returnCentroid": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
-            )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                centroid = feat.get("centroid", {}) or {}
-                name1 = str(attrs.get("NAME1", "")).strip()
-                name2 = str(attrs.get("NAME2", "")).strip()
-                name = name1 or name2
-                if not name:
-                    continue
-                try:
-                    lon = float(centroid.get("x"))
-                    lat = float(centroid.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "district_name": name,
-                        "district_code": str(attrs.get("DISTRICT", "")).strip(),
-                        "name2": name2,
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
-    except Exception:
-        return pd.DataFrame(columns=cols)
-    if not rows:
-        return pd.DataFrame(columns=cols)
-    out = pd.DataFrame(rows, columns=cols)
-    out = (
-        out.groupby(["district_name", "district_code", "name2"], as_index=False)
-        .agg(lon=("lon", "mean"), lat=("lat", "mean"))
+        features = _arcgis_query_features(
+            TEXAS_JUNIOR_COLLEGE_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "OBJECTID,DISTRICT,NAME1,NAME2,NAME3",
+                "returnGeometry": "false",
+                "returnCentroid": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            centroid = feat.get("centroid", {}) or {}
+            name1 = str(attrs.get("NAME1", "")).strip()
+            name2 = str(attrs.get("NAME2", "")).strip()
+            name = name1 or name2
+            if not name:
+                continue
+            try:
+                lon = float(centroid.get("x"))
+                lat = float(centroid.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "district_name": name,
+                    "district_code": str(attrs.get("DISTRICT", "")).strip(),
+                    "name2": name2,
+                    "lon": lon,
+                    "lat": lat,
+                }
+            )
+    except Exception:
+        return pd.DataFrame(columns=cols)
+    if not rows:
+        return pd.DataFrame(columns=cols)
+    out = pd.DataFrame(rows, columns=cols)
+    out = (
+        out.groupby(["district_name", "district_code", "name2"], as_index=False)
+        .agg(lon=("lon", "mean"), lat=("lat", "mean"))
     )
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_texas_navigation_district_centroids() -> pd.DataFrame:
     cols = ["district_name", "district_code", "lon", "lat"]
     rows: list[dict] = []
     page_size = 1000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TEXAS_NAVIGATION_DISTRICT_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "OBJECTID,DISTRICT_N",
-                    "returnGeometry": "false",
-                    "returnCentroid": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            TEXAS_NAVIGATION_DISTRICT_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "OBJECTID,DISTRICT_N",
+                "returnGeometry": "false",
+                "returnCentroid": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            centroid = feat.get("centroid", {}) or {}
+            name = str(attrs.get("DISTRICT_N", "")).strip()
+            if not name:
+                continue
+            try:
+                lon = float(centroid.get("x"))
+                lat = float(centroid.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "district_name": name,
+                    "district_code": str(attrs.get("OBJECTID", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                centroid = feat.get("centroid", {}) or {}
-                name = str(attrs.get("DISTRICT_N", "")).strip()
-                if not name:
-                    continue
-                try:
-                    lon = float(centroid.get("x"))
-                    lat = float(centroid.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "district_name": name,
-                        "district_code": str(attrs.get("OBJECTID", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -7211,58 +7508,48 @@ def fetch_texas_navigation_district_centroids() -> pd.DataFrame:
     )
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_nctcog_transit_provider_centroids() -> pd.DataFrame:
     cols = ["provider_name", "classification", "district_code", "lon", "lat"]
     rows: list[dict] = []
     page_size = 1000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{NCTCOG_TRANSIT_PROVIDERS_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "OBJECTID,Name,Classification",
-                    "returnGeometry": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
-            )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                geometry = feat.get("geometry", {}) or {}
-                name = str(attrs.get("Name", "")).strip()
-                if not name:
-                    continue
-                try:
-                    rings = geometry.get("rings", []) or []
-                    x_vals = [float(pt[0]) for ring in rings for pt in ring if isinstance(pt, list) and len(pt) >= 2]
-                    y_vals = [float(pt[1]) for ring in rings for pt in ring if isinstance(pt, list) and len(pt) >= 2]
-                    if not x_vals or not y_vals:
-                        continue
-                    lon = (min(x_vals) + max(x_vals)) / 2.0
-                    lat = (min(y_vals) + max(y_vals)) / 2.0
-                except (TypeError, ValueError, IndexError):
+        features = _arcgis_query_features(
+            NCTCOG_TRANSIT_PROVIDERS_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "OBJECTID,Name,Classification",
+                "returnGeometry": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            geometry = feat.get("geometry", {}) or {}
+            name = str(attrs.get("Name", "")).strip()
+            if not name:
+                continue
+            try:
+                rings = geometry.get("rings", []) or []
+                x_vals = [float(pt[0]) for ring in rings for pt in ring if isinstance(pt, list) and len(pt) >= 2]
+                y_vals = [float(pt[1]) for ring in rings for pt in ring if isinstance(pt, list) and len(pt) >= 2]
+                if not x_vals or not y_vals:
                     continue
-                rows.append(
-                    {
-                        "provider_name": name,
-                        "classification": str(attrs.get("Classification", "")).strip(),
-                        "district_code": str(attrs.get("OBJECTID", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
+                lon = (min(x_vals) + max(x_vals)) / 2.0
+                lat = (min(y_vals) + max(y_vals)) / 2.0
+            except (TypeError, ValueError, IndexError):
+                continue
+            rows.append(
+                {
+                    "provider_name": name,
+                    "classification": str(attrs.get("Classification", "")).strip(),
+                    "district_code": str(attrs.get("OBJECTID", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
+            )
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -7274,53 +7561,43 @@ def fetch_nctcog_transit_provider_centroids() -> pd.DataFrame:
     )
     return out
 
-@st.cache_data(show_spinner=False, ttl=43200, max_entries=2)
 def fetch_txdot_seaport_centroids() -> pd.DataFrame:
     cols = ["port_name", "port_type", "port_code", "lon", "lat"]
     rows: list[dict] = []
     page_size = 1000
-    offset = 0
     try:
-        while True:
-            payload = _arcgis_get_json(
-                f"{TXDOT_SEAPORTS_LAYER_URL}/query",
-                params={
-                    "where": "1=1",
-                    "outFields": "OBJECTID,PORT_NM,PORT_TYPE",
-                    "returnGeometry": "true",
-                    "outSR": "4326",
-                    "orderByFields": "OBJECTID ASC",
-                    "resultRecordCount": page_size,
-                    "resultOffset": offset,
-                    "f": "json",
-                },
+        features = _arcgis_query_features(
+            TXDOT_SEAPORTS_LAYER_URL,
+            params={
+                "where": "1=1",
+                "outFields": "OBJECTID,PORT_NM,PORT_TYPE",
+                "returnGeometry": "true",
+                "outSR": "4326",
+                "orderByFields": "OBJECTID ASC",
+                "f": "json",
+            },
+            page_size=page_size,
+        )
+        for feat in features:
+            attrs = feat.get("attributes", {}) or {}
+            geometry = feat.get("geometry", {}) or {}
+            name = str(attrs.get("PORT_NM", "")).strip()
+            if not name:
+                continue
+            try:
+                lon = float(geometry.get("x"))
+                lat = float(geometry.get("y"))
+            except (TypeError, ValueError):
+                continue
+            rows.append(
+                {
+                    "port_name": name,
+                    "port_type": str(attrs.get("PORT_TYPE", "")).strip(),
+                    "port_code": str(attrs.get("OBJECTID", "")).strip(),
+                    "lon": lon,
+                    "lat": lat,
+                }
             )
-            features = payload.get("features", [])
-            if not features:
-                break
-            for feat in features:
-                attrs = feat.get("attributes", {}) or {}
-                geometry = feat.get("geometry", {}) or {}
-                name = str(attrs.get("PORT_NM", "")).strip()
-                if not name:
-                    continue
-                try:
-                    lon = float(geometry.get("x"))
-                    lat = float(geometry.get("y"))
-                except (TypeError, ValueError):
-                    continue
-                rows.append(
-                    {
-                        "port_name": name,
-                        "port_type": str(attrs.get("PORT_TYPE", "")).strip(),
-                        "port_code": str(attrs.get("OBJECTID", "")).strip(),
-                        "lon": lon,
-                        "lat": lat,
-                    }
-                )
-            if len(features) < page_size:
-                break
-            offset += len(features)
     except Exception:
         return pd.DataFrame(columns=cols)
     if not rows:
@@ -7348,7 +7625,7 @@ def build_tfl_school_district_matches(tfl_client_names: tuple[str, ...]) -> pd.D
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    districts = fetch_tea_school_district_centroids()
+    districts = subdivision_layer("school_district")
     if districts.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7429,7 +7706,7 @@ def build_tfl_county_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    counties = fetch_tea_county_centroids()
+    counties = subdivision_layer("county")
     if counties.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7497,7 +7774,7 @@ def build_tfl_city_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    cities = fetch_texas_city_centroids()
+    cities = subdivision_layer("city")
     if cities.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7571,7 +7848,7 @@ def build_tfl_transit_authority_matches(tfl_client_names: tuple[str, ...]) -> pd
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    providers = fetch_nctcog_transit_provider_centroids()
+    providers = subdivision_layer("transit_provider")
     if providers.empty:
         return pd.DataFrame(columns=cols)
     return _build_layer_subdivision_matches(
@@ -7608,7 +7885,7 @@ def build_tfl_port_authority_matches(tfl_client_names: tuple[str, ...]) -> pd.Da
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    ports = fetch_txdot_seaport_centroids()
+    ports = subdivision_layer("seaport")
     if ports.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7669,8 +7946,8 @@ def build_tfl_name_anchored_special_matches(tfl_client_names: tuple[str, ...]) -
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
 
-    counties = fetch_tea_county_centroids()
-    cities = fetch_texas_city_centroids()
+    counties = subdivision_layer("county")
+    cities = subdivision_layer("city")
     if counties.empty and cities.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7795,7 +8072,7 @@ def build_tfl_water_district_type_matches(tfl_client_names: tuple[str, ...]) ->
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
-    water = fetch_tceq_water_district_centroids()
+    water = subdivision_layer("water_district")
     if water.empty:
         return pd.DataFrame(columns=cols)
 
@@ -7830,7 +8107,7 @@ def build_tfl_water_district_type_matches(tfl_client_names: tuple[str, ...]) ->
 
 @st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
 def build_tfl_groundwater_district_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
-    districts = fetch_tceq_groundwater_district_centroids()
+    districts = subdivision_layer("groundwater_district")
     if districts.empty:
         return pd.DataFrame(
             columns=[
@@ -7861,7 +8138,7 @@ def build_tfl_groundwater_district_matches(tfl_client_names: tuple[str, ...]) ->
 
 @st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
 def build_tfl_regional_mobility_authority_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
-    districts = fetch_texas_rma_centroids()
+    districts = subdivision_layer("rma")
     if districts.empty:
         return pd.DataFrame(
             columns=[
@@ -7894,7 +8171,7 @@ def build_tfl_regional_mobility_authority_matches(tfl_client_names: tuple[str, .
 
 @st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
 def build_tfl_junior_college_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
-    districts = fetch_texas_junior_college_centroids()
+    districts = subdivision_layer("junior_college")
     if districts.empty:
         return pd.DataFrame(
             columns=[
@@ -7928,7 +8205,7 @@ def build_tfl_junior_college_matches(tfl_client_names: tuple[str, ...]) -> pd.Da
 
 @st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
 def build_tfl_navigation_district_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
-    districts = fetch_texas_navigation_district_centroids()
+    districts = subdivision_layer("navigation_district")
     if districts.empty:
         return pd.DataFrame(
             columns=[
@@ -8037,6 +8314,407 @@ def _merge_subdivision_match_rows(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=cols)
     return pd.DataFrame(out_rows, columns=cols).sort_values(["subdivision_type", "match_count", "subdivision_name"], ascending=[True, False, True])
 
+SUBDIVISION_LAYER_FETCHERS = (
+    ("school_district", fetch_tea_school_district_centroids, TEA_ARCGIS_SCHOOL_DISTRICT_LAYER_URL),
+    ("county", fetch_tea_county_centroids, TEA_ARCGIS_COUNTY_LAYER_URL),
+    ("city", fetch_texas_city_centroids, CENSUS_ARCGIS_TEXAS_CITY_LAYER_URL),
+    ("water_district", fetch_tceq_water_district_centroids, TCEQ_WATER_DISTRICTS_LAYER_URL),
+    ("groundwater_district", fetch_tceq_groundwater_district_centroids, TCEQ_GROUNDWATER_DISTRICTS_LAYER_URL),
+    ("rma", fetch_texas_rma_centroids, TEXAS_RMA_LAYER_URL),
+    ("junior_college", fetch_texas_junior_college_centroids, TEXAS_JUNIOR_COLLEGE_LAYER_URL),
+    ("navigation_district", fetch_texas_navigation_district_centroids, TEXAS_NAVIGATION_DISTRICT_LAYER_URL),
+    ("transit_provider", fetch_nctcog_transit_provider_centroids, NCTCOG_TRANSIT_PROVIDERS_LAYER_URL),
+    ("seaport", fetch_txdot_seaport_centroids, TXDOT_SEAPORTS_LAYER_URL),
+)
+# Boundary geometry for local point-in-polygon lookups (address overlap and
+# entity counties). "fields" match the per-point queries these replace; the
+# seaport layer is points matched within a radius, as its query used.
+BOUNDARY_LAYER_SPECS = {
+    "school_district_boundaries": {
+        "url": TEA_ARCGIS_SCHOOL_DISTRICT_LAYER_URL,
+        "fields": "NAME,NAME20,DISTRICT,DISTRICT_C",
+        "order_by": "FID ASC",
+    },
+    "county_boundaries": {"url": TEA_ARCGIS_COUNTY_LAYER_URL, "fields": "FENAME,FIPS"},
+    "city_boundaries": {
+        "url": CENSUS_ARCGIS_TEXAS_CITY_LAYER_URL,
+        "fields": "NAME,BASENAME,GEOID",
+        "where": "STATE='48'",
+        "page_size": 250,
+    },
+    "water_district_boundaries": {"url": TCEQ_WATER_DISTRICTS_LAYER_URL, "fields": "NAME,DISTRICT_ID,TYPE,TYPE_DESCRIPTION"},
+    "groundwater_district_boundaries": {"url": TCEQ_GROUNDWATER_DISTRICTS_LAYER_URL, "fields": "DISTNAME,DIST_NUM,SHORTNAM"},
+    "rma_boundaries": {"url": TEXAS_RMA_LAYER_URL, "fields": "OBJECTID,RMA,Label"},
+    "junior_college_boundaries": {"url": TEXAS_JUNIOR_COLLEGE_LAYER_URL, "fields": "DISTRICT,NAME1,NAME2"},
+    "navigation_district_boundaries": {"url": TEXAS_NAVIGATION_DISTRICT_LAYER_URL, "fields": "OBJECTID,DISTRICT_N"},
+    "transit_provider_boundaries": {"url": NCTCOG_TRANSIT_PROVIDERS_LAYER_URL, "fields": "OBJECTID,Name,Classification"},
+    "seaport_points": {"url": TXDOT_SEAPORTS_LAYER_URL, "fields": "OBJECTID,PORT_NM", "within_miles": 25.0},
+}
+_BOUNDARY_GRID_DEG = 0.25
+_EARTH_RADIUS_MILES = 3958.8
+
+def fetch_boundary_rings(spec: dict) -> pd.DataFrame:
+    """One row per polygon ring (or point): the layer's attributes, "feature", "xs", "ys".
+
+    Attribute values are kept as strings (None stays None) so row builders see
+    what the per-point JSON queries returned.
+    """
+    fields = [f.strip() for f in spec["fields"].split(",") if f.strip()]
+    cols = fields + ["feature", "xs", "ys"]
+    rows: list[dict] = []
+    try:
+        features = _arcgis_query_features(
+            spec["url"],
+            params={
+                "where": spec.get("where", "1=1"),
+                "outFields": spec["fields"],
+                "returnGeometry": "true",
+                "geometryPrecision": 6,
+                "outSR": "4326",
+                "orderByFields": spec.get("order_by", "OBJECTID ASC"),
+                "f": "json",
+            },
+            page_size=int(spec.get("page_size", 500)),
+        )
+        for idx, feat in enumerate(features):
+            attrs = feat.get("attributes", {}) or {}
+            geometry = feat.get("geometry", {}) or {}
+            base = {f: (None if attrs.get(f) is None else str(attrs.get(f))) for f in fields}
+            if "rings" in geometry:
+                parts = [ring for ring in geometry.get("rings", []) or [] if len(ring) >= 3]
+            elif "x" in geometry and "y" in geometry:
+                parts = [[[geometry["x"], geometry["y"]]]]
+            else:
+                parts = []
+            for ring in parts:
+                rows.append(
+                    {
+                        **base,
+                        "feature": idx,
+                        "xs": [float(pt[0]) for pt in ring],
+                        "ys": [float(pt[1]) for pt in ring],
+                    }
+                )
+    except Exception:
+        return pd.DataFrame(columns=cols)
+    if not rows:
+        return pd.DataFrame(columns=cols)
+    return pd.DataFrame(rows, columns=cols)
+
+# Every layer the store manages: name -> (network fetcher, source URL).
+_SUBDIVISION_LAYERS = {
+    **{name: (fetch, url) for name, fetch, url in SUBDIVISION_LAYER_FETCHERS},
+    **{
+        name: (lambda spec=spec: fetch_boundary_rings(spec), spec["url"])
+        for name, spec in BOUNDARY_LAYER_SPECS.items()
+    },
+}
+
+# ---------------------------------------------------------
+# Boundary layer store: centroid frames persisted as parquet next to a JSON
+# sidecar (fetched-at, row count, source URL). Reads are served from disk;
+# a stale layer is still served while a background refresh replaces it, so
+# the network is only needed for refreshes and the map page works offline.
+# Bump _LAYER_STORE_VERSION whenever a fetcher's output columns change.
+# ---------------------------------------------------------
+_LAYER_STORE_VERSION = 1
+LAYER_STORE_DIR = os.environ.get("LAYER_STORE_DIR", str(Path(__file__).resolve().parent / ".cache" / "layers"))
+LAYER_STORE_MAX_AGE_HOURS = float(os.environ.get("LAYER_STORE_MAX_AGE_HOURS", "168") or 168)
+# Failed background refreshes (e.g. while offline) are not retried sooner than this.
+_LAYER_REFRESH_RETRY_SECS = 600
+
+def _layer_store_root() -> Path | None:
+    root = str(LAYER_STORE_DIR or "").strip()
+    if not root or root.lower() in {"0", "off", "none", "false"}:
+        return None
+    return Path(root)
+
+def _layer_store_meta(name: str) -> dict | None:
+    root = _layer_store_root()
+    if root is None:
+        return None
+    try:
+        meta = json.loads((root / f"{name}.json").read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if meta.get("version") != _LAYER_STORE_VERSION or not (root / f"{name}.parquet").exists():
+        return None
+    return meta
+
+def _layer_is_stale(name: str, meta: dict) -> bool:
+    if meta.get("source_url") != _SUBDIVISION_LAYERS[name][1]:
+        return True
+    age = time.time() - float(meta.get("fetched_at_ts", 0.0) or 0.0)
+    return age > LAYER_STORE_MAX_AGE_HOURS * 3600
+
+def _fetch_and_store_layer(name: str) -> tuple[pd.DataFrame, dict | None]:
+    """Fetch one layer over the network and persist it.
+
+    An empty result (the fetchers return one on any error) never replaces
+    the stored copy. Writes are best effort, like the derived-data cache.
+    """
+    fetch, url = _SUBDIVISION_LAYERS[name]
+    frame = fetch()
+    root = _layer_store_root()
+    if root is None or frame.empty:
+        return frame, None
+    fetched = time.time()
+    meta = {
+        "version": _LAYER_STORE_VERSION,
+        "layer": name,
+        "source_url": url,
+        "fetched_at": datetime.fromtimestamp(fetched).isoformat(timespec="seconds"),
+        "fetched_at_ts": fetched,
+        "rows": int(len(frame)),
+    }
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        for suffix, write in (
+            (".parquet", lambda tmp: frame.to_parquet(tmp, index=False)),
+            (".json", lambda tmp: tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")),
+        ):
+            target = root / f"{name}{suffix}"
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                write(tmp)
+                os.replace(tmp, target)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+    except Exception:
+        return frame, None
+    return frame, meta
+
+@st.cache_data(show_spinner=False, ttl=43200, max_entries=32)
+def _load_subdivision_layer(name: str, stamp: str) -> pd.DataFrame:
+    # stamp is part of the cache key: a refreshed or edited store file is a new entry.
+    if stamp:
+        try:
+            return pd.read_parquet(_layer_store_root() / f"{name}.parquet")
+        except Exception:
+            pass
+    frame, _ = _fetch_and_store_layer(name)
+    return frame
+
+@st.cache_resource(show_spinner=False)
+def _layer_refresh_registry() -> dict:
+    return {"lock": threading.Lock(), "running": set(), "attempted": {}}
+
+def _refresh_layer_in_background(name: str) -> None:
+    reg = _layer_refresh_registry()
+    with reg["lock"]:
+        if name in reg["running"] or time.time() - reg["attempted"].get(name, 0.0) < _LAYER_REFRESH_RETRY_SECS:
+            return
+        reg["running"].add(name)
+        reg["attempted"][name] = time.time()
+
+    def work():
+        try:
+            _fetch_and_store_layer(name)
+        except Exception:
+            pass
+        finally:
+            with reg["lock"]:
+                reg["running"].discard(name)
+
+    threading.Thread(target=work, name=f"layer-refresh-{name}", daemon=True).start()
+
+def _layer_store_stamp(name: str) -> str:
+    """Content stamp of the stored layer ("" when absent); schedules a refresh when stale.
+
+    Fetched-at plus the parquet file's size and mtime, so a store file replaced or
+    edited in place is re-read even when it keeps its row count.
+    """
+    meta = _layer_store_meta(name)
+    if meta is None:
+        return ""
+    try:
+        st_info = (_layer_store_root() / f"{name}.parquet").stat()
+    except OSError:
+        return ""
+    if _layer_is_stale(name, meta):
+        _refresh_layer_in_background(name)
+    return f"{float(meta['fetched_at_ts'])}|{st_info.st_size}|{st_info.st_mtime_ns}"
+
+def subdivision_layer(name: str) -> pd.DataFrame:
+    """Centroid frame for one boundary layer, served from the local store when present."""
+    return _load_subdivision_layer(name, _layer_store_stamp(name))
+
+@st.cache_resource(show_spinner=False, ttl=43200, max_entries=32)
+def _build_boundary_index(name: str, stamp: str) -> dict | None:
+    rings = _load_subdivision_layer(name, stamp)
+    if rings.empty:
+        return None
+    spec = BOUNDARY_LAYER_SPECS[name]
+    fields = [f.strip() for f in spec["fields"].split(",") if f.strip()]
+    features: list[dict] = []
+    feature_rings: list[list[tuple[np.ndarray, np.ndarray]]] = []
+    for _, grp in rings.groupby("feature", sort=True):
+        first = grp.iloc[0]
+        features.append({f: first[f] for f in fields})
+        feature_rings.append(
+            [(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)) for xs, ys in zip(grp["xs"], grp["ys"])]
+        )
+    bbox = np.array(
+        [
+            [
+                min(xs.min() for xs, _ in parts),
+                min(ys.min() for _, ys in parts),
+                max(xs.max() for xs, _ in parts),
+                max(ys.max() for _, ys in parts),
+            ]
+            for parts in feature_rings
+        ],
+        dtype=float,
+    )
+    grid: dict[tuple[int, int], list[int]] = {}
+    if not spec.get("within_miles"):
+        cells = np.floor(bbox / _BOUNDARY_GRID_DEG).astype(int)
+        for i, (x0, y0, x1, y1) in enumerate(cells):
+            for gx in range(x0, x1 + 1):
+                for gy in range(y0, y1 + 1):
+                    grid.setdefault((gx, gy), []).append(i)
+    return {
+        "features": features,
+        "rings": feature_rings,
+        "bbox": bbox,
+        "grid": {k: np.array(v, dtype=int) for k, v in grid.items()},
+        "within_miles": float(spec.get("within_miles") or 0.0),
+    }
+
+def boundary_index(name: str) -> dict | None:
+    """Grid-indexed boundary geometry for one layer, or None when it is unavailable."""
+    return _build_boundary_index(name, _layer_store_stamp(name))
+
+def _point_in_rings(x: float, y: float, parts: list[tuple[np.ndarray, np.ndarray]]) -> bool:
+    # Even-odd ray casting over every ring, so holes and multipart polygons need no special casing.
+    inside = False
+    for xs, ys in parts:
+        xn = np.roll(xs, -1)
+        yn = np.roll(ys, -1)
+        crosses = (ys > y) != (yn > y)
+        if not crosses.any():
+            continue
+        xs_c, ys_c, xn_c, yn_c = xs[crosses], ys[crosses], xn[crosses], yn[crosses]
+        x_at = xs_c + (y - ys_c) * (xn_c - xs_c) / (yn_c - ys_c)
+        if int(np.count_nonzero(x < x_at)) % 2:
+            inside = not inside
+    return inside
+
+def boundary_features_at_point(name: str, lon: float, lat: float) -> list[dict] | None:
+    """Attributes of the layer features containing (lon, lat); None when the layer is unavailable."""
+    idx = boundary_index(name)
+    if idx is None:
+        return None
+    if idx["within_miles"]:
+        pts = idx["bbox"][:, :2]
+        lon1, lat1, lon2, lat2 = map(np.radians, (lon, lat, pts[:, 0], pts[:, 1]))
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        miles = 2 * _EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
+        hits = np.flatnonzero(miles <= idx["within_miles"])
+        return [idx["features"][i] for i in hits[np.argsort(miles[hits], kind="stable")]]
+    cell = (int(np.floor(lon / _BOUNDARY_GRID_DEG)), int(np.floor(lat / _BOUNDARY_GRID_DEG)))
+    out = []
+    for i in idx["grid"].get(cell, ()):
+        x0, y0, x1, y1 = idx["bbox"][i]
+        if x0 <= lon <= x1 and y0 <= lat <= y1 and _point_in_rings(lon, lat, idx["rings"][i]):
+            out.append(idx["features"][i])
+    return out
+
+def _point_layer_features(name: str, lon: float, lat: float) -> list[dict]:
+    """Attributes of one boundary layer's features at a point.
+
+    Answered from the local boundary index; the per-point ArcGIS query is only
+    used while the layer has never been stored and cannot be downloaded.
+    """
+    hits = boundary_features_at_point(name, lon, lat)
+    if hits is not None:
+        return hits
+    spec = BOUNDARY_LAYER_SPECS[name]
+    params = {
+        "geometry": f"{lon},{lat}",
+        "geometryType": "esriGeometryPoint",
+        "inSR": "4326",
+        "spatialRel": "esriSpatialRelIntersects",
+        "outFields": spec["fields"],
+        "returnGeometry": "false",
+        "f": "json",
+    }
+    if spec.get("where"):
+        params["where"] = spec["where"]
+    if spec.get("within_miles"):
+        params["distance"] = int(spec["within_miles"])
+        params["units"] = "esriSRUnit_StatuteMile"
+    payload = _arcgis_get_json(f"{spec['url']}/query", params=params)
+    return [feat.get("attributes", {}) or {} for feat in payload.get("features", [])]
+
+def refresh_subdivision_layers(names: list[str] | None = None) -> pd.DataFrame:
+    """Refetch boundary layers into the store now (concurrently) and report the outcome."""
+    names = list(names or _SUBDIVISION_LAYERS)
+    workers = min(ARCGIS_LAYER_WORKERS, max(1, len(names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="layer-refresh") as pool:
+        futures = {name: pool.submit(_fetch_and_store_layer, name) for name in names}
+    rows = []
+    for name, fut in futures.items():
+        try:
+            frame, meta = fut.result()
+        except Exception:
+            frame, meta = pd.DataFrame(), None
+        if meta is not None:
+            status = "Refreshed"
+        elif frame.empty:
+            status = "Fetch failed (kept stored copy)"
+        else:
+            status = "Fetched (store disabled)"
+        rows.append({"Layer": name, "Rows": int(len(frame)), "Status": status})
+    return pd.DataFrame(rows, columns=["Layer", "Rows", "Status"])
+
+def subdivision_layer_store_table() -> pd.DataFrame:
+    cols = ["Layer", "Rows", "Fetched at", "Status"]
+    if _layer_store_root() is None:
+        return pd.DataFrame(columns=cols)
+    running = _layer_refresh_registry()["running"]
+    rows = []
+    for name in _SUBDIVISION_LAYERS:
+        meta = _layer_store_meta(name)
+        if meta is None:
+            status = "Missing"
+        elif name in running:
+            status = "Refreshing"
+        elif _layer_is_stale(name, meta):
+            status = "Stale"
+        else:
+            status = "Fresh"
+        rows.append(
+            {
+                "Layer": name,
+                "Rows": int(meta.get("rows", 0)) if meta else 0,
+                "Fetched at": str(meta.get("fetched_at", "")) if meta else "",
+                "Status": status,
+            }
+        )
+    return pd.DataFrame(rows, columns=cols)
+
+def prefetch_subdivision_layers(names: list[str] | None = None, loader=None) -> dict:
+    """Warm layers concurrently (centroids by default) before they are used.
+
+    Each layer is loaded on its own worker, so one slow or failing service
+    only costs its own frame; failures come back empty as they do serially.
+    """
+    names = list(names or [name for name, _, _ in SUBDIVISION_LAYER_FETCHERS])
+    run = _script_ctx_runner(loader or subdivision_layer)
+
+    out: dict[str, pd.DataFrame] = {}
+    workers = min(ARCGIS_LAYER_WORKERS, max(1, len(names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arcgis-layer") as pool:
+        futures = {name: pool.submit(run, name) for name in names}
+        for name, fut in futures.items():
+            try:
+                out[name] = fut.result()
+            except Exception:
+                out[name] = pd.DataFrame()
+    return out
+
 @st.cache_data(show_spinner=False, ttl=3600, max_entries=8)
 def build_tfl_political_subdivision_matches(tfl_client_names: tuple[str, ...]) -> pd.DataFrame:
     cols = [
@@ -8053,6 +8731,7 @@ def build_tfl_political_subdivision_matches(tfl_client_names: tuple[str, ...]) -
     ]
     if not tfl_client_names:
         return pd.DataFrame(columns=cols)
+    prefetch_subdivision_layers()
     parts = [
         build_tfl_school_district_matches(tfl_client_names).rename(
             columns={"district_name": "subdivision_name", "district_code": "subdivision_code"}
@@ -8161,22 +8840,10 @@ def geocode_texas_entity_arcgis(entity_name: str) -> dict:
 @st.cache_data(show_spinner=False, ttl=604800, max_entries=8192)
 def query_texas_county_for_point(lon: float, lat: float) -> dict:
     try:
-        payload = _arcgis_get_json(
-            f"{TEA_ARCGIS_COUNTY_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "FENAME,FIPS",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        features = payload.get("features", [])
+        features = _point_layer_features("county_boundaries", lon, lat)
         if not features:
             return {}
-        attrs = features[0].get("attributes", {}) or {}
+        attrs = features[0]
         county_name = str(attrs.get("FENAME", "")).strip()
         fips = str(attrs.get("FIPS", "")).strip()
         return {"county_name": county_name, "county_fips": fips}
@@ -8187,21 +8854,9 @@ def query_texas_county_for_point(lon: float, lat: float) -> dict:
 def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
     cols = ["subdivision_type", "subdivision_name", "subdivision_code", "source_name", "source_url"]
     rows: list[dict] = []
+    prefetch_subdivision_layers(list(BOUNDARY_LAYER_SPECS), loader=boundary_index)
     try:
-        district_payload = _arcgis_get_json(
-            f"{TEA_ARCGIS_SCHOOL_DISTRICT_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "NAME,NAME20,DISTRICT,DISTRICT_C",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in district_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("school_district_boundaries", lon, lat):
             name = str(attrs.get("NAME20", "")).strip() or str(attrs.get("NAME", "")).strip()
             code = str(attrs.get("DISTRICT", "")).strip() or str(attrs.get("DISTRICT_C", "")).strip()
             if name:
@@ -8218,20 +8873,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        county_payload = _arcgis_get_json(
-            f"{TEA_ARCGIS_COUNTY_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "FENAME,FIPS",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in county_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("county_boundaries", lon, lat):
             county_name = str(attrs.get("FENAME", "")).strip()
             if county_name:
                 rows.append(
@@ -8247,21 +8889,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        city_payload = _arcgis_get_json(
-            f"{CENSUS_ARCGIS_TEXAS_CITY_LAYER_URL}/query",
-            params={
-                "where": "STATE='48'",
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "NAME,BASENAME,GEOID",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in city_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("city_boundaries", lon, lat):
             name = str(attrs.get("NAME", "")).strip()
             base = str(attrs.get("BASENAME", "")).strip() or re.sub(
                 r"\s+(city|town|village)\s*$", "", name, flags=re.IGNORECASE
@@ -8283,20 +8911,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        water_payload = _arcgis_get_json(
-            f"{TCEQ_WATER_DISTRICTS_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "NAME,DISTRICT_ID,TYPE,TYPE_DESCRIPTION",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in water_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("water_district_boundaries", lon, lat):
             mapped_type = _canonical_water_district_type(str(attrs.get("TYPE_DESCRIPTION", "")).strip())
             if mapped_type == "Navigation District":
                 # Use the dedicated statewide navigation-district layer for this type.
@@ -8318,20 +8933,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        groundwater_payload = _arcgis_get_json(
-            f"{TCEQ_GROUNDWATER_DISTRICTS_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "DISTNAME,DIST_NUM,SHORTNAM",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in groundwater_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("groundwater_district_boundaries", lon, lat):
             name = str(attrs.get("DISTNAME", "")).strip() or str(attrs.get("SHORTNAM", "")).strip()
             if name:
                 rows.append(
@@ -8347,20 +8949,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        rma_payload = _arcgis_get_json(
-            f"{TEXAS_RMA_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "OBJECTID,RMA,Label",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in rma_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("rma_boundaries", lon, lat):
             name = str(attrs.get("Label", "")).strip() or str(attrs.get("RMA", "")).strip()
             if name:
                 rows.append(
@@ -8376,20 +8965,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        jc_payload = _arcgis_get_json(
-            f"{TEXAS_JUNIOR_COLLEGE_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "DISTRICT,NAME1,NAME2",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in jc_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("junior_college_boundaries", lon, lat):
             name = str(attrs.get("NAME1", "")).strip() or str(attrs.get("NAME2", "")).strip()
             if name:
                 rows.append(
@@ -8405,20 +8981,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        nav_payload = _arcgis_get_json(
-            f"{TEXAS_NAVIGATION_DISTRICT_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "OBJECTID,DISTRICT_N",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in nav_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("navigation_district_boundaries", lon, lat):
             name = str(attrs.get("DISTRICT_N", "")).strip()
             if name:
                 rows.append(
@@ -8434,20 +8997,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        transit_payload = _arcgis_get_json(
-            f"{NCTCOG_TRANSIT_PROVIDERS_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "outFields": "OBJECTID,Name,Classification",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in transit_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("transit_provider_boundaries", lon, lat):
             name = str(attrs.get("Name", "")).strip()
             if name:
                 rows.append(
@@ -8463,22 +9013,7 @@ def query_texas_subdivisions_for_point(lon: float, lat: float) -> pd.DataFrame:
         pass
 
     try:
-        seaport_payload = _arcgis_get_json(
-            f"{TXDOT_SEAPORTS_LAYER_URL}/query",
-            params={
-                "geometry": f"{lon},{lat}",
-                "geometryType": "esriGeometryPoint",
-                "inSR": "4326",
-                "spatialRel": "esriSpatialRelIntersects",
-                "distance": 25,
-                "units": "esriSRUnit_StatuteMile",
-                "outFields": "OBJECTID,PORT_NM",
-                "returnGeometry": "false",
-                "f": "json",
-            },
-        )
-        for feat in seaport_payload.get("features", []):
-            attrs = feat.get("attributes", {}) or {}
+        for attrs in _point_layer_features("seaport_points", lon, lat):
             name = str(attrs.get("PORT_NM", "")).strip()
             if name:
                 rows.append(
@@ -8595,17 +9130,16 @@ def _pick_overlap_subdivision_matches(
 
         # Conservative fuzzy fallback for minor naming deltas between ArcGIS layers and matched records.
         if len(name_key) >= 6:
-            name_pool = pool[pool["_name_key"].astype(str) != ""].copy()
-            if not name_pool.empty:
-                name_pool["_name_score"] = name_pool["_name_key"].astype(str).map(
-                    lambda x: difflib.SequenceMatcher(None, name_key, str(x)).ratio()
-                )
-                name_pool = name_pool[name_pool["_name_score"] >= 0.90].copy()
-                if not name_pool.empty:
-                    best_score = float(name_pool["_name_score"].max())
-                    picked = name_pool[name_pool["_name_score"] >= max(0.90, best_score - 0.03)].copy()
-                    if not picked.empty:
-                        return picked.drop(columns=["_name_score"], errors="ignore"), "Spatial boundary (fuzzy)"
+            name_keys = pool["_name_key"].astype(str)
+            hits = fuzzy_scores(build_fuzzy_index(name_keys.unique()), name_key, FUZZY_OVERLAP_CUTOFF, query_first=True)
+            if hits:
+                scores = {v: sc for sc, v in hits}
+                name_pool = pool[name_keys.isin(scores)].copy()
+                name_pool["_name_score"] = name_pool["_name_key"].astype(str).map(scores)
+                best_score = float(name_pool["_name_score"].max())
+                picked = name_pool[name_pool["_name_score"] >= max(FUZZY_OVERLAP_CUTOFF, best_score - 0.03)].copy()
+                if not picked.empty:
+                    return picked.drop(columns=["_name_score"], errors="ignore"), "Spatial boundary (fuzzy)"
 
     return pd.DataFrame(), ""
 
@@ -8619,34 +9153,13 @@ def _match_confidence_from_method(match_method: str) -> str:
         return "Low"
     return "Unknown"
 
-def build_address_overlap_spending_rows(
-    overlap_subdivisions: pd.DataFrame,
-    subdivision_matches: pd.DataFrame,
-    tfl_spending: pd.DataFrame,
-) -> pd.DataFrame:
-    cols = [
-        "Subdivision Type",
-        "Subdivision",
-        "Code",
-        "Entity Type",
-        "TFL Entity",
-        "Match Method",
-        "Match Confidence",
-        "Map Source",
-        "Low",
-        "High",
-        "Mid",
-        "Lobbyists",
-    ]
-    if overlap_subdivisions.empty or subdivision_matches.empty or tfl_spending.empty:
-        return pd.DataFrame(columns=cols)
-
+def _overlap_spend_lookup(tfl_spending: pd.DataFrame) -> dict[str, dict]:
     spend = tfl_spending.copy()
     spend = ensure_cols(spend, {"Client": "", "Low": 0.0, "High": 0.0, "Lobbyists": 0})
     spend["Client"] = spend["Client"].fillna("").astype(str).str.strip()
     spend = spend[spend["Client"] != ""].copy()
     if spend.empty:
-        return pd.DataFrame(columns=cols)
+        return {}
     spend["Low"] = pd.to_numeric(spend["Low"], errors="coerce").fillna(0.0)
     spend["High"] = pd.to_numeric(spend["High"], errors="coerce").fillna(0.0)
     spend["Lobbyists"] = pd.to_numeric(spend["Lobbyists"], errors="coerce").fillna(0).astype(int)
@@ -8655,7 +9168,7 @@ def build_address_overlap_spending_rows(
         spend.groupby("Client", as_index=False)
         .agg(Low=("Low", "sum"), High=("High", "sum"), Lobbyists=("Lobbyists", "max"), EntityType=("EntityType", "first"))
     )
-    spend_lookup = {
+    return {
         str(r.Client): {
             "Low": float(r.Low),
             "High": float(r.High),
@@ -8665,17 +9178,90 @@ def build_address_overlap_spending_rows(
         for r in spend.itertuples(index=False)
     }
 
+# Requested entity types without statewide polygon layers; they are anchored by name/geocode.
+_OVERLAP_UNSUPPORTED_TYPES = {
+    "Hospital District",
+    "Emergency Services District",
+    "Local Government Corporation",
+    "Transit Authority",
+    "Port Authority",
+    "Housing Authority",
+    "Appraisal District",
+}
+
+def _overlap_entity_geo_context(spend_lookup: dict[str, dict]) -> dict[str, dict]:
+    out: dict[str, dict] = {}
+    for client, spend_vals in spend_lookup.items():
+        if str(spend_vals.get("EntityType", "")).strip() not in _OVERLAP_UNSUPPORTED_TYPES:
+            continue
+        geocoded = geocode_texas_entity_arcgis(client)
+        geocode_score = float(geocoded.get("score", 0.0)) if geocoded else 0.0
+        if not geocoded or geocode_score < 70:
+            continue
+        try:
+            geo_lon = float(geocoded.get("lon", 0.0))
+            geo_lat = float(geocoded.get("lat", 0.0))
+        except Exception:
+            geo_lon = 0.0
+            geo_lat = 0.0
+        county_info = query_texas_county_for_point(round(geo_lon, 6), round(geo_lat, 6))
+        out[client] = {
+            "county": str(county_info.get("county_name", "")).strip(),
+            "city": str(geocoded.get("city", "")).strip(),
+        }
+    return out
+
+def prepare_address_overlap_context(subdivision_matches: pd.DataFrame, tfl_spending: pd.DataFrame) -> dict:
+    """Address-independent inputs of build_address_overlap_spending_rows, built once per batch."""
+    spend_lookup = _overlap_spend_lookup(tfl_spending) if not tfl_spending.empty else {}
+    pools: dict[str, pd.DataFrame] = {}
+    if not subdivision_matches.empty:
+        types = subdivision_matches["subdivision_type"].astype(str)
+        for t in types.unique().tolist():
+            pools[t] = _prepare_subdivision_match_pool(subdivision_matches[types == t].copy(), t)
+    return {
+        "spend_lookup": spend_lookup,
+        "pools": pools,
+        "entity_geo": _overlap_entity_geo_context(spend_lookup),
+    }
+
+def build_address_overlap_spending_rows(
+    overlap_subdivisions: pd.DataFrame,
+    subdivision_matches: pd.DataFrame,
+    tfl_spending: pd.DataFrame,
+    context: dict | None = None,
+) -> pd.DataFrame:
+    cols = [
+        "Subdivision Type",
+        "Subdivision",
+        "Code",
+        "Entity Type",
+        "TFL Entity",
+        "Match Method",
+        "Match Confidence",
+        "Map Source",
+        "Low",
+        "High",
+        "Mid",
+        "Lobbyists",
+    ]
+    if overlap_subdivisions.empty or subdivision_matches.empty or tfl_spending.empty:
+        return pd.DataFrame(columns=cols)
+    if context is None:
+        context = prepare_address_overlap_context(subdivision_matches, tfl_spending)
+    spend_lookup = context["spend_lookup"]
+    if not spend_lookup:
+        return pd.DataFrame(columns=cols)
+    pools = context["pools"]
+    entity_geo = context["entity_geo"]
+
     rows: list[dict] = []
     existing_keys: set[tuple[str, str, str, str]] = set()
-    pool_cache: dict[str, pd.DataFrame] = {}
     for overlap in overlap_subdivisions.itertuples(index=False):
         t = str(overlap.subdivision_type).strip()
         n = str(overlap.subdivision_name).strip()
         c = str(overlap.subdivision_code).strip()
-        if t not in pool_cache:
-            base_pool = subdivision_matches[subdivision_matches["subdivision_type"].astype(str) == t].copy()
-            pool_cache[t] = _prepare_subdivision_match_pool(base_pool, t)
-        pool = pool_cache.get(t, pd.DataFrame())
+        pool = pools.get(t, pd.DataFrame())
         if pool.empty:
             continue
 
@@ -8719,15 +9305,6 @@ def build_address_overlap_spending_rows(
             existing_keys.add((t, n, c, client))
 
     # Fallback for requested entity types without statewide polygon layers.
-    unsupported_types = {
-        "Hospital District",
-        "Emergency Services District",
-        "Local Government Corporation",
-        "Transit Authority",
-        "Port Authority",
-        "Housing Authority",
-        "Appraisal District",
-    }
     county_lookup = {
         _county_root_key(str(r.subdivision_name)): (str(r.subdivision_name), str(r.subdivision_code))
         for r in overlap_subdivisions.itertuples(index=False)
@@ -8748,7 +9325,7 @@ def build_address_overlap_spending_rows(
 
     for client, spend_vals in spend_lookup.items():
         entity_type = str(spend_vals.get("EntityType", "")).strip()
-        if entity_type not in unsupported_types:
+        if entity_type not in _OVERLAP_UNSUPPORTED_TYPES:
             continue
         low = float(spend_vals.get("Low", 0.0))
         high = float(spend_vals.get("High", 0.0))
@@ -8776,24 +9353,15 @@ def build_address_overlap_spending_rows(
             n, c = school_lookup[school_key]
             matched_targets.append(("School District", n, c, "Name anchored", "Name anchored via overlapping core boundaries"))
 
-        geocoded = geocode_texas_entity_arcgis(client)
-        geocode_score = float(geocoded.get("score", 0.0)) if geocoded else 0.0
-        if geocoded and geocode_score >= 70:
-            try:
-                geo_lon = float(geocoded.get("lon", 0.0))
-                geo_lat = float(geocoded.get("lat", 0.0))
-            except Exception:
-                geo_lon = 0.0
-                geo_lat = 0.0
-
-            county_info = query_texas_county_for_point(round(geo_lon, 6), round(geo_lat, 6))
-            geo_county = str(county_info.get("county_name", "")).strip()
+        geo = entity_geo.get(client)
+        if geo:
+            geo_county = geo["county"]
             geo_county_key = _county_root_key(f"{geo_county} County") if geo_county else ""
             if geo_county_key and geo_county_key in county_lookup:
                 n, c = county_lookup[geo_county_key]
                 matched_targets.append(("County", n, c, "Name + geocode context", "ArcGIS geocoded entity centroid (Texas)"))
 
-            geo_city = str(geocoded.get("city", "")).strip()
+            geo_city = geo["city"]
             geo_city_key = _city_root_key(f"{geo_city} City") if geo_city else ""
             if geo_city_key and geo_city_key in city_lookup:
                 n, c = city_lookup[geo_city_key]
@@ -8842,6 +9410,180 @@ def build_address_overlap_spending_rows(
     out = out.drop(columns=["_method_order"], errors="ignore")
     return out
 
+OVERLAP_BATCH_WORKERS = max(1, int(os.environ.get("OVERLAP_BATCH_WORKERS", "8") or 8))
+OVERLAP_BATCH_MAX_ROWS = 5000
+_OVERLAP_BATCH_ADDRESS_COLS = ("address", "street address", "full address", "location", "input")
+_OVERLAP_BATCH_LAT_COLS = ("lat", "latitude")
+_OVERLAP_BATCH_LON_COLS = ("lon", "lng", "long", "longitude")
+
+def parse_overlap_batch_input(raw: pd.DataFrame) -> pd.DataFrame:
+    """Normalize an uploaded batch to Row / Input / Address / Latitude / Longitude.
+
+    Rows with usable coordinates skip geocoding; the rest are geocoded from the
+    address column. Raises ValueError when neither is present.
+    """
+    by_name = {str(c).strip().lower(): c for c in raw.columns}
+    addr_col = next((by_name[c] for c in _OVERLAP_BATCH_ADDRESS_COLS if c in by_name), None)
+    lat_col = next((by_name[c] for c in _OVERLAP_BATCH_LAT_COLS if c in by_name), None)
+    lon_col = next((by_name[c] for c in _OVERLAP_BATCH_LON_COLS if c in by_name), None)
+    if addr_col is None and (lat_col is None or lon_col is None):
+        raise ValueError("Expected an 'address' column or 'latitude' and 'longitude' columns.")
+    n = len(raw)
+    address = raw[addr_col].fillna("").astype(str).str.strip() if addr_col is not None else pd.Series([""] * n, index=raw.index)
+    lat = pd.to_numeric(raw[lat_col], errors="coerce") if lat_col is not None else pd.Series([np.nan] * n, index=raw.index)
+    lon = pd.to_numeric(raw[lon_col], errors="coerce") if lon_col is not None else pd.Series([np.nan] * n, index=raw.index)
+    has_coords = lat.notna() & lon.notna()
+    coord_text = lat.map(lambda v: f"{v:.6f}") + ", " + lon.map(lambda v: f"{v:.6f}")
+    out = pd.DataFrame(
+        {
+            "Row": np.arange(1, n + 1),
+            "Input": address.where(address != "", coord_text.where(has_coords, "")),
+            "Address": address,
+            "Latitude": lat,
+            "Longitude": lon,
+        }
+    )
+    out = out[(out["Address"] != "") | has_coords.to_numpy()].reset_index(drop=True)
+    return out.head(OVERLAP_BATCH_MAX_ROWS)
+
+def _overlap_batch_row(
+    item: dict,
+    subdivision_matches: pd.DataFrame,
+    tfl_spending: pd.DataFrame,
+    context: dict,
+) -> tuple[dict, pd.DataFrame]:
+    summary = {
+        "Row": int(item["Row"]),
+        "Input": item["Input"],
+        "Matched Location": "",
+        "Score": np.nan,
+        "Latitude": np.nan,
+        "Longitude": np.nan,
+        "Status": "",
+        "Subdivision Overlaps": 0,
+        "Overlap Rows": 0,
+        "Unique TFL Entities": 0,
+        "Combined Low": 0.0,
+        "Combined High": 0.0,
+    }
+    try:
+        if pd.notna(item["Latitude"]) and pd.notna(item["Longitude"]):
+            lat, lon = float(item["Latitude"]), float(item["Longitude"])
+            summary["Matched Location"] = f"Coordinates ({lat:.6f}, {lon:.6f})"
+            summary["Status"] = "OK"
+        else:
+            g = geocode_address_arcgis(item["Address"])
+            if not g:
+                summary["Status"] = "Not geocoded"
+                return summary, pd.DataFrame()
+            lat, lon = float(g.get("lat", 0.0)), float(g.get("lon", 0.0))
+            summary["Matched Location"] = str(g.get("matched_address", "")).strip() or item["Address"]
+            summary["Score"] = float(g.get("score", 0.0))
+            summary["Status"] = "OK" if summary["Score"] >= 80 else "Low confidence"
+        summary["Latitude"], summary["Longitude"] = lat, lon
+        overlap_sub = query_texas_subdivisions_for_point(round(lon, 6), round(lat, 6))
+        spend = build_address_overlap_spending_rows(
+            overlap_subdivisions=overlap_sub,
+            subdivision_matches=subdivision_matches,
+            tfl_spending=tfl_spending,
+            context=context,
+        )
+    except Exception as exc:
+        summary["Status"] = f"Error: {exc}"
+        return summary, pd.DataFrame()
+    summary["Subdivision Overlaps"] = int(overlap_sub.shape[0])
+    summary["Overlap Rows"] = int(spend.shape[0])
+    if not spend.empty:
+        summary["Unique TFL Entities"] = int(spend["TFL Entity"].nunique())
+        summary["Combined Low"] = float(spend["Low"].sum())
+        summary["Combined High"] = float(spend["High"].sum())
+        spend.insert(0, "Matched Location", summary["Matched Location"])
+        spend.insert(0, "Input", summary["Input"])
+        spend.insert(0, "Row", summary["Row"])
+    return summary, spend
+
+def run_address_overlap_batch(
+    items: pd.DataFrame,
+    subdivision_matches: pd.DataFrame,
+    tfl_spending: pd.DataFrame,
+    on_result=None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Geocode and overlap every batch row on a bounded pool.
+
+    The spend lookup, match pools and entity geocodes are prepared once and
+    shared by all rows. on_result(done, total, summaries) is called from the
+    calling thread as rows finish, so it may update Streamlit elements.
+    """
+    context = prepare_address_overlap_context(subdivision_matches, tfl_spending)
+    prefetch_subdivision_layers(list(BOUNDARY_LAYER_SPECS), loader=boundary_index)
+    run = _script_ctx_runner(_overlap_batch_row)
+    records = items.to_dict("records")
+    summaries: list[dict] = []
+    details: list[pd.DataFrame] = []
+    with ThreadPoolExecutor(max_workers=min(OVERLAP_BATCH_WORKERS, max(1, len(records))), thread_name_prefix="overlap-batch") as pool:
+        futures = [pool.submit(run, item, subdivision_matches, tfl_spending, context) for item in records]
+        for done, fut in enumerate(as_completed(futures), start=1):
+            summary, detail = fut.result()
+            summaries.append(summary)
+            if not detail.empty:
+                details.append(detail)
+            if on_result is not None:
+                on_result(done, len(records), summaries)
+    summary_df = pd.DataFrame(summaries)
+    if not summary_df.empty:
+        summary_df = summary_df.sort_values("Row").reset_index(drop=True)
+    detail_df = (
+        pd.concat(details, ignore_index=True).sort_values("Row", kind="stable").reset_index(drop=True)
+        if details
+        else pd.DataFrame()
+    )
+    return summary_df, detail_df
+
+def _render_address_overlap_batch(subdivision_matches: pd.DataFrame, tfl_spending: pd.DataFrame) -> None:
+    st.caption(
+        f"Upload a CSV with an address column, or latitude and longitude columns "
+        f"(up to {OVERLAP_BATCH_MAX_ROWS:,} rows)."
+    )
+    upload = st.file_uploader("Addresses CSV", type=["csv"], key="map_overlap_batch_file")
+    if upload is None:
+        return
+    try:
+        items = parse_overlap_batch_input(pd.read_csv(upload, dtype=str, keep_default_na=False))
+    except Exception as exc:
+        st.warning(f"Could not read that CSV: {exc}")
+        return
+    if items.empty:
+        st.warning("No rows with an address or coordinates were found.")
+        return
+    st.caption(f"{len(items):,} rows ready.")
+    if st.button("Run batch overlap", key="map_overlap_batch_run_btn"):
+        progress = st.progress(0.0, text="Starting batch...")
+        live = st.empty()
+
+        def on_result(done: int, total: int, summaries: list[dict]) -> None:
+            progress.progress(done / total, text=f"Analyzed {done:,} of {total:,} rows")
+            if done == total or done % 25 == 0:
+                live.dataframe(pd.DataFrame(summaries).sort_values("Row"), width="stretch", height=260, hide_index=True)
+
+        summary, detail = run_address_overlap_batch(items, subdivision_matches, tfl_spending, on_result=on_result)
+        progress.empty()
+        live.empty()
+        st.session_state.map_overlap_batch_result = {"name": upload.name, "summary": summary, "detail": detail}
+    result = st.session_state.get("map_overlap_batch_result")
+    if not isinstance(result, dict) or result.get("name") != upload.name:
+        return
+    summary = result["summary"]
+    detail = result["detail"]
+    ok = int((summary["Status"] == "OK").sum()) if not summary.empty else 0
+    st.caption(f"{ok:,} of {len(summary):,} rows matched with good confidence; {len(detail):,} overlap rows in total.")
+    disp = summary.copy()
+    for col in ["Combined Low", "Combined High"]:
+        disp[col] = disp[col].astype(float).apply(fmt_usd)
+    st.dataframe(disp, width="stretch", height=320, hide_index=True)
+    _ = export_dataframe(summary, "address_overlap_batch_summary.csv", label="Download batch overlap summary CSV")
+    if not detail.empty:
+        _ = export_dataframe(detail, "address_overlap_batch_entity_spending.csv", label="Download batch overlap entity spending CSV")
+
 def _subdivision_color_hex(subdivision_type: str) -> str:
     key = str(subdivision_type).strip()
     return SUBDIVISION_TYPE_COLORS.get(key, "#718191")
@@ -9686,25 +10428,29 @@ def match_entity_type(name: str) -> tuple[str, str]:
 
     return "Other", "Other"
 
-def filter_filer_rows(
-    df: pd.DataFrame,
-    session: str | None,
-    lobbyshort: str,
-    name_to_short: dict,
-    lobbyist_norms: set[str],
-    filerid_to_short: dict | None,
-    filer_ids: set[int] | tuple[int, ...] | None = None,
-    loose: bool = False,
-) -> pd.DataFrame:
-    if df.empty:
-        return df
+_LA_FILER_TABLES = ("LaFood", "LaEnt", "LaTran", "LaGift", "LaEvnt", "LaAwrd", "LaCvr", "LaDock", "LaI4E", "LaSub")
+_LA_ACTIVITY_TABLES = ("LaFood", "LaEnt", "LaTran", "LaGift", "LaEvnt", "LaAwrd")
+_FILER_NORM_COLS = ("FilerID", "FilerShortFromId", "FilerNormRaw", "FilerNormClean", "FilerSortNorm", "FilerShortMapped")
+_RECIPIENT_NORM_SOURCES = {
+    "RecipientOrgNorm": "recipientNameOrganization",
+    "RecipientLastNorm": "recipientNameLast",
+    "RecipientFirstNorm": "recipientNameFirst",
+}
 
-    d = df.copy()
-    if session is not None:
-        d = d[d["Session"].astype(str).str.strip() == str(session)].copy()
-    if d.empty:
-        return d
+def _filer_name_cols(d: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    filer_name = d.get("filerName", pd.Series([""] * len(d), index=d.index))
+    filer_sort = d.get("filerSort", pd.Series([""] * len(d), index=d.index))
+    if isinstance(filer_name, pd.DataFrame):
+        filer_name = filer_name.iloc[:, 0]
+    if isinstance(filer_sort, pd.DataFrame):
+        filer_sort = filer_sort.iloc[:, 0]
+    return filer_name, filer_sort
 
+def add_filer_norm_columns(df: pd.DataFrame, name_to_short: dict, filerid_to_short: dict | None) -> pd.DataFrame:
+    """Attach normalized filer-name / FilerID match columns (computed once at load)."""
+    if not isinstance(df, pd.DataFrame):
+        return df
+    d = df.copy()
     filerid_map = filerid_to_short or {}
     if "FilerID" in d.columns:
         d["FilerID"] = pd.to_numeric(d["FilerID"], errors="coerce").fillna(-1).astype(int)
@@ -9718,23 +10464,126 @@ def filter_filer_rows(
     else:
         d["FilerShortFromId"] = ""
 
-    filer_name = d.get("filerName", pd.Series([""] * len(d)))
-    filer_sort = d.get("filerSort", pd.Series([""] * len(d)))
-    if isinstance(filer_name, pd.DataFrame):
-        filer_name = filer_name.iloc[:, 0]
-    if isinstance(filer_sort, pd.DataFrame):
-        filer_sort = filer_sort.iloc[:, 0]
-    filer_clean = clean_filer_name_series(filer_name)
+    filer_name, filer_sort = _filer_name_cols(d)
     d["FilerNormRaw"] = norm_name_series(filer_name)
-    d["FilerNormClean"] = norm_name_series(filer_clean)
+    d["FilerNormClean"] = norm_name_series(clean_filer_name_series(filer_name))
     d["FilerSortNorm"] = norm_name_series(filer_sort)
 
-    mapped = d["FilerNormRaw"].map(name_to_short)
-    mapped = mapped.where(mapped.notna(), d["FilerNormClean"].map(name_to_short))
-    mapped = mapped.where(mapped.notna(), d["FilerSortNorm"].map(name_to_short))
+    name_map = name_to_short or {}
+    mapped = d["FilerNormRaw"].map(name_map)
+    mapped = mapped.where(mapped.notna(), d["FilerNormClean"].map(name_map))
+    mapped = mapped.where(mapped.notna(), d["FilerSortNorm"].map(name_map))
     d["FilerShortMapped"] = mapped
+    return d
+
+def _with_filer_norm_columns(d: pd.DataFrame, name_to_short: dict, filerid_to_short: dict | None) -> pd.DataFrame:
+    if all(c in d.columns for c in _FILER_NORM_COLS):
+        return d
+    return add_filer_norm_columns(d, name_to_short, filerid_to_short)
+
+def _positions_by_value(values: pd.Series) -> dict:
+    vals = values.reset_index(drop=True)
+    vals = vals[vals.notna()].astype(str)
+    vals = vals[vals.str.strip() != ""]
+    if vals.empty:
+        return {}
+    pos = vals.index.to_numpy(dtype="int64")
+    return {k: pos[ix] for k, ix in vals.groupby(vals.to_numpy(), sort=False).indices.items()}
+
+def build_filer_row_index(df: pd.DataFrame) -> dict:
+    """Inverted index from LobbyShort / FilerID / normalized filer name to row positions."""
+    if not isinstance(df, pd.DataFrame) or df.empty or not all(c in df.columns for c in _FILER_NORM_COLS):
+        return {}
+    fid = df["FilerID"].reset_index(drop=True)
+    return {
+        # Content token of the indexed table (its dataset token once loaded), so the
+        # index is never applied to an edited frame that happens to keep its row count.
+        "source": _frame_cache_token(df),
+        "short": [_positions_by_value(df["FilerShortFromId"]), _positions_by_value(df["FilerShortMapped"])],
+        "name": [_positions_by_value(df["FilerNormRaw"]), _positions_by_value(df["FilerNormClean"])],
+        "sort": _positions_by_value(df["FilerSortNorm"]),
+        "filer_id": {int(k): v for k, v in _positions_by_value(fid[fid >= 0]).items()},
+    }
+
+def _filer_index_candidates(
+    df: pd.DataFrame,
+    row_index: dict | None,
+    shorts: set[str],
+    short_norms: set[str],
+    lobbyist_norms: set[str],
+    filer_ids: set[int] | None = None,
+) -> pd.DataFrame | None:
+    """Rows that can satisfy an exact filer match, or None when the index does not apply to df."""
+    if not row_index or row_index.get("source") != _frame_cache_token(df):
+        return None
+    hits = []
+    for m in row_index.get("short", []):
+        hits.extend(m[k] for k in shorts if k in m)
+    for m in row_index.get("name", []):
+        hits.extend(m[k] for k in (short_norms | lobbyist_norms) if k in m)
+    sort_map = row_index.get("sort", {})
+    hits.extend(sort_map[k] for k in lobbyist_norms if k in sort_map)
+    fid_map = row_index.get("filer_id", {})
+    hits.extend(fid_map[k] for k in (filer_ids or ()) if k in fid_map)
+    if not hits:
+        return df.iloc[0:0]
+    return df.take(np.unique(np.concatenate(hits)))
+
+def _coerce_filer_ids(filer_ids) -> set[int]:
+    out = set()
+    for x in filer_ids or ():
+        try:
+            if pd.isna(x):
+                continue
+        except Exception:
+            pass
+        try:
+            out.add(int(x))
+        except Exception:
+            try:
+                out.add(int(float(x)))
+            except Exception:
+                continue
+    return out
+
+def _filter_session_rows(df: pd.DataFrame, session: str | None) -> pd.DataFrame:
+    if session is None:
+        return df.copy()
+    return session_rows(df, session).copy()
+
+def filter_filer_rows(
+    df: pd.DataFrame,
+    session: str | None,
+    lobbyshort: str,
+    name_to_short: dict,
+    lobbyist_norms: set[str],
+    filerid_to_short: dict | None,
+    filer_ids: set[int] | tuple[int, ...] | None = None,
+    loose: bool = False,
+    row_index: dict | None = None,
+) -> pd.DataFrame:
+    if df.empty:
+        return df
 
     lobbyshort_norm = norm_name(lobbyshort)
+    filer_ids_set = _coerce_filer_ids(filer_ids) if filer_ids else set()
+    # Narrow to indexed candidates first; the masks below still decide the exact match.
+    cand = _filer_index_candidates(
+        df, row_index, {str(lobbyshort)}, {lobbyshort_norm}, set(lobbyist_norms or ()), filer_ids_set
+    )
+    if cand is not None and (not cand.empty or not loose):
+        d = _filter_session_rows(cand, session)
+        if d.empty and loose:
+            d = _filter_session_rows(df, session)
+    else:
+        d = _filter_session_rows(df, session)
+    if d.empty:
+        return d
+
+    # Normalized filer columns are precomputed by load_workbook; only derive them for ad-hoc frames.
+    d = _with_filer_norm_columns(d, name_to_short, filerid_to_short)
+    filer_name, filer_sort = _filer_name_cols(d)
+
     d["FilerIsShort"] = (
         d["FilerNormClean"].eq(lobbyshort_norm) |
         d["FilerNormRaw"].eq(lobbyshort_norm)
@@ -9748,25 +10597,10 @@ def filter_filer_rows(
         (d["FilerSortNorm"].isin(lobbyist_norms) if lobbyist_norms else False) |
         (d["FilerIsShort"])
     )
-    if filer_ids:
-        filer_ids_set = set()
-        for x in filer_ids:
-            try:
-                if pd.isna(x):
-                    continue
-            except Exception:
-                pass
-            try:
-                filer_ids_set.add(int(x))
-            except Exception:
-                try:
-                    filer_ids_set.add(int(float(x)))
-                except Exception:
-                    continue
-        if filer_ids_set:
-            filer_match = d["FilerID"].isin(filer_ids_set)
-            if filer_match.any():
-                ok = filer_match
+    if filer_ids_set:
+        filer_match = d["FilerID"].isin(filer_ids_set)
+        if filer_match.any():
+            ok = filer_match
     if loose and not ok.any():
         loose_ok = pd.Series(False, index=d.index)
 
@@ -9810,6 +10644,7 @@ def filter_filer_rows_multi(
     lobbyist_norms: set[str],
     filerid_to_short: dict | None,
     loose: bool = False,
+    row_index: dict | None = None,
 ) -> pd.DataFrame:
     if df.empty or not lobbyshorts:
         return df.iloc[0:0].copy()
@@ -9818,38 +10653,18 @@ def filter_filer_rows_multi(
     if not lobbyshorts_set:
         return df.iloc[0:0].copy()
 
-    d = df.copy()
-    if session is not None:
-        d = d[d["Session"].astype(str).str.strip() == str(session)].copy()
-    if d.empty:
-        return d
-
     lobbyshort_norms = {norm_name(s) for s in lobbyshorts_set if s}
     norm_to_short = {norm_name(s): s for s in lobbyshorts_set if s}
-    filerid_map = filerid_to_short or {}
-
-    if "filerIdent" in d.columns and filerid_map:
-        d["FilerID"] = pd.to_numeric(d["filerIdent"], errors="coerce").fillna(-1).astype(int)
-        d["FilerShortFromId"] = d["FilerID"].map(filerid_map)
+    cand = _filer_index_candidates(df, row_index, lobbyshorts_set, lobbyshort_norms, set(lobbyist_norms or ()))
+    if cand is not None and (not cand.empty or not loose):
+        d = _filter_session_rows(cand, session)
+        if d.empty and loose:
+            d = _filter_session_rows(df, session)
     else:
-        d["FilerShortFromId"] = ""
-
-    filer_name = d.get("filerName", pd.Series([""] * len(d)))
-    filer_sort = d.get("filerSort", pd.Series([""] * len(d)))
-    if isinstance(filer_name, pd.DataFrame):
-        filer_name = filer_name.iloc[:, 0]
-    if isinstance(filer_sort, pd.DataFrame):
-        filer_sort = filer_sort.iloc[:, 0]
-    filer_clean = clean_filer_name_series(filer_name)
-
-    d["FilerNormRaw"] = norm_name_series(filer_name)
-    d["FilerNormClean"] = norm_name_series(filer_clean)
-    d["FilerSortNorm"] = norm_name_series(filer_sort)
-
-    mapped = d["FilerNormRaw"].map(name_to_short)
-    mapped = mapped.where(mapped.notna(), d["FilerNormClean"].map(name_to_short))
-    mapped = mapped.where(mapped.notna(), d["FilerSortNorm"].map(name_to_short))
-    d["FilerShortMapped"] = mapped
+        d = _filter_session_rows(df, session)
+    if d.empty:
+        return d
+    d = _with_filer_norm_columns(d, name_to_short, filerid_to_short)
 
     d["FilerIsShort"] = (
         d["FilerNormClean"].isin(lobbyshort_norms) |
@@ -9880,11 +10695,13 @@ def filter_filer_rows_multi(
     if d.empty:
         return d
 
-    matched = d["FilerShortFromId"].where(d["FilerShortFromId"].astype(str).isin(lobbyshorts_set), "")
-    mapped_short = d["FilerShortMapped"].where(d["FilerShortMapped"].astype(str).isin(lobbyshorts_set), "")
+    from_id = d["FilerShortFromId"].astype(object)
+    from_name = d["FilerShortMapped"].astype(object)
+    matched = from_id.where(from_id.astype(str).isin(lobbyshorts_set), "")
+    mapped_short = from_name.where(from_name.astype(str).isin(lobbyshorts_set), "")
     matched = matched.where(matched.astype(str).str.strip() != "", mapped_short)
-    norm_short = d["FilerNormClean"].map(norm_to_short)
-    norm_short = norm_short.where(norm_short.notna(), d["FilerNormRaw"].map(norm_to_short))
+    norm_short = d["FilerNormClean"].astype(object).map(norm_to_short)
+    norm_short = norm_short.where(norm_short.notna(), d["FilerNormRaw"].astype(object).map(norm_to_short))
     matched = matched.where(matched.astype(str).str.strip() != "", norm_short)
     d["MatchedLobbyShort"] = matched.fillna("")
     return d
@@ -9907,6 +10724,16 @@ def last_name_norm_series(s: pd.Series) -> pd.Series:
         s = s.iloc[:, 0] if s.shape[1] > 0 else pd.Series([], dtype="string")
     if not isinstance(s, pd.Series):
         s = pd.Series(s)
+    if _use_arrow_strings(s):
+        import pyarrow.compute as pc
+
+        arr = _arrow_strip(_arrow_text(s))
+        last = pc.if_else(
+            pc.match_substring(arr, ","),
+            pc.utf8_trim(pc.replace_substring_regex(arr, r"(?s),.*", ""), _PY_WHITESPACE),
+            pc.replace_substring_regex(arr, r"(?s)^.*" + _ARROW_SPACE, ""),
+        )
+        return _arrow_series(_arrow_norm_name(last), s)
     s = (
         s.fillna("")
          .astype("string")
@@ -9939,6 +10766,17 @@ def first_name_norm_series(s: pd.Series) -> pd.Series:
         s = s.iloc[:, 0] if s.shape[1] > 0 else pd.Series([], dtype="string")
     if not isinstance(s, pd.Series):
         s = pd.Series(s)
+    if _use_arrow_strings(s):
+        import pyarrow.compute as pc
+
+        arr = _arrow_strip(_arrow_text(s))
+        given = pc.if_else(
+            pc.match_substring(arr, ","),
+            pc.utf8_trim(pc.replace_substring_regex(arr, r"(?s)^[^,]*,", ""), _PY_WHITESPACE),
+            arr,
+        )
+        first = pc.replace_substring_regex(given, r"(?s)" + _ARROW_SPACE + ".*", "")
+        return _arrow_series(_arrow_norm_name(first), s)
     s = (
         s.fillna("")
          .astype("string")
@@ -10096,6 +10934,44 @@ def amount_display(exact, low, high, code=None) -> str:
         return str(code)
     return ""
 
+def _display_text(d: pd.DataFrame, col: str) -> tuple[pd.Series, pd.Series]:
+    """str() of each value in d[col] and whether the value is present (not NA)."""
+    if col not in d.columns:
+        return pd.Series("", index=d.index, dtype=object), pd.Series(False, index=d.index)
+    s = d[col]
+    return s.astype(str).where(s.notna(), ""), s.notna()
+
+def person_display_series(d: pd.DataFrame) -> pd.Series:
+    """person_display over the recipient name columns of every row of d."""
+    if "MemberDisplay" in d.columns:
+        return d["MemberDisplay"]
+    org = _display_text(d, "recipientNameOrganization")[0].str.strip()
+    last = _display_text(d, "recipientNameLast")[0].str.strip()
+    first = _display_text(d, "recipientNameFirst")[0].str.strip()
+    out = last.where(last.ne(""), first)
+    out = out.where(last.eq("") | first.eq(""), last + ", " + first)
+    return org.where(org.ne(""), out)
+
+def amount_display_series(d: pd.DataFrame) -> pd.Series:
+    """amount_display over the activity amount columns of every row of d."""
+    if "AmountDisplay" in d.columns:
+        return d["AmountDisplay"]
+    parts = {}
+    for key, col in (("exact", "activityExactAmount"), ("low", "activityAmountRangeLow"),
+                     ("high", "activityAmountRangeHigh"), ("code", "activityAmountCd")):
+        text, present = _display_text(d, col)
+        parts[key] = (text, present & text.str.strip().ne(""))
+    (exact, has_exact), (low, has_low), (high, has_high), (code, has_code) = parts.values()
+    out = code.where(has_code, "")
+    out = low.where(~has_high, low + "--" + high).where(has_low, out)
+    return exact.where(has_exact, out)
+
+def add_activity_display_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Precompute the Member and Amount display text the activity builders select."""
+    if df.empty:
+        return df
+    return df.assign(MemberDisplay=person_display_series(df), AmountDisplay=amount_display_series(df))
+
 def ensure_cols(df: pd.DataFrame, cols_with_defaults: dict) -> pd.DataFrame:
     out = df.copy()
     for c, default in cols_with_defaults.items():
@@ -10468,10 +11344,16 @@ def _pdf_safe_text(text: str) -> str:
     return str(text).encode("latin-1", "replace").decode("latin-1")
 
 PDF_CHART_ERROR_KEY = "pdf_chart_error"
+# Background report jobs collect chart errors here instead of a session's state.
+_PDF_CHART_ERROR_SINK = threading.local()
 
 def _record_pdf_chart_error(message: str) -> None:
     if not message:
         return
+    sink = getattr(_PDF_CHART_ERROR_SINK, "errors", None)
+    if sink is not None:
+        sink.append(message)
+        return
     if PDF_CHART_ERROR_KEY not in st.session_state:
         st.session_state[PDF_CHART_ERROR_KEY] = message
 
@@ -10488,11 +11370,6 @@ def _configure_kaleido_scope() -> bool:
     if scope is None:
         _record_pdf_chart_error("Kaleido scope unavailable. Install the kaleido package.")
         return False
-    try:
-        scope.mathjax = None
-        scope.default_format = "png"
-    except Exception:
-        pass
     return True
 
 def _wrap_pdf_line(pdf: FPDF, text: str, max_w: float) -> list[str]:
@@ -10548,29 +11425,152 @@ def _apply_pdf_chart_layout(fig):
     fig.update_yaxes(automargin=True)
     return fig
 
-def _fig_to_png_bytes(fig, width: int = 900, height: int = 500, scale: int = 2) -> bytes | None:
-    if fig is None:
+@st.cache_resource(show_spinner=False)
+def _kaleido_scope_pool() -> dict:
+    return {"lock": threading.Lock(), "idle": queue.Queue(), "started": 0}
+
+def _checkout_kaleido_scope(pool: dict):
+    """Idle Kaleido scope from the pool, starting another (up to REPORT_CHART_WORKERS) when all are busy."""
+    try:
+        return pool["idle"].get_nowait()
+    except queue.Empty:
+        pass
+    with pool["lock"]:
+        start = pool["started"] < REPORT_CHART_WORKERS
+        if start:
+            pool["started"] += 1
+    if not start:
+        return pool["idle"].get()
+    try:
+        base = pio.kaleido.scope
+        scope = type(base)(plotlyjs=base.plotlyjs)
+        # The constructor falls back to the bundled MathJax when mathjax is None; report charts don't use it.
+        scope.mathjax = None
+        scope.default_format = "png"
+        return scope
+    except Exception:
+        with pool["lock"]:
+            pool["started"] -= 1
+        raise
+
+def _render_png_on_pool(pool: dict, fig_dict: dict, width: int, height: int, scale: int) -> tuple[bytes | None, str]:
+    # Each pooled scope keeps its own Kaleido renderer process alive between reports.
+    try:
+        scope = _checkout_kaleido_scope(pool)
+    except Exception as exc:
+        return None, str(exc)
+    last_exc = ""
+    try:
+        scales = [scale] if scale == 1 else [scale, 1]
+        for attempt_scale in scales:
+            try:
+                # A non-empty error alongside the bytes means the scale-1 fallback was used.
+                return scope.transform(fig_dict, format="png", width=width, height=height, scale=attempt_scale), last_exc
+            except Exception as exc:
+                last_exc = str(exc)
+    finally:
+        pool["idle"].put(scope)
+    return None, last_exc
+
+# ---------------------------------------------------------
+# Chart image cache: rendered report charts kept on disk as PNGs named by a hash
+# of the figure JSON plus width, height and scale, so an unchanged chart skips
+# Kaleido. Hits refresh the file's mtime and writes evict the least recently
+# used images once the directory passes CHART_CACHE_MAX_MB.
+# Bump _CHART_CACHE_VERSION whenever chart rasterization changes outside the figure.
+# ---------------------------------------------------------
+_CHART_CACHE_VERSION = 1
+CHART_CACHE_DIR = os.environ.get("CHART_CACHE_DIR", str(Path(__file__).resolve().parent / ".cache" / "charts"))
+CHART_CACHE_MAX_MB = float(os.environ.get("CHART_CACHE_MAX_MB", "200") or 200)
+
+def _chart_cache_root() -> Path | None:
+    root = str(CHART_CACHE_DIR or "").strip()
+    if not root or root.lower() in {"0", "off", "none", "false"}:
         return None
-    if not _configure_kaleido_scope():
+    return Path(root)
+
+def _chart_cache_key(fig_dict: dict, width: int, height: int, scale: int) -> str:
+    from plotly import __version__ as plotly_version
+    from plotly.utils import PlotlyJSONEncoder
+
+    h = hashlib.sha256()
+    h.update(f"v{_CHART_CACHE_VERSION}|plotly {plotly_version}|{width}x{height}@{scale}|".encode("utf-8"))
+    h.update(json.dumps(fig_dict, cls=PlotlyJSONEncoder, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:32]
+
+def _load_chart_png(root: Path, key: str) -> bytes | None:
+    target = root / f"{key}.png"
+    try:
+        png = target.read_bytes()
+        os.utime(target)
+    except OSError:
         return None
-    _apply_pdf_chart_layout(fig)
-    last_exc = None
-    scales = [scale] if scale == 1 else [scale, 1]
-    for attempt_scale in scales:
+    return png or None
+
+def _store_chart_png(root: Path, key: str, png: bytes) -> None:
+    """Best effort, like the derived-data cache: a read-only disk just skips it."""
+    target = root / f"{key}.png"
+    tmp = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(png)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def _evict_chart_cache(root: Path) -> None:
+    """Drop least recently used images until the cache fits CHART_CACHE_MAX_MB."""
+    try:
+        entries = []
+        for entry in os.scandir(root):
+            if entry.name.endswith(".png") and entry.is_file():
+                info = entry.stat()
+                entries.append((info.st_mtime, info.st_size, entry.path))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    limit = CHART_CACHE_MAX_MB * 2**20
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
         try:
-            return pio.to_image(
-                fig,
-                format="png",
-                width=width,
-                height=height,
-                scale=attempt_scale,
-                engine="kaleido",
-            )
-        except Exception as exc:
-            last_exc = exc
-    if last_exc is not None:
-        _record_pdf_chart_error(str(last_exc))
-    return None
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def _figs_to_png_bytes(figs: list[tuple], scale: int = 2) -> list[bytes | None]:
+    """PNG bytes for each (fig, width, height); cache misses render concurrently on the Kaleido pool."""
+    if not figs:
+        return []
+    jobs = [(_apply_pdf_chart_layout(fig).to_dict(), width, height) for fig, width, height in figs]
+    root = _chart_cache_root()
+    keys = [_chart_cache_key(*job, scale) for job in jobs] if root is not None else [None] * len(jobs)
+    pngs = [_load_chart_png(root, key) if key else None for key in keys]
+    missing = [i for i, png in enumerate(pngs) if png is None]
+    if not missing or not _configure_kaleido_scope():
+        return pngs
+    pool = _kaleido_scope_pool()
+    with ThreadPoolExecutor(max_workers=min(REPORT_CHART_WORKERS, len(missing)), thread_name_prefix="chart-render") as ex:
+        results = list(ex.map(lambda i: _render_png_on_pool(pool, *jobs[i], scale), missing))
+    for i, (png, error) in zip(missing, results):
+        pngs[i] = png
+        if png is None:
+            if error:
+                _record_pdf_chart_error(error)
+        elif not error and keys[i]:
+            _store_chart_png(root, keys[i], png)
+    if root is not None:
+        _evict_chart_cache(root)
+    return pngs
+
+def _fig_to_png_bytes(fig, width: int = 900, height: int = 500, scale: int = 2) -> bytes | None:
+    if fig is None:
+        return None
+    return _figs_to_png_bytes([(fig, width, height)], scale=scale)[0]
 
 def _coerce_pdf_bytes(data) -> bytes | None:
     if data is None:
@@ -10650,8 +11650,7 @@ def _pdf_ensure_space(pdf: FPDF, height_needed: float) -> None:
     if pdf.get_y() + height_needed > pdf.h - pdf.b_margin:
         pdf.add_page()
 
-def _pdf_add_chart(pdf: FPDF, fig, caption: str, width_px: int = 900, height_px: int = 500) -> None:
-    png = _fig_to_png_bytes(fig, width=width_px, height=height_px, scale=2)
+def _pdf_add_chart(pdf: FPDF, png: bytes | None, caption: str, width_px: int = 900, height_px: int = 500) -> None:
     if not png:
         pdf.set_font("Helvetica", "I", 9)
         pdf.cell(0, 5, _pdf_safe_text(f"{caption} (chart unavailable)"), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
@@ -10755,69 +11754,55 @@ def _calc_share_range(tfl_low: float, tfl_high: float, total_low: float, total_h
 def _chart_lines(rows: list[tuple[str, str]]) -> str:
     return "\n".join([f"{label}: {value}" for label, value in rows if label])
 
-def _build_report_payload(
-    *,
-    session_val: str | None,
-    scope_label: str,
-    focus_label: str,
-    Lobby_TFL_Client_All: pd.DataFrame,
-    Wit_All: pd.DataFrame,
-    Bill_Status_All: pd.DataFrame,
-    Bill_Sub_All: pd.DataFrame,
-    tfl_session_val: str | None,
-    focus_context: dict | None = None,
-) -> dict:
-    session_label = _session_label(session_val) if session_val else "Selected Session"
-    generated_dt = datetime.now()
-    generated_date = generated_dt.strftime("%B %d, %Y")
-    generated_ts = generated_dt.strftime("%Y-%m-%d %H:%M")
-    scope_label = scope_label or "Selected Session"
-    focus_label = focus_label or "All"
-
-    scope_all = scope_label.strip().lower().startswith("all")
-    tfl_session = str(tfl_session_val) if tfl_session_val is not None else str(session_val or "")
+def _series_from(df: pd.DataFrame, col: str) -> pd.Series:
+    s = df.get(col, pd.Series(dtype=object))
+    if isinstance(s, pd.DataFrame):
+        s = s.iloc[:, 0]
+    return s
 
+def _unique_count(s: pd.Series) -> int:
+    if s is None or s.empty:
+        return 0
+    v = s.dropna().astype(str).str.strip()
+    v = v[(v != "") & (~v.str.lower().isin(["nan", "none", "null"]))]
+    return int(v.nunique())
+
+# ---------------------------------------------------------
+# Report payload sections: the statewide parts of a report depend only on the
+# dataset and the scope/session filters, so each is cached on its own (keyed via
+# DATASET_HASH_FUNCS) and a report for a new focus only rebuilds the focus section.
+# ---------------------------------------------------------
+def _report_scope_rows(Lobby_TFL_Client_All: pd.DataFrame, scope_all: bool, tfl_session: str) -> pd.DataFrame:
+    """Client rows in the report scope, with numeric IsTFL/Low_num/High_num."""
+    src = Lobby_TFL_Client_All
+    if "Session" in src.columns and not scope_all and tfl_session:
+        src = session_rows(src, tfl_session)
     base = ensure_cols(
-        Lobby_TFL_Client_All,
+        src,
         {"IsTFL": 0, "Low_num": 0.0, "High_num": 0.0, "Client": "", "LobbyShort": ""},
-    ).copy()
+    )
     if "Session" in base.columns:
         base["Session"] = base["Session"].astype(str).str.strip()
-        if not scope_all and tfl_session:
-            base = base[base["Session"] == tfl_session].copy()
 
     base["IsTFL"] = pd.to_numeric(base.get("IsTFL", 0), errors="coerce").fillna(0).astype(int)
     base["Low_num"] = pd.to_numeric(base.get("Low_num", 0), errors="coerce").fillna(0.0)
     base["High_num"] = pd.to_numeric(base.get("High_num", 0), errors="coerce").fillna(0.0)
+    return base
 
-    scope_session_label = ""
-    if scope_all:
-        if "Session" in base.columns:
-            scope_session_label = _session_range_label(base["Session"])
-        else:
-            scope_session_label = "All Sessions"
-    else:
-        scope_session_label = _session_long_label(session_val)
-    if not scope_session_label:
-        scope_session_label = scope_label or "Selected Session"
+def _report_tfl_flags(base: pd.DataFrame) -> pd.DataFrame:
+    tfl_flag = pd.DataFrame(columns=["LobbyShort", "IsTFL"])
+    if not base.empty and "LobbyShort" in base.columns:
+        tfl_flag = (
+            base.groupby("LobbyShort", as_index=False)["IsTFL"]
+            .max()
+            .rename(columns={"IsTFL": "IsTFL"})
+        )
+    return tfl_flag
 
-    report_id = f"LL-{generated_dt.strftime('%Y%m%d-%H%M')}-{_slugify(focus_label, default='scope')[:10]}"
-    filter_summary_parts = [f"Scope: {scope_session_label}"]
-    if focus_label:
-        filter_summary_parts.append(f"Focus: {focus_label}")
-    if focus_context and isinstance(focus_context, dict):
-        if focus_context.get("type") == "bill":
-            bill_id = focus_context.get("bill") or focus_context.get("query", "")
-            if bill_id:
-                filter_summary_parts.append(f"Bill: {bill_id}")
-        if focus_context.get("type") == "lobbyist":
-            lobby_name = focus_context.get("display_name", "")
-            if lobby_name:
-                filter_summary_parts.append(f"Lobbyist: {lobby_name}")
-    filter_summary = "; ".join(filter_summary_parts)
-    selected_lobbyist = ""
-    if focus_context and isinstance(focus_context, dict) and focus_context.get("type") == "lobbyist":
-        selected_lobbyist = focus_context.get("display_name") or ""
+@st.cache_data(show_spinner=False, ttl=600, max_entries=16, hash_funcs=DATASET_HASH_FUNCS)
+def _report_funding_section(Lobby_TFL_Client_All: pd.DataFrame, scope_all: bool, tfl_session: str) -> dict:
+    """Compensation totals and shares, top clients and entity types for the report scope."""
+    base = _report_scope_rows(Lobby_TFL_Client_All, scope_all, tfl_session)
 
     total_low = float(base["Low_num"].sum()) if not base.empty else 0.0
     total_high = float(base["High_num"].sum()) if not base.empty else 0.0
@@ -10858,19 +11843,6 @@ def _build_report_payload(
     top_clients_tfl = _top_clients(base, 1, limit=5)
     top_clients_private = _top_clients(base, 0, limit=5)
 
-    def _series_from(df: pd.DataFrame, col: str) -> pd.Series:
-        s = df.get(col, pd.Series(dtype=object))
-        if isinstance(s, pd.DataFrame):
-            s = s.iloc[:, 0]
-        return s
-
-    def _unique_count(s: pd.Series) -> int:
-        if s is None or s.empty:
-            return 0
-        v = s.dropna().astype(str).str.strip()
-        v = v[(v != "") & (~v.str.lower().isin(["nan", "none", "null"]))]
-        return int(v.nunique())
-
     unique_lobbyists_total = _unique_count(_series_from(base, "LobbyShort"))
     unique_lobbyists_tfl = _unique_count(_series_from(base.loc[base["IsTFL"] == 1], "LobbyShort"))
     unique_clients_total = _unique_count(_series_from(base, "Client"))
@@ -10905,13 +11877,50 @@ def _build_report_payload(
                 {"type": name, "count": int(count)} for name, count in type_counts.items()
             ]
 
-    tfl_flag = pd.DataFrame(columns=["LobbyShort", "IsTFL"])
-    if not base.empty and "LobbyShort" in base.columns:
-        tfl_flag = (
-            base.groupby("LobbyShort", as_index=False)["IsTFL"]
-            .max()
-            .rename(columns={"IsTFL": "IsTFL"})
-        )
+    return {
+        "total_low_value": total_low,
+        "total_high_value": total_high,
+        "tfl_low_value": tfl_low,
+        "tfl_high_value": tfl_high,
+        "private_low_value": private_low,
+        "private_high_value": private_high,
+        "total_low": fmt_usd(total_low),
+        "total_high": fmt_usd(total_high),
+        "tfl_low": fmt_usd(tfl_low),
+        "tfl_high": fmt_usd(tfl_high),
+        "private_low": fmt_usd(private_low),
+        "private_high": fmt_usd(private_high),
+        "tfl_share_low_pct": f"{tfl_share_low_pct:.1f}",
+        "tfl_share_high_pct": f"{tfl_share_high_pct:.1f}",
+        "tfl_share_low_pct_value": tfl_share_low_pct,
+        "tfl_share_high_pct_value": tfl_share_high_pct,
+        "private_share_low_pct_value": private_share_low_pct,
+        "private_share_high_pct_value": private_share_high_pct,
+        "funding_mix": funding_mix,
+        "unique_lobbyists_total": f"{unique_lobbyists_total:,}",
+        "unique_lobbyists_tfl": f"{unique_lobbyists_tfl:,}",
+        "unique_clients_total": f"{unique_clients_total:,}",
+        "unique_clients_tfl": f"{unique_clients_tfl:,}",
+        "top_clients_tfl": top_clients_tfl,
+        "top_clients_private": top_clients_private,
+        "chart_compensation_bar": chart_compensation_bar,
+        "chart_share": chart_share,
+        "chart_entity_types": chart_entity_types,
+        "chart_entity_types_data": entity_type_counts,
+    }
+
+@st.cache_data(show_spinner=False, ttl=600, max_entries=16, hash_funcs=DATASET_HASH_FUNCS)
+def _report_opposition_section(
+    Lobby_TFL_Client_All: pd.DataFrame,
+    Wit_All: pd.DataFrame,
+    Bill_Status_All: pd.DataFrame,
+    Bill_Sub_All: pd.DataFrame,
+    session_val: str | None,
+    scope_all: bool,
+    tfl_session: str,
+) -> dict:
+    """Witness positions by funding type and the bills and subjects most opposed by TFL lobbyists."""
+    tfl_flag = _report_tfl_flags(_report_scope_rows(Lobby_TFL_Client_All, scope_all, tfl_session))
 
     witness_summary = "No witness-list data available for this scope/session."
     chart_witness_positions = "No witness-list data available."
@@ -10924,7 +11933,7 @@ def _build_report_payload(
     wit = Wit_All if isinstance(Wit_All, pd.DataFrame) else pd.DataFrame()
     if not wit.empty and "LobbyShort" in wit.columns:
         if session_val is not None and "Session" in wit.columns:
-            wit = wit[wit["Session"].astype(str).str.strip() == str(session_val)].copy()
+            wit = session_rows(wit, session_val).copy()
         if not wit.empty:
             pos = bill_position_from_flags(wit)
             if not pos.empty:
@@ -10977,7 +11986,7 @@ def _build_report_payload(
 
         bill_info = Bill_Status_All if isinstance(Bill_Status_All, pd.DataFrame) else pd.DataFrame()
         if not bill_info.empty and "Session" in bill_info.columns and session_val is not None:
-            bill_info = bill_info[bill_info["Session"].astype(str).str.strip() == str(session_val)].copy()
+            bill_info = session_rows(bill_info, session_val).copy()
         keep_cols = [c for c in ["Bill", "Caption", "Status"] if c in bill_info.columns]
         if keep_cols:
             bill_info = bill_info[keep_cols].drop_duplicates(subset=["Bill"])
@@ -11013,7 +12022,7 @@ def _build_report_payload(
     bill_sub = Bill_Sub_All if isinstance(Bill_Sub_All, pd.DataFrame) else pd.DataFrame()
     if not against.empty and not bill_sub.empty and {"Bill", "Subject"}.issubset(bill_sub.columns):
         if "Session" in bill_sub.columns and session_val is not None:
-            bill_sub = bill_sub[bill_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+            bill_sub = session_rows(bill_sub, session_val).copy()
         merged = against[["Bill"]].merge(bill_sub[["Bill", "Subject"]], on="Bill", how="left")
         merged["Subject"] = merged["Subject"].fillna("").astype(str).str.strip()
         merged = merged[merged["Subject"] != ""].copy()
@@ -11038,6 +12047,84 @@ def _build_report_payload(
         else "No subject-level opposition data available."
     )
 
+    return {
+        "witness_activity_summary": witness_summary,
+        "chart_witness_positions": chart_witness_positions,
+        "witness_counts": witness_counts,
+        "chart_top_bills": chart_top_bills,
+        "chart_top_subjects": chart_top_subjects,
+        "has_top_bills": bool(top_bills),
+        "has_top_subjects": bool(top_subjects),
+        "top_bills": top_bills,
+        "top_subjects": top_subjects,
+    }
+
+def _build_report_payload(
+    *,
+    session_val: str | None,
+    scope_label: str,
+    focus_label: str,
+    Lobby_TFL_Client_All: pd.DataFrame,
+    Wit_All: pd.DataFrame,
+    Bill_Status_All: pd.DataFrame,
+    Bill_Sub_All: pd.DataFrame,
+    tfl_session_val: str | None,
+    focus_context: dict | None = None,
+    progress: Callable[[str], None] | None = None,
+) -> dict:
+    session_label = _session_label(session_val) if session_val else "Selected Session"
+    generated_dt = datetime.now()
+    generated_date = generated_dt.strftime("%B %d, %Y")
+    generated_ts = generated_dt.strftime("%Y-%m-%d %H:%M")
+    scope_label = scope_label or "Selected Session"
+    focus_label = focus_label or "All"
+
+    scope_all = scope_label.strip().lower().startswith("all")
+    tfl_session = str(tfl_session_val) if tfl_session_val is not None else str(session_val or "")
+
+    base = _report_scope_rows(Lobby_TFL_Client_All, scope_all, tfl_session)
+
+    scope_session_label = ""
+    if scope_all:
+        if "Session" in base.columns:
+            scope_session_label = _session_range_label(base["Session"])
+        else:
+            scope_session_label = "All Sessions"
+    else:
+        scope_session_label = _session_long_label(session_val)
+    if not scope_session_label:
+        scope_session_label = scope_label or "Selected Session"
+
+    report_id = f"LL-{generated_dt.strftime('%Y%m%d-%H%M')}-{_slugify(focus_label, default='scope')[:10]}"
+    filter_summary_parts = [f"Scope: {scope_session_label}"]
+    if focus_label:
+        filter_summary_parts.append(f"Focus: {focus_label}")
+    if focus_context and isinstance(focus_context, dict):
+        if focus_context.get("type") == "bill":
+            bill_id = focus_context.get("bill") or focus_context.get("query", "")
+            if bill_id:
+                filter_summary_parts.append(f"Bill: {bill_id}")
+        if focus_context.get("type") == "lobbyist":
+            lobby_name = focus_context.get("display_name", "")
+            if lobby_name:
+                filter_summary_parts.append(f"Lobbyist: {lobby_name}")
+    filter_summary = "; ".join(filter_summary_parts)
+    selected_lobbyist = ""
+    if focus_context and isinstance(focus_context, dict) and focus_context.get("type") == "lobbyist":
+        selected_lobbyist = focus_context.get("display_name") or ""
+
+    if progress:
+        progress("funding")
+    funding = _report_funding_section(Lobby_TFL_Client_All, scope_all, tfl_session)
+    if progress:
+        progress("opposition")
+    opposition = _report_opposition_section(
+        Lobby_TFL_Client_All, Wit_All, Bill_Status_All, Bill_Sub_All, session_val, scope_all, tfl_session
+    )
+    top_bills = opposition["top_bills"]
+    top_subjects = opposition["top_subjects"]
+    tfl_flag = _report_tfl_flags(base)
+
     scope_note = ""
     if scope_all:
         scope_note = (
@@ -11067,6 +12154,8 @@ def _build_report_payload(
         "Disclaimer: Figures are based on reported ranges and should be read as conservative estimates."
     )
 
+    if progress:
+        progress("focus")
     focus_section = None
     fc = focus_context or {}
     focus_type = str(fc.get("type", "")).strip().lower()
@@ -11093,6 +12182,18 @@ def _build_report_payload(
     name_to_short = lookups.get("name_to_short", {})
     short_to_names = lookups.get("short_to_names", {})
     filerid_to_short = lookups.get("filerid_to_short", {})
+    filer_row_index = lookups.get("filer_row_index", {})
+    if not isinstance(filer_row_index, dict):
+        filer_row_index = {}
+    recipient_row_index = lookups.get("recipient_row_index", {})
+    if not isinstance(recipient_row_index, dict):
+        recipient_row_index = {}
+    activity_facts = lookups.get("activity_facts")
+    if not isinstance(activity_facts, pd.DataFrame):
+        activity_facts = None
+    disclosure_facts = lookups.get("disclosure_facts")
+    if not isinstance(disclosure_facts, pd.DataFrame):
+        disclosure_facts = None
     if not isinstance(name_to_short, dict):
         name_to_short = {}
     if not isinstance(short_to_names, dict):
@@ -11234,7 +12335,7 @@ def _build_report_payload(
                 if lobbyshorts and not wit.empty and "LobbyShort" in wit.columns:
                     wit = wit[wit["LobbyShort"].astype(str).str.strip().isin(lobbyshorts)].copy()
                     if session_val is not None and "Session" in wit.columns:
-                        wit = wit[wit["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        wit = session_rows(wit, session_val).copy()
                     if not wit.empty:
                         pos = bill_position_from_flags(wit)
                         bill_count = int(pos["Bill"].nunique()) if not pos.empty else 0
@@ -11249,7 +12350,7 @@ def _build_report_payload(
 
                         bs = Bill_Status_All if isinstance(Bill_Status_All, pd.DataFrame) else pd.DataFrame()
                         if not bs.empty and "Session" in bs.columns and session_val is not None:
-                            bs = bs[bs["Session"].astype(str).str.strip() == str(session_val)].copy()
+                            bs = session_rows(bs, session_val).copy()
                         if bill_list_all and not bs.empty and "Bill" in bs.columns:
                             status_counts = _top_counts(
                                 bs[bs["Bill"].astype(str).isin(bill_list_all)].get(
@@ -11287,7 +12388,7 @@ def _build_report_payload(
                         bill_sub = Bill_Sub_All if isinstance(Bill_Sub_All, pd.DataFrame) else pd.DataFrame()
                         if bill_list_all and not bill_sub.empty and {"Bill", "Subject"}.issubset(bill_sub.columns):
                             if session_val is not None and "Session" in bill_sub.columns:
-                                bill_sub = bill_sub[bill_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                                bill_sub = session_rows(bill_sub, session_val).copy()
                             sub_counts = (
                                 bill_sub[bill_sub["Bill"].astype(str).isin(bill_list_all)]
                                 .groupby("Subject")
@@ -11335,7 +12436,7 @@ def _build_report_payload(
                 if not lobby_sub_all.empty:
                     lobby_sub = lobby_sub_all.copy()
                     if "Session" in lobby_sub.columns and session_val is not None:
-                        lobby_sub = lobby_sub[lobby_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        lobby_sub = session_rows(lobby_sub, session_val).copy()
                     if "LobbyShortNorm" in lobby_sub.columns:
                         lobby_sub = lobby_sub[lobby_sub["LobbyShortNorm"].isin(lobbyshort_norms)].copy()
                     elif "LobbyShort" in lobby_sub.columns:
@@ -11413,6 +12514,8 @@ def _build_report_payload(
                         lobbyist_norms_tuple=lobbyist_norms_tuple,
                         filerid_to_short=filerid_to_short,
                         lobbyshort_to_name=lobbyshort_to_name,
+                        _row_indexes=filer_row_index,
+                        _facts=activity_facts,
                     )
                     if not activities.empty:
                         focus_section["metrics"].append(("Activity rows", f"{len(activities):,}"))
@@ -11444,6 +12547,8 @@ def _build_report_payload(
                         lobbyist_norms_tuple=lobbyist_norms_tuple,
                         filerid_to_short=filerid_to_short,
                         lobbyshort_to_name=lobbyshort_to_name,
+                        _row_indexes=filer_row_index,
+                        _facts=disclosure_facts,
                     )
                     if not disclosures.empty:
                         focus_section["metrics"].append(("Disclosure rows", f"{len(disclosures):,}"))
@@ -11549,7 +12654,7 @@ def _build_report_payload(
                 if not wit.empty and "LobbyShort" in wit.columns:
                     wit = wit[wit["LobbyShort"].astype(str).str.strip() == lobbyshort].copy()
                     if session_val is not None and "Session" in wit.columns:
-                        wit = wit[wit["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        wit = session_rows(wit, session_val).copy()
                     if not wit.empty:
                         pos = bill_position_from_flags(wit)
                         bill_count = int(pos["Bill"].nunique()) if not pos.empty else 0
@@ -11564,7 +12669,7 @@ def _build_report_payload(
 
                         bs = Bill_Status_All if isinstance(Bill_Status_All, pd.DataFrame) else pd.DataFrame()
                         if not bs.empty and "Session" in bs.columns and session_val is not None:
-                            bs = bs[bs["Session"].astype(str).str.strip() == str(session_val)].copy()
+                            bs = session_rows(bs, session_val).copy()
                         if bill_list_all and not bs.empty and "Bill" in bs.columns:
                             status_counts = _top_counts(
                                 bs[bs["Bill"].astype(str).isin(bill_list_all)].get(
@@ -11602,7 +12707,7 @@ def _build_report_payload(
                         bill_sub = Bill_Sub_All if isinstance(Bill_Sub_All, pd.DataFrame) else pd.DataFrame()
                         if bill_list_all and not bill_sub.empty and {"Bill", "Subject"}.issubset(bill_sub.columns):
                             if session_val is not None and "Session" in bill_sub.columns:
-                                bill_sub = bill_sub[bill_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                                bill_sub = session_rows(bill_sub, session_val).copy()
                             sub_counts = (
                                 bill_sub[bill_sub["Bill"].astype(str).isin(bill_list_all)]
                                 .groupby("Subject")
@@ -11670,7 +12775,7 @@ def _build_report_payload(
                 if not lobby_sub_all.empty:
                     lobby_sub = lobby_sub_all.copy()
                     if "Session" in lobby_sub.columns and session_val is not None:
-                        lobby_sub = lobby_sub[lobby_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        lobby_sub = session_rows(lobby_sub, session_val).copy()
                     if "LobbyShortNorm" in lobby_sub.columns:
                         lobby_sub = lobby_sub[lobby_sub["LobbyShortNorm"] == lobbyshort_norm].copy()
                     elif "LobbyShort" in lobby_sub.columns:
@@ -11745,6 +12850,8 @@ def _build_report_payload(
                     name_to_short=name_to_short,
                     lobbyist_norms_tuple=lobbyist_norms_tuple,
                     filerid_to_short=filerid_to_short,
+                    _row_indexes=filer_row_index,
+                    _facts=activity_facts,
                 )
                 if not activities.empty:
                     focus_section["metrics"].append(("Activity rows", f"{len(activities):,}"))
@@ -11775,6 +12882,8 @@ def _build_report_payload(
                     name_to_short=name_to_short,
                     lobbyist_norms_tuple=lobbyist_norms_tuple,
                     filerid_to_short=filerid_to_short,
+                    _row_indexes=filer_row_index,
+                    _facts=disclosure_facts,
                 )
                 if not disclosures.empty:
                     focus_section["metrics"].append(("Disclosure rows", f"{len(disclosures):,}"))
@@ -11826,7 +12935,7 @@ def _build_report_payload(
                 authored = authored_all.copy()
                 authored = authored[authored["AuthorNorm"] == norm_name(member_name)].copy()
                 if session_val is not None and "Session" in authored.columns:
-                    authored = authored[authored["Session"].astype(str).str.strip() == str(session_val)].copy()
+                    authored = session_rows(authored, session_val).copy()
 
                 bill_count = int(authored["Bill"].nunique()) if not authored.empty else 0
                 passed = int((authored.get("Status", pd.Series(dtype=object)) == "Passed").sum()) if not authored.empty else 0
@@ -11837,7 +12946,7 @@ def _build_report_payload(
                 witness = pd.DataFrame()
                 if bill_list and not wit.empty:
                     if session_val is not None and "Session" in wit.columns:
-                        wit = wit[wit["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        wit = session_rows(wit, session_val).copy()
                     wit = wit[wit["Bill"].astype(str).isin(bill_list)].copy() if "Bill" in wit.columns else wit.iloc[0:0].copy()
                     witness = bill_position_from_flags(wit) if not wit.empty else pd.DataFrame()
                     if not witness.empty:
@@ -11891,7 +13000,7 @@ def _build_report_payload(
                 bill_sub = Bill_Sub_All if isinstance(Bill_Sub_All, pd.DataFrame) else pd.DataFrame()
                 if bill_list and not bill_sub.empty and {"Bill", "Subject"}.issubset(bill_sub.columns):
                     if session_val is not None and "Session" in bill_sub.columns:
-                        bill_sub = bill_sub[bill_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                        bill_sub = session_rows(bill_sub, session_val).copy()
                     sub_counts = (
                         bill_sub[bill_sub["Bill"].astype(str).isin(bill_list)]
                         .groupby("Subject")
@@ -11989,6 +13098,8 @@ def _build_report_payload(
                     name_to_short=name_to_short,
                     filerid_to_short=filerid_to_short,
                     lobbyshort_to_name=lobbyshort_to_name,
+                    _facts=activity_facts,
+                    _row_indexes=recipient_row_index,
                 )
                 if not activities.empty:
                     focus_section["metrics"].append(("Activity rows", f"{len(activities):,}"))
@@ -12108,7 +13219,7 @@ def _build_report_payload(
             if not bs.empty and "Bill" in bs.columns:
                 bs = bs.copy()
                 if session_val is not None and "Session" in bs.columns:
-                    bs = bs[bs["Session"].astype(str).str.strip() == str(session_val)].copy()
+                    bs = session_rows(bs, session_val).copy()
                 try:
                     bs["BillNorm"] = bs["Bill"].astype(str).map(normalize_bill)
                 except Exception:
@@ -12128,7 +13239,7 @@ def _build_report_payload(
             if not wit.empty and "Bill" in wit.columns:
                 wit = wit.copy()
                 if session_val is not None and "Session" in wit.columns:
-                    wit = wit[wit["Session"].astype(str).str.strip() == str(session_val)].copy()
+                    wit = session_rows(wit, session_val).copy()
                 try:
                     wit["Bill"] = wit["Bill"].astype(str).map(normalize_bill)
                 except Exception:
@@ -12228,7 +13339,7 @@ def _build_report_payload(
             bill_sub = Bill_Sub_All if isinstance(Bill_Sub_All, pd.DataFrame) else pd.DataFrame()
             if not bill_sub.empty and {"Bill", "Subject"}.issubset(bill_sub.columns):
                 if session_val is not None and "Session" in bill_sub.columns:
-                    bill_sub = bill_sub[bill_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+                    bill_sub = session_rows(bill_sub, session_val).copy()
                 bill_sub = bill_sub.copy()
                 bill_sub["BillNorm"] = bill_sub["Bill"].astype(str).map(normalize_bill)
                 sub_rows = bill_sub[bill_sub["BillNorm"] == bill_id]
@@ -12273,40 +13384,8 @@ def _build_report_payload(
         "focus_label": focus_label,
         "filter_summary": filter_summary,
         "selected_lobbyist": selected_lobbyist,
-        "total_low_value": total_low,
-        "total_high_value": total_high,
-        "tfl_low_value": tfl_low,
-        "tfl_high_value": tfl_high,
-        "private_low_value": private_low,
-        "private_high_value": private_high,
-        "total_low": fmt_usd(total_low),
-        "total_high": fmt_usd(total_high),
-        "tfl_low": fmt_usd(tfl_low),
-        "tfl_high": fmt_usd(tfl_high),
-        "private_low": fmt_usd(private_low),
-        "private_high": fmt_usd(private_high),
-        "tfl_share_low_pct": f"{tfl_share_low_pct:.1f}",
-        "tfl_share_high_pct": f"{tfl_share_high_pct:.1f}",
-        "tfl_share_low_pct_value": tfl_share_low_pct,
-        "tfl_share_high_pct_value": tfl_share_high_pct,
-        "private_share_low_pct_value": private_share_low_pct,
-        "private_share_high_pct_value": private_share_high_pct,
-        "funding_mix": funding_mix,
-        "unique_lobbyists_total": f"{unique_lobbyists_total:,}",
-        "unique_lobbyists_tfl": f"{unique_lobbyists_tfl:,}",
-        "unique_clients_total": f"{unique_clients_total:,}",
-        "unique_clients_tfl": f"{unique_clients_tfl:,}",
-        "top_clients_tfl": top_clients_tfl,
-        "top_clients_private": top_clients_private,
-        "chart_compensation_bar": chart_compensation_bar,
-        "chart_share": chart_share,
-        "chart_entity_types": chart_entity_types,
-        "chart_entity_types_data": entity_type_counts,
-        "witness_activity_summary": witness_summary,
-        "chart_witness_positions": chart_witness_positions,
-        "witness_counts": witness_counts,
-        "chart_top_bills": chart_top_bills,
-        "chart_top_subjects": chart_top_subjects,
+        **funding,
+        **opposition,
         "existing_law_gap_summary": existing_law_gap_summary,
         "recommended_fix_statute": recommended_fix_statute,
         "implementation_notes": implementation_notes,
@@ -12315,10 +13394,6 @@ def _build_report_payload(
         "report_title": report_title,
         "scope_session_label": scope_session_label,
         "scope_note": scope_note,
-        "has_top_bills": bool(top_bills),
-        "has_top_subjects": bool(top_subjects),
-        "top_bills": top_bills,
-        "top_subjects": top_subjects,
         "focus_section": focus_section,
     }
 
@@ -12337,18 +13412,191 @@ def _build_report_payload(
             payload[f"bill_{i + 1}_private_opp"] = "0"
             payload[f"bill_{i + 1}_summary"] = "No summary available."
 
-    for i in range(5):
-        if i < len(top_subjects):
-            s = top_subjects[i]
-            payload[f"subject_{i + 1}"] = s["Subject"]
-            payload[f"subject_{i + 1}_opp_count"] = f"{int(s['Oppositions']):,}"
-        else:
-            payload[f"subject_{i + 1}"] = "-"
-            payload[f"subject_{i + 1}_opp_count"] = "0"
+    for i in range(5):
+        if i < len(top_subjects):
+            s = top_subjects[i]
+            payload[f"subject_{i + 1}"] = s["Subject"]
+            payload[f"subject_{i + 1}_opp_count"] = f"{int(s['Oppositions']):,}"
+        else:
+            payload[f"subject_{i + 1}"] = "-"
+            payload[f"subject_{i + 1}_opp_count"] = "0"
+
+    return payload
+
+def _report_chart_figures(payload: dict) -> dict:
+    """Plotly figures for the report charts, keyed by slot: (fig, caption, width_px, height_px)."""
+    figures = {}
+    focus_section = payload.get("focus_section")
+    if focus_section and isinstance(focus_section, dict):
+        for i, chart in enumerate(focus_section.get("charts", []) or []):
+            fig = _build_focus_chart(chart if isinstance(chart, dict) else {})
+            if fig:
+                caption = str(chart.get("caption", "Focus Chart")).strip() if isinstance(chart, dict) else "Focus Chart"
+                figures[f"focus_{i}"] = (fig, caption, 900, 500)
+
+    comp_df = pd.DataFrame(
+        [
+            {"Funding": "Taxpayer Funded", "Low": payload["tfl_low_value"], "High": payload["tfl_high_value"]},
+            {"Funding": "Private", "Low": payload["private_low_value"], "High": payload["private_high_value"]},
+        ]
+    )
+    comp_long = comp_df.melt(id_vars="Funding", value_vars=["Low", "High"], var_name="Estimate", value_name="Total")
+    if not comp_long.empty and comp_long["Total"].sum() > 0:
+        fig_comp = px.bar(
+            comp_long,
+            x="Funding",
+            y="Total",
+            color="Estimate",
+            barmode="group",
+            text="Total",
+            color_discrete_map={"Low": "#004c6d", "High": "#1f77b4"},
+        )
+        fig_comp.update_traces(texttemplate="$%{text:,.0f}", textposition="outside", cliponaxis=False)
+        fig_comp.update_layout(
+            template="plotly_white",
+            title="Lobbying Compensation Range by Funding Type",
+            yaxis_title="Reported compensation",
+            xaxis_title="",
+            legend_title="Estimate",
+            margin=dict(l=40, r=20, t=50, b=30),
+        )
+        fig_comp.update_yaxes(tickprefix="$", tickformat="~s")
+        figures["comp"] = (fig_comp, "Chart 1. Lobbying Compensation Range by Funding Type", 900, 500)
+
+    tfl_mid = (payload["tfl_low_value"] + payload["tfl_high_value"]) / 2
+    pri_mid = (payload["private_low_value"] + payload["private_high_value"]) / 2
+    if (tfl_mid + pri_mid) > 0:
+        share_df = pd.DataFrame(
+            {"Funding": ["Taxpayer Funded", "Private"], "Total": [tfl_mid, pri_mid]}
+        )
+        fig_share = px.pie(
+            share_df,
+            names="Funding",
+            values="Total",
+            hole=0.5,
+            color="Funding",
+            color_discrete_map={"Taxpayer Funded": "#0ea5a4", "Private": "#4c78a8"},
+        )
+        fig_share.update_layout(
+            template="plotly_white",
+            title="Share of Total Lobbying (Midpoint)",
+            margin=dict(l=20, r=20, t=50, b=20),
+        )
+        figures["share"] = (fig_share, "Chart 2. Share of Total Lobbying - Taxpayer vs Private", 700, 420)
+
+    entity_counts = payload.get("chart_entity_types_data", [])
+    if entity_counts:
+        entity_df = pd.DataFrame(entity_counts)
+        fig_entities = px.bar(
+            entity_df.sort_values("count"),
+            x="count",
+            y="type",
+            orientation="h",
+            text="count",
+            color_discrete_sequence=["#4c78a8"],
+        )
+        fig_entities.update_traces(textposition="outside", cliponaxis=False)
+        fig_entities.update_layout(
+            template="plotly_white",
+            title="Taxpayer-Funded Clients by Entity Type",
+            xaxis_title="Clients",
+            yaxis_title="",
+            margin=dict(l=40, r=20, t=50, b=30),
+        )
+        figures["entities"] = (fig_entities, "Chart 3. Taxpayer-Funded Clients by Entity Type", 900, 500)
+
+    w_counts = payload.get("witness_counts", {})
+    if w_counts:
+        w_rows = []
+        for position in ["Against", "For", "On"]:
+            w_rows.append(
+                {
+                    "Position": position,
+                    "Taxpayer Funded": int(w_counts.get("tfl", {}).get(position, 0)),
+                    "Private": int(w_counts.get("private", {}).get(position, 0)),
+                }
+            )
+        w_df = pd.DataFrame(w_rows)
+        if not w_df.empty and w_df[["Taxpayer Funded", "Private"]].sum().sum() > 0:
+            w_long = w_df.melt(id_vars="Position", var_name="Funding", value_name="Count")
+            fig_wit = px.bar(
+                w_long,
+                x="Position",
+                y="Count",
+                color="Funding",
+                barmode="group",
+                text="Count",
+                color_discrete_map={"Taxpayer Funded": "#ff6b6b", "Private": "#4c78a8"},
+            )
+            fig_wit.update_traces(textposition="outside", cliponaxis=False)
+            fig_wit.update_layout(
+                template="plotly_white",
+                title="Witness Positions by Funding Type",
+                yaxis_title="Positions",
+                xaxis_title="",
+                margin=dict(l=40, r=20, t=50, b=30),
+            )
+            figures["witness"] = (fig_wit, "Chart 4. Witness Positions by Funding Type", 900, 500)
+
+    top_bills = payload.get("top_bills", [])
+    if payload.get("has_top_bills") and top_bills:
+        bill_df = pd.DataFrame(
+            [{"Bill": b["id"], "Oppositions": b.get("tfl", 0)} for b in top_bills]
+        )
+        fig_bills = px.bar(
+            bill_df.sort_values("Oppositions"),
+            x="Oppositions",
+            y="Bill",
+            orientation="h",
+            text="Oppositions",
+            color_discrete_sequence=["#d14b4b"],
+        )
+        fig_bills.update_traces(textposition="outside", cliponaxis=False)
+        fig_bills.update_layout(
+            template="plotly_white",
+            title="Top Bills Opposed by Taxpayer-Funded Lobbyists",
+            xaxis_title="Oppositions",
+            yaxis_title="",
+            margin=dict(l=40, r=20, t=50, b=30),
+        )
+        figures["bills"] = (fig_bills, "Chart 5. Top 5 Bills Opposed by Taxpayer-Funded Lobbyists", 900, 500)
 
-    return payload
+    top_subjects = payload.get("top_subjects", [])
+    if payload.get("has_top_subjects") and top_subjects:
+        subj_df = pd.DataFrame(
+            [{"Subject": s["Subject"], "Oppositions": s.get("Oppositions", 0)} for s in top_subjects]
+        )
+        fig_subjects = px.bar(
+            subj_df.sort_values("Oppositions"),
+            x="Oppositions",
+            y="Subject",
+            orientation="h",
+            text="Oppositions",
+            color_discrete_sequence=["#7aa6c2"],
+        )
+        fig_subjects.update_traces(textposition="outside", cliponaxis=False)
+        fig_subjects.update_layout(
+            template="plotly_white",
+            title="Top Policy Areas Opposed by Taxpayer-Funded Lobbyists",
+            xaxis_title="Oppositions",
+            yaxis_title="",
+            margin=dict(l=40, r=20, t=50, b=30),
+        )
+        figures["subjects"] = (fig_subjects, "Chart 6. Top 5 Policy Areas Opposed by Taxpayer-Funded Lobbyists", 900, 500)
 
-def _build_report_pdf_bytes(payload: dict) -> bytes:
+    return figures
+
+def _prepare_report_charts(payload: dict) -> dict:
+    """Render every report chart up front (concurrently); the layout pass only embeds the images."""
+    figures = _report_chart_figures(payload)
+    slots = list(figures)
+    pngs = _figs_to_png_bytes([(fig, w, h) for fig, _, w, h in figures.values()])
+    return {
+        slot: {"png": png, "caption": figures[slot][1], "width_px": figures[slot][2], "height_px": figures[slot][3]}
+        for slot, png in zip(slots, pngs)
+    }
+
+def _build_report_pdf_bytes(payload: dict, progress: Callable[[str], None] | None = None) -> bytes:
     class ReportPDF(FPDF):
         def __init__(self, header_title: str, header_subtitle: str, generated_date: str):
             super().__init__(orientation="P", unit="mm", format="A4")
@@ -12383,6 +13631,17 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
             self.cell(right_w, 4, _pdf_safe_text(f"Page {self.page_no()}"), new_x=XPos.RIGHT, new_y=YPos.TOP, align="R")
             self.set_text_color(0, 0, 0)
 
+    if progress:
+        progress("charts")
+    prepared_charts = _prepare_report_charts(payload)
+    if progress:
+        progress("layout")
+
+    def add_chart(slot: str) -> None:
+        chart = prepared_charts.get(slot)
+        if chart:
+            _pdf_add_chart(pdf, chart["png"], chart["caption"], chart["width_px"], chart["height_px"])
+
     header_title = payload.get("report_title", "Lobby Look-Up Report")
     scope_sub = payload.get("scope_session_label") or payload.get("scope_label", "")
     header_subtitle = f"{scope_sub} | {payload['focus_label']}".strip(" |")
@@ -12476,11 +13735,8 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
                 _pdf_add_bullets(pdf, bullets, size=10)
             if charts:
                 _pdf_add_subheading(pdf, "Focus Charts", size=10)
-                for chart in charts:
-                    fig = _build_focus_chart(chart if isinstance(chart, dict) else {})
-                    if fig:
-                        caption = str(chart.get("caption", "Focus Chart")).strip() if isinstance(chart, dict) else "Focus Chart"
-                        _pdf_add_chart(pdf, fig, caption)
+                for i in range(len(charts)):
+                    add_chart(f"focus_{i}")
             _pdf_add_rule(pdf)
 
     _pdf_add_section_title(pdf, f"I. THE SCALE OF LOBBYING IN {payload['session_label']}")
@@ -12507,55 +13763,8 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
     )
     _pdf_add_paragraph(pdf, scale_p2, size=11)
 
-    comp_df = pd.DataFrame(
-        [
-            {"Funding": "Taxpayer Funded", "Low": payload["tfl_low_value"], "High": payload["tfl_high_value"]},
-            {"Funding": "Private", "Low": payload["private_low_value"], "High": payload["private_high_value"]},
-        ]
-    )
-    comp_long = comp_df.melt(id_vars="Funding", value_vars=["Low", "High"], var_name="Estimate", value_name="Total")
-    if not comp_long.empty and comp_long["Total"].sum() > 0:
-        fig_comp = px.bar(
-            comp_long,
-            x="Funding",
-            y="Total",
-            color="Estimate",
-            barmode="group",
-            text="Total",
-            color_discrete_map={"Low": "#004c6d", "High": "#1f77b4"},
-        )
-        fig_comp.update_traces(texttemplate="$%{text:,.0f}", textposition="outside", cliponaxis=False)
-        fig_comp.update_layout(
-            template="plotly_white",
-            title="Lobbying Compensation Range by Funding Type",
-            yaxis_title="Reported compensation",
-            xaxis_title="",
-            legend_title="Estimate",
-            margin=dict(l=40, r=20, t=50, b=30),
-        )
-        fig_comp.update_yaxes(tickprefix="$", tickformat="~s")
-        _pdf_add_chart(pdf, fig_comp, "Chart 1. Lobbying Compensation Range by Funding Type")
-
-    tfl_mid = (payload["tfl_low_value"] + payload["tfl_high_value"]) / 2
-    pri_mid = (payload["private_low_value"] + payload["private_high_value"]) / 2
-    if (tfl_mid + pri_mid) > 0:
-        share_df = pd.DataFrame(
-            {"Funding": ["Taxpayer Funded", "Private"], "Total": [tfl_mid, pri_mid]}
-        )
-        fig_share = px.pie(
-            share_df,
-            names="Funding",
-            values="Total",
-            hole=0.5,
-            color="Funding",
-            color_discrete_map={"Taxpayer Funded": "#0ea5a4", "Private": "#4c78a8"},
-        )
-        fig_share.update_layout(
-            template="plotly_white",
-            title="Share of Total Lobbying (Midpoint)",
-            margin=dict(l=20, r=20, t=50, b=20),
-        )
-        _pdf_add_chart(pdf, fig_share, "Chart 2. Share of Total Lobbying - Taxpayer vs Private", width_px=700, height_px=420)
+    add_chart("comp")
+    add_chart("share")
 
     _pdf_add_section_title(pdf, "II. WHAT TAXPAYER-FUNDED LOBBYING IS - AND WHY IT MATTERS")
     def_p1 = (
@@ -12579,26 +13788,7 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
     )
     _pdf_add_paragraph(pdf, def_p2, size=11)
 
-    entity_counts = payload.get("chart_entity_types_data", [])
-    if entity_counts:
-        entity_df = pd.DataFrame(entity_counts)
-        fig_entities = px.bar(
-            entity_df.sort_values("count"),
-            x="count",
-            y="type",
-            orientation="h",
-            text="count",
-            color_discrete_sequence=["#4c78a8"],
-        )
-        fig_entities.update_traces(textposition="outside", cliponaxis=False)
-        fig_entities.update_layout(
-            template="plotly_white",
-            title="Taxpayer-Funded Clients by Entity Type",
-            xaxis_title="Clients",
-            yaxis_title="",
-            margin=dict(l=40, r=20, t=50, b=30),
-        )
-        _pdf_add_chart(pdf, fig_entities, "Chart 3. Taxpayer-Funded Clients by Entity Type")
+    add_chart("entities")
 
     _pdf_add_section_title(pdf, f"III. LEGISLATIVE ACTIVITY PATTERNS IN {payload['session_label']}")
     act_p1 = (
@@ -12616,38 +13806,7 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
     )
     _pdf_add_paragraph(pdf, act_p2, size=11)
 
-    w_counts = payload.get("witness_counts", {})
-    if w_counts:
-        w_rows = []
-        for position in ["Against", "For", "On"]:
-            w_rows.append(
-                {
-                    "Position": position,
-                    "Taxpayer Funded": int(w_counts.get("tfl", {}).get(position, 0)),
-                    "Private": int(w_counts.get("private", {}).get(position, 0)),
-                }
-            )
-        w_df = pd.DataFrame(w_rows)
-        if not w_df.empty and w_df[["Taxpayer Funded", "Private"]].sum().sum() > 0:
-            w_long = w_df.melt(id_vars="Position", var_name="Funding", value_name="Count")
-            fig_wit = px.bar(
-                w_long,
-                x="Position",
-                y="Count",
-                color="Funding",
-                barmode="group",
-                text="Count",
-                color_discrete_map={"Taxpayer Funded": "#ff6b6b", "Private": "#4c78a8"},
-            )
-            fig_wit.update_traces(textposition="outside", cliponaxis=False)
-            fig_wit.update_layout(
-                template="plotly_white",
-                title="Witness Positions by Funding Type",
-                yaxis_title="Positions",
-                xaxis_title="",
-                margin=dict(l=40, r=20, t=50, b=30),
-            )
-            _pdf_add_chart(pdf, fig_wit, "Chart 4. Witness Positions by Funding Type")
+    add_chart("witness")
 
     _pdf_add_section_title(pdf, "IV. THE BILLS MOST OPPOSED BY TAXPAYER-FUNDED LOBBYISTS")
     if payload.get("has_top_bills"):
@@ -12657,28 +13816,7 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
             "Against filings by taxpayer-funded lobbyists."
         )
         _pdf_add_paragraph(pdf, bills_p, size=11)
-        top_bills = payload.get("top_bills", [])
-        if top_bills:
-            bill_df = pd.DataFrame(
-                [{"Bill": b["id"], "Oppositions": b.get("tfl", 0)} for b in top_bills]
-            )
-            fig_bills = px.bar(
-                bill_df.sort_values("Oppositions"),
-                x="Oppositions",
-                y="Bill",
-                orientation="h",
-                text="Oppositions",
-                color_discrete_sequence=["#d14b4b"],
-            )
-            fig_bills.update_traces(textposition="outside", cliponaxis=False)
-            fig_bills.update_layout(
-                template="plotly_white",
-                title="Top Bills Opposed by Taxpayer-Funded Lobbyists",
-                xaxis_title="Oppositions",
-                yaxis_title="",
-                margin=dict(l=40, r=20, t=50, b=30),
-            )
-            _pdf_add_chart(pdf, fig_bills, "Chart 5. Top 5 Bills Opposed by Taxpayer-Funded Lobbyists")
+        add_chart("bills")
     else:
         _pdf_add_paragraph(pdf, "No bill-level opposition data was available for the selected scope/session.", size=11)
 
@@ -12690,28 +13828,7 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
             "local fiscal and regulatory authority."
         )
         _pdf_add_paragraph(pdf, subject_p, size=11)
-        top_subjects = payload.get("top_subjects", [])
-        if top_subjects:
-            subj_df = pd.DataFrame(
-                [{"Subject": s["Subject"], "Oppositions": s.get("Oppositions", 0)} for s in top_subjects]
-            )
-            fig_subjects = px.bar(
-                subj_df.sort_values("Oppositions"),
-                x="Oppositions",
-                y="Subject",
-                orientation="h",
-                text="Oppositions",
-                color_discrete_sequence=["#7aa6c2"],
-            )
-            fig_subjects.update_traces(textposition="outside", cliponaxis=False)
-            fig_subjects.update_layout(
-                template="plotly_white",
-                title="Top Policy Areas Opposed by Taxpayer-Funded Lobbyists",
-                xaxis_title="Oppositions",
-                yaxis_title="",
-                margin=dict(l=40, r=20, t=50, b=30),
-            )
-            _pdf_add_chart(pdf, fig_subjects, "Chart 6. Top 5 Policy Areas Opposed by Taxpayer-Funded Lobbyists")
+        add_chart("subjects")
     else:
         _pdf_add_paragraph(pdf, "No subject-level opposition data was available for the selected scope/session.", size=11)
 
@@ -12823,6 +13940,124 @@ def _build_report_pdf_bytes(payload: dict) -> bytes:
     output = pdf.output()
     return output if isinstance(output, (bytes, bytearray)) else output.encode("latin-1")
 
+# ---------------------------------------------------------
+# Report jobs: PDFs are built on a small thread pool shared by every session, so
+# the script run that clicked Generate returns at once and polls for progress.
+# Jobs are keyed by page, filters and dataset generation; an identical request
+# (from any session) attaches to the running or finished job instead of
+# starting another. Finished jobs are kept for _REPORT_JOB_KEEP_SECS.
+# ---------------------------------------------------------
+_REPORT_JOB_KEEP_SECS = 900
+_REPORT_JOB_POLL_SECS = 1.0
+REPORT_JOB_STAGES = {
+    "funding": "Compensation totals",
+    "opposition": "Witness positions and opposed bills",
+    "focus": "Focus section",
+    "charts": "Charts",
+    "layout": "PDF layout",
+}
+
+@st.cache_resource(show_spinner=False)
+def _report_job_registry() -> dict:
+    return {
+        "lock": threading.Lock(),
+        "jobs": {},
+        "pool": ThreadPoolExecutor(max_workers=REPORT_JOB_WORKERS, thread_name_prefix="report-job"),
+    }
+
+def _report_job_id(key_prefix: str, build_kwargs: dict) -> str:
+    h = hashlib.sha256()
+    for name in ("Lobby_TFL_Client_All", "Wit_All", "Bill_Status_All", "Bill_Sub_All"):
+        h.update(repr(_frame_cache_token(build_kwargs[name])).encode("utf-8"))
+    filters = (
+        key_prefix,
+        build_kwargs["session_val"],
+        build_kwargs["scope_label"],
+        build_kwargs["focus_label"],
+        build_kwargs["tfl_session_val"],
+    )
+    h.update(repr(filters).encode("utf-8"))
+    # The focus section is driven by focus_context, not the label: its scalar fields
+    # (type, lobbyshort, bill, display_name, ...) and the frames it reads.
+    fc = build_kwargs.get("focus_context") or {}
+    if isinstance(fc, dict):
+        scalars = sorted((k, v) for k, v in fc.items() if isinstance(v, (str, int, float, bool)) or v is None)
+        h.update(repr(scalars).encode("utf-8"))
+        for group in ("tables", "lookups"):
+            frames = fc.get(group) if isinstance(fc.get(group), dict) else {}
+            for name in sorted(frames):
+                if isinstance(frames[name], pd.DataFrame):
+                    h.update(repr((group, name, _frame_cache_token(frames[name]))).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+def _run_report_job(job: dict, build_kwargs: dict) -> None:
+    def progress(stage: str) -> None:
+        job["stage"] = REPORT_JOB_STAGES.get(stage, stage)
+        job["done"] = list(REPORT_JOB_STAGES).index(stage)
+
+    chart_errors = []
+    _PDF_CHART_ERROR_SINK.errors = chart_errors
+    try:
+        payload = _build_report_payload(**build_kwargs, progress=progress)
+        job["pdf"] = _coerce_pdf_bytes(_build_report_pdf_bytes(payload, progress=progress))
+        job["chart_error"] = chart_errors[0] if chart_errors else ""
+        job["done"] = len(REPORT_JOB_STAGES)
+        job["status"] = "done"
+    except Exception as exc:
+        job["error"] = str(exc)
+        job["status"] = "failed"
+    finally:
+        _PDF_CHART_ERROR_SINK.errors = None
+        job["finished"] = time.time()
+
+def _submit_report_job(key_prefix: str, build_kwargs: dict) -> str:
+    """Start (or join an identical) background report job; returns its id."""
+    job_id = _report_job_id(key_prefix, build_kwargs)
+    reg = _report_job_registry()
+    now = time.time()
+    with reg["lock"]:
+        for key, job in list(reg["jobs"].items()):
+            if job["status"] != "running" and now - job["finished"] > _REPORT_JOB_KEEP_SECS:
+                del reg["jobs"][key]
+        job = reg["jobs"].get(job_id)
+        if job is not None and job["status"] != "failed":
+            return job_id
+        job = {"status": "running", "stage": "Queued", "done": 0, "pdf": None, "error": "", "chart_error": "", "finished": 0.0}
+        reg["jobs"][job_id] = job
+    reg["pool"].submit(_script_ctx_runner(_run_report_job), job, build_kwargs)
+    return job_id
+
+def _report_job(job_id: str) -> dict | None:
+    return _report_job_registry()["jobs"].get(job_id)
+
+def _render_report_job_status(key_prefix: str, job_id: str, filename: str, polling: bool) -> None:
+    """Progress for a running report job; stores the PDF in session state once it is ready."""
+    job_key = f"{key_prefix}_report_job"
+    job = _report_job(job_id)
+    if job is None:
+        st.session_state.pop(job_key, None)
+        return
+    if job["status"] == "running":
+        st.progress(
+            job["done"] / len(REPORT_JOB_STAGES),
+            text=f"Generating PDF... {job['stage']}",
+        )
+        return
+
+    st.session_state.pop(job_key, None)
+    if job["status"] == "failed":
+        st.error(f"Report generation failed: {job['error']}")
+        return
+    if job["pdf"]:
+        st.session_state[f"{key_prefix}_report_pdf"] = job["pdf"]
+        st.session_state[f"{key_prefix}_report_name"] = filename
+        if job["chart_error"]:
+            st.session_state[PDF_CHART_ERROR_KEY] = job["chart_error"]
+        st.success("Report generated")
+    if polling:
+        # Finished while polling: rerun the page so the download button renders.
+        st.rerun()
+
 def _render_pdf_report_section(
     *,
     key_prefix: str,
@@ -12843,27 +14078,33 @@ def _render_pdf_report_section(
         sig_key = f"{key_prefix}_report_sig"
         pdf_key = f"{key_prefix}_report_pdf"
         name_key = f"{key_prefix}_report_name"
+        job_key = f"{key_prefix}_report_job"
         signature = f"{session_val}|{scope_label}|{focus_label}"
 
         if st.session_state.get(sig_key) != signature:
             st.session_state[sig_key] = signature
-            if pdf_key in st.session_state:
-                del st.session_state[pdf_key]
-            if name_key in st.session_state:
-                del st.session_state[name_key]
+            for key in (pdf_key, name_key, job_key):
+                if key in st.session_state:
+                    del st.session_state[key]
 
+        job = _report_job(st.session_state[job_key]) if job_key in st.session_state else None
         generate_clicked = st.button(
             "Generate report",
             key=f"{key_prefix}_report_build",
             width="stretch",
             help="Build a PDF using the current filters and selections.",
+            disabled=job is not None and job["status"] == "running",
         )
 
         if generate_clicked:
             _clear_pdf_chart_error()
+            for key in (pdf_key, name_key):
+                if key in st.session_state:
+                    del st.session_state[key]
             try:
-                with st.status("Generating PDF...", expanded=False):
-                    payload = _build_report_payload(
+                st.session_state[job_key] = _submit_report_job(
+                    key_prefix,
+                    dict(
                         session_val=session_val,
                         scope_label=scope_label,
                         focus_label=focus_label,
@@ -12873,15 +14114,23 @@ def _render_pdf_report_section(
                         Bill_Sub_All=Bill_Sub_All,
                         tfl_session_val=tfl_session_val,
                         focus_context=focus_context,
-                    )
-                    pdf_bytes = _coerce_pdf_bytes(_build_report_pdf_bytes(payload))
-                    if pdf_bytes and len(pdf_bytes) > 0:
-                        st.session_state[pdf_key] = pdf_bytes
-                        st.session_state[name_key] = f"tfl-report-{_slugify(focus_label)}.pdf"
-                        st.success("Report generated")
+                    ),
+                )
             except Exception as e:
                 st.error(f"Report generation failed: {str(e)}")
 
+        job_id = st.session_state.get(job_key)
+        if job_id:
+            filename = f"tfl-report-{_slugify(focus_label)}.pdf"
+            job = _report_job(job_id)
+            if job is not None and job["status"] == "running":
+                # Only this fragment reruns while the job is in flight; the page stays responsive.
+                st.fragment(run_every=_REPORT_JOB_POLL_SECS)(_render_report_job_status)(
+                    key_prefix, job_id, filename, polling=True
+                )
+            else:
+                _render_report_job_status(key_prefix, job_id, filename, polling=False)
+
         if pdf_key in st.session_state and st.session_state.get(PDF_CHART_ERROR_KEY):
             st.warning(
                 "PDF rendering encountered an issue (charts). "
@@ -12974,12 +14223,12 @@ def _apply_plotly_layout(
     )
     return fig
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def bill_position_from_flags(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(columns=["Session", "Bill", "LobbyShort", "Position"])
     agg = (
-        df.groupby(["Session", "Bill", "LobbyShort"], as_index=False)
+        df.groupby(["Session", "Bill", "LobbyShort"], as_index=False, observed=True)
           .agg(IsFor=("IsFor", "max"), IsAgainst=("IsAgainst", "max"), IsOn=("IsOn", "max"))
     )
     def pos_row(r):
@@ -12994,7 +14243,7 @@ def bill_position_from_flags(df: pd.DataFrame) -> pd.DataFrame:
     agg["Position"] = agg.apply(pos_row, axis=1)
     return agg[["Session", "Bill", "LobbyShort", "Position"]]
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_bills_with_status(
     wit: pd.DataFrame,
     bill_status_all: pd.DataFrame,
@@ -13010,14 +14259,17 @@ def build_bills_with_status(
 
     bills = bill_pos.copy()
     if not bill_status_all.empty and {"Session", "Bill"}.issubset(bill_status_all.columns):
-        bills = bill_pos.merge(bill_status_all, on=["Session", "Bill"], how="left")
+        status = bill_status_all
+        if bill_pos["Session"].astype(str).eq(str(session_val)).all():
+            status = session_rows(bill_status_all, session_val)
+        bills = bill_pos.merge(status, on=["Session", "Bill"], how="left")
 
     if not fiscal_impact.empty and {"Session", "Bill", "Version", "EstimatedTwoYearNetImpactGR"}.issubset(fiscal_impact.columns):
-        fi = fiscal_impact[fiscal_impact["Session"].astype(str).str.strip() == str(session_val)].copy()
+        fi = session_rows(fiscal_impact, session_val).copy()
         fi["Version"] = fi["Version"].astype(str).str.upper().str.strip()
         fi["EstimatedTwoYearNetImpactGR"] = pd.to_numeric(fi["EstimatedTwoYearNetImpactGR"], errors="coerce").fillna(0)
         fi_p = (
-            fi.groupby(["Session", "Bill", "Version"], as_index=False)["EstimatedTwoYearNetImpactGR"]
+            fi.groupby(["Session", "Bill", "Version"], as_index=False, observed=True)["EstimatedTwoYearNetImpactGR"]
             .sum()
             .pivot(index=["Session", "Bill"], columns="Version", values="EstimatedTwoYearNetImpactGR")
             .reset_index()
@@ -13028,16 +14280,16 @@ def build_bills_with_status(
     bills = ensure_cols(bills, {"Author": "", "Caption": "", "Status": "", "Fiscal Impact H": 0, "Fiscal Impact S": 0})
     return bills
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_policy_mentions(bills: pd.DataFrame, bill_sub_all: pd.DataFrame, session_val: str) -> pd.DataFrame:
     if bills.empty or bill_sub_all.empty or "Bill" not in bills.columns:
         return pd.DataFrame(columns=["Subject", "Mentions", "Share"])
     if "Subject" not in bill_sub_all.columns:
         return pd.DataFrame(columns=["Subject", "Mentions", "Share"])
 
-    bill_subjects = bill_sub_all.copy()
+    bill_subjects = bill_sub_all
     if "Session" in bill_subjects.columns:
-        bill_subjects = bill_subjects[bill_subjects["Session"].astype(str).str.strip() == str(session_val)].copy()
+        bill_subjects = session_rows(bill_subjects, session_val)
     bill_subjects = bill_subjects.merge(
         bills[["Bill"]].drop_duplicates(), on=["Bill"], how="inner"
     )
@@ -13054,7 +14306,7 @@ def build_policy_mentions(bills: pd.DataFrame, bill_sub_all: pd.DataFrame, sessi
     mentions["Share"] = (mentions["Mentions"] / total_mentions).fillna(0)
     return mentions
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_lobby_subject_counts(
     lobby_sub_all: pd.DataFrame,
     session_val: str,
@@ -13065,11 +14317,11 @@ def build_lobby_subject_counts(
     if lobby_sub_all.empty:
         return pd.DataFrame(columns=["Topic", "Mentions"]), 0.0
 
-    lobby_sub = lobby_sub_all.copy()
+    lobby_sub = lobby_sub_all
     if "Session" in lobby_sub.columns:
-        lobby_sub = lobby_sub[lobby_sub["Session"].astype(str).str.strip() == str(session_val)].copy()
+        lobby_sub = session_rows(lobby_sub, session_val)
     elif "session" in lobby_sub.columns:
-        lobby_sub = lobby_sub[lobby_sub["session"].astype(str).str.strip() == str(session_val)].copy()
+        lobby_sub = lobby_sub[lobby_sub["session"].astype(str).str.strip() == str(session_val)]
 
     if selected_filer_ids and "FilerID" in lobby_sub.columns:
         fid = pd.to_numeric(lobby_sub["FilerID"], errors="coerce").fillna(-1).astype(int)
@@ -13112,7 +14364,7 @@ def build_lobby_subject_counts(
     )
     return lobby_sub_counts, subject_non_empty
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_lobbyist_trend(
     df: pd.DataFrame,
     lobbyshort: str,
@@ -13133,7 +14385,7 @@ def build_lobbyist_trend(
     d["High_num"] = pd.to_numeric(d["High_num"], errors="coerce").fillna(0)
     d["Mid"] = (d["Low_num"] + d["High_num"]) / 2
     g = (
-        d.groupby(["Session", "IsTFL"], as_index=False)
+        d.groupby(["Session", "IsTFL"], as_index=False, observed=True)
         .agg(Mid=("Mid", "sum"))
     )
     g["Funding"] = g["IsTFL"].map({1: "Taxpayer Funded", 0: "Private"}).fillna("Private")
@@ -13142,7 +14394,7 @@ def build_lobbyist_trend(
     g["SessionLabel"] = g["SessionBase"].apply(_session_base_label)
     return g[["Session", "Funding", "Mid", "SessionBase", "SessionLabel"]]
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_top_clients(lt: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     if lt.empty or "Client" not in lt.columns:
         return pd.DataFrame(columns=["Client", "Funding", "Low", "High", "Mid"])
@@ -13271,8 +14523,11 @@ def resolve_lobbyshort(user_text: str, lobby_index: pd.DataFrame, name_to_short:
     if not d.empty and norm_variants:
         fuzzy_seed = max(norm_variants, key=len, default="")
         if len(fuzzy_seed) >= 3:
-            name_norms = d.get("LobbyNameCleanNorm", d.get("LobbyNameNorm", pd.Series(dtype=object))).dropna().unique().tolist()
-            close = difflib.get_close_matches(fuzzy_seed, name_norms, n=5, cutoff=0.78)
+            name_col = "LobbyNameCleanNorm" if "LobbyNameCleanNorm" in d.columns else "LobbyNameNorm"
+            close = []
+            if name_col in d.columns:
+                name_idx = _column_search_index(d, _frame_cache_token(d), name_col)
+                close = fuzzy_close_matches(name_idx, fuzzy_seed, n=5, cutoff=FUZZY_NAME_CUTOFF)
             if close:
                 close_set = set(close)
                 if "LobbyNameCleanNorm" in d.columns:
@@ -13302,7 +14557,7 @@ def resolve_lobbyshort_from_wit(user_text: str, wit_all: pd.DataFrame, session_v
 
     d = wit_all
     if session_val is not None and "Session" in d.columns:
-        d = d[d["Session"].astype(str).str.strip() == str(session_val)].copy()
+        d = session_rows(d, session_val).copy()
     if d.empty:
         return "", []
 
@@ -13390,7 +14645,158 @@ def lobby_candidate_key(cand: dict) -> str:
         return f"name:{norm_name(name)}"
     return "unknown"
 
-def lobbyist_autocomplete_candidates(query: str, lobbyist_index: pd.DataFrame, limit: int = 12) -> list[dict]:
+# ---------------------------------------------------------
+# Fuzzy matching: candidates are pruned with the character-multiset bound
+# (difflib's quick_ratio, which caps both scorers) before any pair is scored.
+# ---------------------------------------------------------
+def _ratio_score(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+def _indel_score(a: str, b: str) -> float:
+    """2 * LCS / (len(a) + len(b)), with the LCS from the bit-parallel recurrence."""
+    if not a or not b:
+        return 1.0 if a == b else 0.0
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    v = full
+    for ch in b:
+        u = v & masks.get(ch, 0)
+        v = (v + u) | (v - u)
+    lcs = len(a) - (v & full).bit_count()
+    return 2.0 * lcs / (len(a) + len(b))
+
+FUZZY_SCORERS = {"ratio": _ratio_score, "indel": _indel_score}
+
+def fuzzy_score(a: str, b: str) -> float:
+    return FUZZY_SCORERS.get(FUZZY_SCORER, _ratio_score)(a, b)
+
+def build_fuzzy_index(values) -> dict:
+    """Distinct values plus per-value character counts for bound pruning."""
+    uniq = sorted({str(v) for v in values if v is not None and str(v) != ""})
+    vocab = {ch: k for k, ch in enumerate(sorted({ch for v in uniq for ch in v}))}
+    counts = np.zeros((len(uniq), max(1, len(vocab))), dtype=np.uint16)
+    for i, v in enumerate(uniq):
+        for ch in v:
+            counts[i, vocab[ch]] += 1
+    return {
+        "values": uniq,
+        "vocab": vocab,
+        "char_counts": counts,
+        "lengths": np.array([len(v) for v in uniq], dtype=np.int64),
+    }
+
+def fuzzy_scores(idx: dict, q: str, cutoff: float, query_first: bool = False) -> list[tuple[float, str]]:
+    """(score, value) for every indexed value scoring >= cutoff against q.
+
+    query_first scores (q, value) like SequenceMatcher(None, q, value);
+    otherwise (value, q), the orientation get_close_matches uses.
+    """
+    if not idx["values"] or not q:
+        return []
+    qv = np.zeros(idx["char_counts"].shape[1], dtype=np.uint16)
+    for ch in q:
+        k = idx["vocab"].get(ch)
+        if k is not None:
+            qv[k] += 1
+    inter = np.minimum(idx["char_counts"], qv).sum(axis=1)
+    bound = 2.0 * inter / (idx["lengths"] + len(q))
+    scorer = FUZZY_SCORERS.get(FUZZY_SCORER, _ratio_score)
+    out = []
+    for i in np.flatnonzero(bound >= cutoff - 1e-9):
+        v = idx["values"][i]
+        score = scorer(q, v) if query_first else scorer(v, q)
+        if score >= cutoff:
+            out.append((score, v))
+    return out
+
+def fuzzy_close_matches(idx: dict, q: str, n: int = 3, cutoff: float = FUZZY_NAME_CUTOFF) -> list[str]:
+    """Drop-in for difflib.get_close_matches(q, values, n, cutoff) over an index (same order)."""
+    return [v for _, v in heapq.nlargest(n, fuzzy_scores(idx, q, cutoff))]
+
+# ---------------------------------------------------------
+# Text search indexes: exact / prefix / substring lookups over one normalized
+# column, answering the same rows as ==, .str.startswith and .str.contains
+# scans without touching every row.
+# ---------------------------------------------------------
+def build_text_index(values: pd.Series) -> dict:
+    """Index one normalized text column; lookups return row positions.
+
+    Distinct values are kept sorted for prefix ranges, with trigram postings
+    for substring queries and per-value character counts so close-match
+    scoring can skip values that cannot reach the cutoff.
+    """
+    by_value = _positions_by_value(values)
+    idx = build_fuzzy_index(by_value)
+    trigrams: dict[str, list[int]] = {}
+    for i, v in enumerate(idx["values"]):
+        for tri in {v[j:j + 3] for j in range(len(v) - 2)}:
+            trigrams.setdefault(tri, []).append(i)
+    idx["by_value"] = by_value
+    idx["trigrams"] = {k: np.array(v, dtype=np.int64) for k, v in trigrams.items()}
+    return idx
+
+def _text_index_rows(idx: dict, value_ids) -> np.ndarray:
+    parts = [idx["by_value"][idx["values"][i]] for i in value_ids]
+    if not parts:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(parts)
+
+def text_index_exact(idx: dict, q: str) -> np.ndarray:
+    return idx["by_value"].get(q, np.empty(0, dtype=np.int64))
+
+def text_index_prefix_values(idx: dict, q: str) -> list[int]:
+    values = idx["values"]
+    start = bisect.bisect_left(values, q)
+    end = start
+    while end < len(values) and values[end].startswith(q):
+        end += 1
+    return list(range(start, end))
+
+def text_index_prefix(idx: dict, q: str) -> np.ndarray:
+    return _text_index_rows(idx, text_index_prefix_values(idx, q))
+
+def text_index_contains_values(idx: dict, q: str) -> list[int]:
+    values = idx["values"]
+    if len(q) < 3:
+        return [i for i, v in enumerate(values) if q in v]
+    postings = []
+    for tri in {q[j:j + 3] for j in range(len(q) - 2)}:
+        hit = idx["trigrams"].get(tri)
+        if hit is None:
+            return []
+        postings.append(hit)
+    postings.sort(key=len)
+    cand = postings[0]
+    for hit in postings[1:]:
+        cand = np.intersect1d(cand, hit, assume_unique=True)
+        if not len(cand):
+            return []
+    return [int(i) for i in cand if q in values[i]]
+
+def text_index_contains(idx: dict, q: str) -> np.ndarray:
+    return _text_index_rows(idx, text_index_contains_values(idx, q))
+
+_LOBBYIST_SEARCH_COLS = (
+    "LobbyNameNorm",
+    "LobbyNameCleanNorm",
+    "LobbyShortNorm",
+    "LastFirstNorm",
+    "FirstLastNorm",
+    "LastFirstInitialNorm",
+    "LastNorm",
+    "FirstNorm",
+    "FirstInitial",
+)
+
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=4)
+def _lobbyist_search_index(_lobbyist_index: pd.DataFrame, token) -> dict:
+    # token (the frame's cache token) keys the entry; the frame itself is not hashed.
+    return {col: build_text_index(_lobbyist_index[col]) for col in _LOBBYIST_SEARCH_COLS if col in _lobbyist_index.columns}
+
+def lobbyist_autocomplete_candidates(query: str, lobbyist_index: pd.DataFrame, limit: int = 12,
+                                     search_index: dict | None = None) -> list[dict]:
     q = (query or "").strip()
     if not q or lobbyist_index.empty:
         return []
@@ -13406,62 +14812,71 @@ def lobbyist_autocomplete_candidates(query: str, lobbyist_index: pd.DataFrame, l
     q_initial = info.get("first_initial", "")
     q_first_variants = _nickname_variants(q_first) if q_first else set()
 
-    d = lobbyist_index.copy()
-    d["Score"] = 0
+    idx = search_index or _lobbyist_search_index(lobbyist_index, _frame_cache_token(lobbyist_index))
+    has_clean = "LobbyNameCleanNorm" in idx
+    scores: dict[int, int] = {}
+
+    def apply_score(rows, value: int) -> None:
+        for r in rows:
+            r = int(r)
+            if scores.get(r, 0) < value:
+                scores[r] = value
 
-    def apply_score(mask: pd.Series, value: int) -> None:
-        if mask.any():
-            d.loc[mask, "Score"] = d.loc[mask, "Score"].where(d.loc[mask, "Score"] > value, value)
+    def exact(col: str, v: str):
+        return text_index_exact(idx[col], v) if col in idx else ()
 
     if q_norm:
-        apply_score(d["LobbyNameNorm"] == q_norm, 100)
-        if "LobbyNameCleanNorm" in d.columns:
-            apply_score(d["LobbyNameCleanNorm"] == q_norm, 100)
-        apply_score(d["LobbyShortNorm"] == q_norm, 95)
+        apply_score(exact("LobbyNameNorm", q_norm), 100)
+        apply_score(exact("LobbyNameCleanNorm", q_norm), 100)
+        apply_score(exact("LobbyShortNorm", q_norm), 95)
 
     for n in q_variants:
         if not n:
             continue
-        if "LobbyNameCleanNorm" in d.columns:
-            apply_score(d["LobbyNameCleanNorm"] == n, 98)
-            apply_score(d["LobbyNameCleanNorm"].str.startswith(n, na=False), 94)
+        if has_clean:
+            apply_score(exact("LobbyNameCleanNorm", n), 98)
+            apply_score(text_index_prefix(idx["LobbyNameCleanNorm"], n), 94)
             if len(n) >= 3:
-                apply_score(d["LobbyNameCleanNorm"].str.contains(n, na=False), 80)
-        apply_score(d["LobbyNameNorm"] == n, 97)
-        apply_score(d["LobbyNameNorm"].str.startswith(n, na=False), 93)
+                apply_score(text_index_contains(idx["LobbyNameCleanNorm"], n), 80)
+        apply_score(exact("LobbyNameNorm", n), 97)
+        apply_score(text_index_prefix(idx["LobbyNameNorm"], n), 93)
         if len(n) >= 3:
-            apply_score(d["LobbyNameNorm"].str.contains(n, na=False), 78)
-            apply_score(d["LobbyShortNorm"].str.startswith(n, na=False), 85)
-            apply_score(d["LobbyShortNorm"].str.contains(n, na=False), 65)
-        if "LastFirstNorm" in d.columns:
-            apply_score(d["LastFirstNorm"] == n, 98)
-            apply_score(d["FirstLastNorm"] == n, 98)
-        if "LastFirstInitialNorm" in d.columns:
-            apply_score(d["LastFirstInitialNorm"] == n, 88)
+            apply_score(text_index_contains(idx["LobbyNameNorm"], n), 78)
+            apply_score(text_index_prefix(idx["LobbyShortNorm"], n), 85)
+            apply_score(text_index_contains(idx["LobbyShortNorm"], n), 65)
+        if "LastFirstNorm" in idx:
+            apply_score(exact("LastFirstNorm", n), 98)
+            apply_score(exact("FirstLastNorm", n), 98)
+        if "LastFirstInitialNorm" in idx:
+            apply_score(exact("LastFirstInitialNorm", n), 88)
 
     if q_last:
-        apply_score(d["LastNorm"] == q_last, 75)
-        if q_first:
-            apply_score((d["LastNorm"] == q_last) & (d["FirstNorm"] == q_first), 97)
-            if q_first_variants:
-                apply_score((d["LastNorm"] == q_last) & (d["FirstNorm"].isin(q_first_variants)), 95)
-            apply_score((d["LastNorm"] == q_last) & (d["FirstNorm"].str.startswith(q_first, na=False)), 90)
-        if q_initial:
-            apply_score((d["LastNorm"] == q_last) & (d["FirstInitial"] == q_initial), 86)
+        last_rows = exact("LastNorm", q_last)
+        apply_score(last_rows, 75)
+        if len(last_rows):
+            # Narrow to this surname, then test the first-name rules on those rows only.
+            d_last = lobbyist_index.iloc[last_rows]
+            first = d_last["FirstNorm"].astype(str)
+            if q_first:
+                apply_score(last_rows[(first == q_first).to_numpy()], 97)
+                if q_first_variants:
+                    apply_score(last_rows[first.isin(q_first_variants).to_numpy()], 95)
+                apply_score(last_rows[first.str.startswith(q_first, na=False).to_numpy()], 90)
+            if q_initial:
+                apply_score(last_rows[(d_last["FirstInitial"].astype(str) == q_initial).to_numpy()], 86)
 
     if q_norm and len(q_norm) >= 3:
-        name_norms = d.get("LobbyNameCleanNorm", d.get("LobbyNameNorm", pd.Series(dtype=object))).dropna().unique().tolist()
-        close = difflib.get_close_matches(q_norm, name_norms, n=8, cutoff=0.78)
-        if close:
-            if "LobbyNameCleanNorm" in d.columns:
-                apply_score(d["LobbyNameCleanNorm"].isin(close), 70)
-            else:
-                apply_score(d["LobbyNameNorm"].isin(close), 70)
+        name_col = "LobbyNameCleanNorm" if has_clean else "LobbyNameNorm"
+        if name_col in idx:
+            close = fuzzy_close_matches(idx[name_col], q_norm, n=8, cutoff=FUZZY_NAME_CUTOFF)
+            for v in close:
+                apply_score(text_index_exact(idx[name_col], v), 70)
 
-    d = d[d["Score"] > 0].copy()
-    if d.empty:
+    if not scores:
         return []
 
+    d = lobbyist_index.iloc[sorted(scores)].copy()
+    d["Score"] = [scores[r] for r in sorted(scores)]
     d = d.sort_values(["Score", "Lobby Name", "LobbyShort"], ascending=[False, True, True])
     out = []
     for _, row in d.head(limit).iterrows():
@@ -13475,7 +14890,7 @@ def lobbyist_autocomplete_candidates(query: str, lobbyist_index: pd.DataFrame, l
         })
     return out
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
 def build_client_index(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or "Client" not in df.columns:
         return pd.DataFrame(columns=["Client", "ClientNorm"])
@@ -13486,7 +14901,33 @@ def build_client_index(df: pd.DataFrame) -> pd.DataFrame:
     base = base[base["ClientNorm"] != ""].drop_duplicates()
     return base
 
-def resolve_client_name(user_text: str, client_index: pd.DataFrame) -> tuple[str, list[str]]:
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=8)
+def _column_search_index(_frame: pd.DataFrame, token, col: str) -> dict:
+    # token (the frame's cache token) keys the entry; the frame itself is not hashed.
+    return build_text_index(_frame[col])
+
+def _name_index_hits(labels: pd.Series, idx: dict, q_norms) -> dict[str, list[str]]:
+    """Labels whose key equals, starts with, or contains one of q_norms; each tier in frame order."""
+    def tier(lookup) -> list[str]:
+        parts = [lookup(idx, q) for q in q_norms]
+        rows = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+        return labels.iloc[rows].dropna().astype(str).drop_duplicates().tolist()
+
+    return {
+        "exact": tier(text_index_exact),
+        "prefix": tier(text_index_prefix),
+        "contains": tier(text_index_contains),
+    }
+
+def _name_index_close(labels: pd.Series, idx: dict, q_norm: str, limit: int = 10) -> list[str]:
+    close = fuzzy_close_matches(idx, q_norm, n=10, cutoff=FUZZY_NAME_CUTOFF) if q_norm else []
+    if not close:
+        return []
+    rows = np.unique(np.concatenate([text_index_exact(idx, v) for v in close]))
+    return labels.iloc[rows].dropna().astype(str).drop_duplicates().tolist()[:limit]
+
+def resolve_client_name(user_text: str, client_index: pd.DataFrame,
+                        search_index: dict | None = None) -> tuple[str, list[str]]:
     q = (user_text or "").strip()
     if not q or client_index.empty:
         return "", []
@@ -13494,29 +14935,17 @@ def resolve_client_name(user_text: str, client_index: pd.DataFrame) -> tuple[str
     if not q_norm:
         return "", []
 
-    d = client_index
-    exact = d[d["ClientNorm"] == q_norm]["Client"].dropna().astype(str).unique().tolist()
-    if len(exact) == 1:
-        return exact[0], []
+    idx = search_index or _column_search_index(client_index, _frame_cache_token(client_index), "ClientNorm")
+    hits = _name_index_hits(client_index["Client"], idx, [q_norm])
+    if len(hits["exact"]) == 1:
+        return hits["exact"][0], []
 
-    prefix = d[d["ClientNorm"].str.startswith(q_norm, na=False)]
-    contains = d[d["ClientNorm"].str.contains(q_norm, na=False)]
-    candidates = pd.concat([prefix, contains], ignore_index=True).drop_duplicates("Client")
-    suggestions = candidates["Client"].dropna().astype(str).tolist()[:10]
+    suggestions = list(dict.fromkeys(hits["prefix"] + hits["contains"]))[:10]
     if len(suggestions) == 1 and len(q_norm) >= 4:
         return suggestions[0], []
 
     if not suggestions:
-        norms = d["ClientNorm"].dropna().unique().tolist()
-        close = difflib.get_close_matches(q_norm, norms, n=10, cutoff=0.78)
-        if close:
-            suggestions = (
-                d[d["ClientNorm"].isin(close)]["Client"]
-                .dropna()
-                .astype(str)
-                .drop_duplicates()
-                .tolist()[:10]
-            )
+        suggestions = _name_index_close(client_index["Client"], idx, q_norm)
     return "", suggestions
 
 def _split_authors(text: str) -> list[str]:
@@ -13528,7 +14957,7 @@ def _split_authors(text: str) -> list[str]:
     parts = [p.strip() for p in s.split("|")]
     return [p for p in parts if p and p.lower() not in {"nan", "none"}]
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
 def build_author_bill_index(bs: pd.DataFrame) -> pd.DataFrame:
     if bs.empty:
         return pd.DataFrame(columns=["Session", "Bill", "Author", "AuthorNorm", "Status", "Caption", "Link", "Chamber"])
@@ -13548,7 +14977,7 @@ def build_author_bill_index(bs: pd.DataFrame) -> pd.DataFrame:
     cols = [c for c in ["Session", "Bill", "Author", "AuthorNorm", "Status", "Caption", "Link", "Chamber"] if c in d.columns]
     return d[cols].drop_duplicates()
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
 def build_member_index(author_bills: pd.DataFrame) -> pd.DataFrame:
     if author_bills.empty or "Author" not in author_bills.columns:
         return pd.DataFrame(columns=["Member", "MemberNorm"])
@@ -13557,10 +14986,7 @@ def build_member_index(author_bills: pd.DataFrame) -> pd.DataFrame:
     base = base[base["Member"].astype(str).str.strip() != ""].drop_duplicates()
     return base
 
-def resolve_member_name(user_text: str, member_index: pd.DataFrame) -> tuple[str, list[str]]:
-    q = (user_text or "").strip()
-    if not q or member_index.empty:
-        return "", []
+def _member_query_norms(q: str) -> set[str]:
     q_norms = {n for n in norm_person_variants(q) if n}
     last_norm = parse_member_name(q).get("last_norm", "")
     if last_norm:
@@ -13568,42 +14994,157 @@ def resolve_member_name(user_text: str, member_index: pd.DataFrame) -> tuple[str
     q_norm = norm_name(q)
     if q_norm:
         q_norms.add(q_norm)
+    return q_norms
+
+def resolve_member_name(user_text: str, member_index: pd.DataFrame,
+                        search_index: dict | None = None) -> tuple[str, list[str]]:
+    q = (user_text or "").strip()
+    if not q or member_index.empty:
+        return "", []
+    q_norms = _member_query_norms(q)
     if not q_norms:
         return "", []
+    q_norm = norm_name(q)
 
-    d = member_index
-    exact = d[d["MemberNorm"].isin(q_norms)]["Member"].dropna().astype(str).unique().tolist()
-    if len(exact) == 1:
-        return exact[0], []
-
-    prefix_mask = pd.Series(False, index=d.index)
-    contains_mask = pd.Series(False, index=d.index)
-    for qn in q_norms:
-        if not qn:
-            continue
-        prefix_mask = prefix_mask | d["MemberNorm"].str.startswith(qn, na=False)
-        contains_mask = contains_mask | d["MemberNorm"].str.contains(qn, na=False)
+    idx = search_index or _column_search_index(member_index, _frame_cache_token(member_index), "MemberNorm")
+    hits = _name_index_hits(member_index["Member"], idx, sorted(q_norms))
+    if len(hits["exact"]) == 1:
+        return hits["exact"][0], []
 
-    prefix = d[prefix_mask]
-    contains = d[contains_mask]
-    candidates = pd.concat([prefix, contains], ignore_index=True).drop_duplicates("Member")
-    suggestions = candidates["Member"].dropna().astype(str).tolist()[:10]
+    suggestions = list(dict.fromkeys(hits["prefix"] + hits["contains"]))[:10]
     if len(suggestions) == 1 and len(q_norm) >= 3:
         return suggestions[0], []
 
     if not suggestions:
-        norms = d["MemberNorm"].dropna().unique().tolist()
-        close = difflib.get_close_matches(q_norm, norms, n=10, cutoff=0.78) if q_norm else []
-        if close:
-            suggestions = (
-                d[d["MemberNorm"].isin(close)]["Member"]
-                .dropna()
-                .astype(str)
-                .drop_duplicates()
-                .tolist()[:10]
-            )
+        suggestions = _name_index_close(member_index["Member"], idx, q_norm)
     return "", suggestions
 
+# ---------------------------------------------------------
+# Top-nav search: one index over clients, legislators, lobbyists and bills,
+# built once per loaded dataset (workbook key "nav_search_index").
+# ---------------------------------------------------------
+NAV_SUGGESTION_LIMIT = 20
+_NAV_KIND_LABELS = {"client": "Client", "member": "Legislator", "lobbyist": "Lobbyist", "bill": "Bill"}
+_NAV_KIND_ORDER = {kind: i for i, kind in enumerate(_NAV_KIND_LABELS)}
+
+def build_nav_bill_table(bs: pd.DataFrame) -> pd.DataFrame:
+    """One row per bill number: the sessions it appears in and its latest caption."""
+    cols = ["Bill", "Session", "Sessions", "Caption"]
+    if bs.empty or "Bill" not in bs.columns:
+        return pd.DataFrame(columns=cols)
+    d = ensure_cols(bs[[c for c in ["Session", "Bill", "Caption"] if c in bs.columns]], {"Session": "", "Caption": ""})
+    bills = d["Bill"].fillna("").astype(str)
+    uniq = bills.unique()
+    d["Bill"] = bills.map(dict(zip(uniq, map(normalize_bill, uniq))))
+    d = d[d["Bill"] != ""].copy()
+    if d.empty:
+        return pd.DataFrame(columns=cols)
+    d["Session"] = d["Session"].fillna("").astype(str).str.strip()
+    d["Caption"] = d["Caption"].fillna("").astype(str).str.strip()
+    d["_sort"] = d["Session"].map({v: _session_sort_key(v) for v in d["Session"].unique()})
+    d = d.sort_values(["Bill", "_sort"], ascending=[True, False], kind="mergesort")
+    pairs = d.loc[d["Session"] != "", ["Bill", "Session"]].drop_duplicates()
+    sessions = pairs.groupby("Bill", sort=False)["Session"].agg(list).to_dict()
+    latest = d.drop_duplicates("Bill")[["Bill", "Session", "Caption"]].set_index("Bill")
+    latest["Sessions"] = [sessions.get(b, []) for b in latest.index]
+    return latest.reset_index()[cols]
+
+def build_nav_search_index(wb) -> dict:
+    """Entity frames plus their prebuilt text indexes; every nav lookup reads from here."""
+    clients = build_client_index(wb["Lobby_TFL_Client_All"])
+    members = build_member_index(build_author_bill_index(wb["Bill_Status_All"]))
+    bills = build_nav_bill_table(wb["Bill_Status_All"])
+    lobbyists = wb["lobbyist_index"]
+    return {
+        "client": {"frame": clients, "index": build_text_index(clients["ClientNorm"])},
+        "member": {"frame": members, "index": build_text_index(members["MemberNorm"])},
+        "lobbyist": {
+            "frame": lobbyists,
+            "index": _lobbyist_search_index(lobbyists, _frame_cache_token(lobbyists)),
+            "lobby_index": wb["lobby_index"],
+            "name_to_short": wb["name_to_short"],
+            "known_shorts": wb["known_shorts"],
+            "short_to_names": wb["short_to_names"],
+        },
+        "bill": {"frame": bills, "index": build_text_index(bills["Bill"])},
+    }
+
+def _nav_name_hits(entry: dict, label_col: str, q_norms, q_norm: str) -> list[tuple[str, int]]:
+    hits = _name_index_hits(entry["frame"][label_col], entry["index"], q_norms)
+    scored: dict[str, int] = {}
+    for tier, score in (("exact", 100), ("prefix", 94), ("contains", 80)):
+        for label in hits[tier]:
+            scored.setdefault(label, score)
+    if not scored:
+        for label in _name_index_close(entry["frame"][label_col], entry["index"], q_norm):
+            scored[label] = 70
+    return list(scored.items())[:10]
+
+def _nav_bill_hits(entry: dict, bill: str) -> list[dict]:
+    bills, idx = entry["frame"], entry["index"]
+    rows = np.unique(text_index_prefix(idx, bill))
+    hits = []
+    for r in rows:
+        row = bills.iloc[int(r)]
+        sessions = row["Sessions"]
+        caption = row["Caption"] if len(row["Caption"]) <= 80 else row["Caption"][:77].rstrip() + "..."
+        label = row["Bill"]
+        if sessions:
+            label += f" ({', '.join(sessions[:3])}{', ...' if len(sessions) > 3 else ''})"
+        if caption:
+            label += f" - {caption}"
+        hits.append({"value": row["Bill"], "label": label, "score": 100 if row["Bill"] == bill else 90})
+    hits.sort(key=lambda h: (-h["score"], len(h["value"]), h["value"]))
+    return hits[:10]
+
+def nav_search_suggestions(query: str, nav_index: dict, limit: int = NAV_SUGGESTION_LIMIT) -> list[dict]:
+    """Ranked mixed suggestions for the top nav: dicts with kind, label, value and score.
+
+    Bill-number queries only search bills; anything else searches clients,
+    legislators and lobbyists. Ties keep kind order (client, legislator,
+    lobbyist, bill), then each kind's own ranking.
+    """
+    q = (query or "").strip()
+    if not q:
+        return []
+    found: list[tuple[str, str, object, int]] = []
+    bill = normalize_bill(q)
+    if bill:
+        for h in _nav_bill_hits(nav_index["bill"], bill):
+            found.append(("bill", h["label"], h["value"], h["score"]))
+    else:
+        q_norm = norm_name(q)
+        client = nav_index["client"]
+        if q_norm and not client["frame"].empty:
+            for label, score in _nav_name_hits(client, "Client", [q_norm], q_norm):
+                found.append(("client", label, label, score))
+        member = nav_index["member"]
+        member_norms = _member_query_norms(q)
+        if member_norms and not member["frame"].empty:
+            for label, score in _nav_name_hits(member, "Member", sorted(member_norms), q_norm):
+                found.append(("member", label, label, score))
+        lobby = nav_index["lobbyist"]
+        candidates = lobbyist_autocomplete_candidates(q, lobby["frame"], search_index=lobby["index"])
+        for cand in candidates[:10]:
+            found.append(("lobbyist", cand["label"], cand, cand["score"]))
+        if not candidates:
+            _, fallback = resolve_lobbyshort(
+                q, lobby["lobby_index"], lobby["name_to_short"], lobby["known_shorts"], lobby["short_to_names"]
+            )
+            for s in fallback:
+                short_code = s.split(" - ")[0]
+                found.append(("lobbyist", s, {"lobbyshort": short_code, "name": short_code, "label": s, "filerid": None}, 60))
+
+    ranked = sorted(enumerate(found), key=lambda x: (-x[1][3], _NAV_KIND_ORDER[x[1][0]], x[0]))
+    out, seen = [], set()
+    for _, (kind, label, value, score) in ranked:
+        label = f"{_NAV_KIND_LABELS[kind]}: {label}"
+        if label in seen:
+            continue
+        seen.add(label)
+        out.append({"kind": kind, "label": label, "value": value, "score": score})
+    return out[:limit]
+
 def parse_member_name(member_name: str) -> dict:
     t = clean_person_name(member_name)
     if not t:
@@ -13634,7 +15175,7 @@ def parse_member_name(member_name: str) -> dict:
 def parse_person_name(person_name: str) -> dict:
     return parse_member_name(person_name)
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
 def build_lobbyist_index(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or "LobbyShort" not in df.columns or "Lobby Name" not in df.columns:
         return pd.DataFrame(columns=[
@@ -13685,13 +15226,11 @@ def member_match_mask(df: pd.DataFrame, member_info: dict) -> pd.Series:
     if df.empty:
         return pd.Series([], dtype=bool)
 
-    org = df.get("recipientNameOrganization", pd.Series([""] * len(df))).fillna("").astype(str)
-    last = df.get("recipientNameLast", pd.Series([""] * len(df))).fillna("").astype(str)
-    first = df.get("recipientNameFirst", pd.Series([""] * len(df))).fillna("").astype(str)
-
-    org_norm = norm_name_series(org)
-    last_norm = norm_name_series(last)
-    first_norm = norm_name_series(first)
+    # Normalized recipient columns are precomputed by load_workbook; only derive them for ad-hoc frames.
+    d = _with_recipient_norm_columns(df)
+    org_norm = d["RecipientOrgNorm"]
+    last_norm = d["RecipientLastNorm"]
+    first_norm = d["RecipientFirstNorm"]
 
     last_target = member_info.get("last_norm", "")
     first_target = member_info.get("first_norm", "")
@@ -13718,38 +15257,252 @@ def member_match_mask(df: pd.DataFrame, member_info: dict) -> pd.Series:
 
     return mask
 
+def add_recipient_norm_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Attach normalized recipient name columns for legislator matching (computed once at load)."""
+    if not isinstance(df, pd.DataFrame):
+        return df
+    return df.assign(**{col: norm_name_series(_text_col(df, src)) for col, src in _RECIPIENT_NORM_SOURCES.items()})
+
+def _with_recipient_norm_columns(d: pd.DataFrame) -> pd.DataFrame:
+    if all(c in d.columns for c in _RECIPIENT_NORM_SOURCES):
+        return d
+    return add_recipient_norm_columns(d)
+
+_ORG_NGRAM = 3
+
+def _ngrams(s: str) -> set[str]:
+    return {s[i:i + _ORG_NGRAM] for i in range(len(s) - _ORG_NGRAM + 1)}
+
+def build_recipient_row_index(df: pd.DataFrame) -> dict:
+    """Inverted index from recipient last name, and organization-name trigrams, to row positions."""
+    if not isinstance(df, pd.DataFrame) or df.empty or not all(c in df.columns for c in _RECIPIENT_NORM_SOURCES):
+        return {}
+    org_rows = _positions_by_value(df["RecipientOrgNorm"])
+    org_values = list(org_rows)
+    grams: dict[str, list[int]] = {}
+    for i, v in enumerate(org_values):
+        for g in _ngrams(v):
+            grams.setdefault(g, []).append(i)
+    return {
+        "source": _frame_cache_token(df),  # as in build_filer_row_index
+        "last": _positions_by_value(df["RecipientLastNorm"]),
+        "org_values": org_values,
+        "org_rows": [org_rows[v] for v in org_values],
+        "org_grams": {g: np.asarray(ix, dtype=np.int64) for g, ix in grams.items()},
+    }
+
+def _recipient_org_positions(row_index: dict, pattern: str) -> list[np.ndarray] | None:
+    """Row positions whose organization contains pattern, or None when it is too short to index."""
+    if len(pattern) < _ORG_NGRAM:
+        return None
+    grams = row_index.get("org_grams", {})
+    ids = None
+    for g in _ngrams(pattern):
+        hit = grams.get(g)
+        if hit is None:
+            return []
+        ids = hit if ids is None else np.intersect1d(ids, hit, assume_unique=True)
+        if not len(ids):
+            return []
+    values = row_index["org_values"]
+    return [row_index["org_rows"][i] for i in ids if pattern in values[i]]
+
+def _member_index_candidates(df: pd.DataFrame, row_index: dict | None, member_info: dict) -> pd.DataFrame | None:
+    """Rows that can satisfy member_match_mask, or None when the index does not apply to df."""
+    if not row_index or row_index.get("source") != _frame_cache_token(df):
+        return None
+    last_target = member_info.get("last_norm", "")
+    full_norm = member_info.get("full_norm", "")
+    pattern = full_norm or (last_target if len(last_target) >= 4 else "")
+    hits = []
+    if last_target and last_target in row_index.get("last", {}):
+        hits.append(row_index["last"][last_target])
+    if pattern:
+        org_hits = _recipient_org_positions(row_index, pattern)
+        if org_hits is None:
+            return None
+        hits.extend(org_hits)
+    if not hits:
+        return df.iloc[0:0]
+    return df.take(np.unique(np.concatenate(hits)))
+
 def map_filer_to_lobbyshort(df: pd.DataFrame, name_to_short: dict, filerid_to_short: dict | None) -> pd.DataFrame:
     if df.empty:
         return df
-    d = df.copy()
-    filerid_map = filerid_to_short or {}
+    d = _with_filer_norm_columns(df, name_to_short, filerid_to_short)
+    if d is df:
+        d = df.copy()
     short = pd.Series([""] * len(d), index=d.index)
+    if filerid_to_short:
+        short = d["FilerShortFromId"].astype(object).fillna("")
 
-    if "filerIdent" in d.columns and filerid_map:
-        fid = pd.to_numeric(d["filerIdent"], errors="coerce").fillna(-1).astype(int)
-        short = fid.map(filerid_map).fillna("")
+    short = short.where(short.astype(str).str.strip() != "", d["FilerShortMapped"].astype(object))
+    d["LobbyShort"] = short.fillna("")
+    return d
 
-    filer_name = d.get("filerName", pd.Series([""] * len(d)))
-    filer_sort = d.get("filerSort", pd.Series([""] * len(d)))
-    if isinstance(filer_name, pd.DataFrame):
-        filer_name = filer_name.iloc[:, 0]
-    if isinstance(filer_sort, pd.DataFrame):
-        filer_sort = filer_sort.iloc[:, 0]
+# ---------------------------------------------------------
+# Activities fact table: the six La activity tables reshaped once into the
+# schema the activity views show, with parsed dates and filer / recipient keys.
+# Views pick their source rows with the usual filer / member filters, then
+# slice this table instead of reshaping and re-parsing per request.
+# The disclosures fact table below follows the same layout.
+# ---------------------------------------------------------
+ACTIVITY_TYPES = {
+    "LaFood": "Food",
+    "LaEnt": "Entertainment",
+    "LaTran": "Travel",
+    "LaGift": "Gift",
+    "LaEvnt": "Event",
+    "LaAwrd": "Award",
+}
+_ACTIVITY_DATE_COLS = {
+    "LaFood": ("activityDate", "periodStartDt"),
+    "LaEnt": ("activityDate", "periodStartDt"),
+    "LaTran": ("departureDt", "checkInDt", "periodStartDt"),
+    "LaGift": ("periodStartDt",),
+    "LaEvnt": ("activityDate", "periodStartDt"),
+    "LaAwrd": ("periodStartDt",),
+}
+_ACTIVITY_DESC_COLS = {
+    "LaFood": "restaurantName",
+    "LaEnt": "entertainmentName",
+    "LaGift": "activityDescription",
+    "LaEvnt": "activityDescription",
+    "LaAwrd": "activityDescription",
+}
+_ACTIVITY_VIEW_COLS = ["Session", "Date", "Type", "Filer", "Member", "Description", "Amount"]
+
+def _text_col(d: pd.DataFrame, col: str) -> pd.Series:
+    if col not in d.columns:
+        return pd.Series("", index=d.index, dtype=object)
+    return d[col].fillna("").astype(str)
+
+def activity_date_sort(dates: pd.Series) -> pd.Series:
+    """Parse activity date text (YYYYMMDD, also as YYYYMMDD.0 from float columns) to datetimes."""
+    s = dates.fillna("").astype(str).str.strip().str.replace(r"\.0$", "", regex=True)
+    compact = s.str.fullmatch(r"\d{8}")
+    out = pd.to_datetime(s.where(compact), format="%Y%m%d", errors="coerce")
+    other = ~compact & s.ne("")
+    if other.any():
+        out[other] = pd.to_datetime(s[other], format="mixed", errors="coerce")
+    return out
 
-    filer_clean = clean_filer_name_series(filer_name)
-    norm_raw = norm_name_series(filer_name)
-    norm_clean = norm_name_series(filer_clean)
-    norm_sort = norm_name_series(filer_sort)
+def _activity_fact_part(key: str, d: pd.DataFrame) -> pd.DataFrame:
+    date_col = next((c for c in _ACTIVITY_DATE_COLS[key] if c in d.columns), None)
+    date = _text_col(d, date_col) if date_col else pd.Series("", index=d.index, dtype=object)
+    if key == "LaTran":
+        desc = _text_col(d, "travelPurpose")
+        desc = desc.where(desc.str.len() > 0, _text_col(d, "transportationTypeDescr"))
+        route = (_text_col(d, "departureCity") + " -> " + _text_col(d, "arrivalCity")).str.strip()
+        desc = (desc + " | " + route).str.replace(r"\s+\|\s+$", "", regex=True)
+    else:
+        desc = _text_col(d, _ACTIVITY_DESC_COLS[key])
+    has_amount = key not in {"LaTran", "LaEvnt"}
+    part = pd.DataFrame({
+        "Session": _text_col(d, "Session"),
+        "Date": date,
+        "DateSort": activity_date_sort(date),
+        "Type": ACTIVITY_TYPES[key],
+        "Filer": _text_col(d, "filerName"),
+        "Member": person_display_series(d).fillna("").astype(str),
+        "Description": desc,
+        "Amount": amount_display_series(d).fillna("").astype(str) if has_amount else "",
+        "Source": key,
+        "SourceRow": np.arange(len(d), dtype=np.int64),
+    })
+    for col in _FILER_NORM_COLS:
+        if col in d.columns:
+            part[col] = d[col]
+    recipients = _with_recipient_norm_columns(d)
+    for col in _RECIPIENT_NORM_SOURCES:
+        part[col] = recipients[col]
+    return part.reset_index(drop=True)
+
+def build_activity_facts(tables: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One row per activity across the La activity tables, in table then row order."""
+    parts = [
+        _activity_fact_part(key, df)
+        for key, df in tables.items()
+        if key in ACTIVITY_TYPES and isinstance(df, pd.DataFrame) and not df.empty
+    ]
+    if not parts:
+        return pd.DataFrame(columns=_ACTIVITY_VIEW_COLS + ["DateSort", "Source", "SourceRow"])
+    facts = pd.concat(parts, ignore_index=True)
+    facts["Type"] = pd.Categorical(facts["Type"], categories=sorted(ACTIVITY_TYPES.values()))
+    facts["Source"] = pd.Categorical(facts["Source"], categories=list(ACTIVITY_TYPES))
+    return facts
+
+def _fact_block(facts: pd.DataFrame | None, sources: dict, key: str) -> tuple[int, int] | None:
+    if not isinstance(facts, pd.DataFrame) or facts.empty or "Source" not in facts.columns:
+        return None
+    codes = facts["Source"].cat.codes.to_numpy()
+    code = list(sources).index(key)
+    return int(np.searchsorted(codes, code, "left")), int(np.searchsorted(codes, code, "right"))
+
+def _fact_source_matches(facts: pd.DataFrame, src: pd.DataFrame, key: str) -> bool:
+    """True when facts was built by load_workbook from this very table (same dataset token)."""
+    fact_token, src_token = _registered_token(facts), _registered_token(src)
+    if fact_token is None or src_token is None:
+        return False
+    return src_token == f"{fact_token.rsplit(':', 1)[0]}:{key}"
+
+def _select_fact_rows(
+    facts: pd.DataFrame | None,
+    tables: dict[str, pd.DataFrame],
+    selected: dict[str, pd.DataFrame],
+    sources: dict,
+    build,
+) -> list[pd.DataFrame]:
+    """Fact rows for the selected rows of each source table, in table then row order.
+
+    Rows are sliced out of the load-time fact table when it was built from the
+    source table; otherwise the selected rows are reshaped with build.
+    """
+    parts = []
+    for key in sources:
+        sel = selected.get(key)
+        if sel is None or sel.empty:
+            continue
+        src = tables.get(key)
+        block = _fact_block(facts, sources, key)
+        pos = None
+        if (
+            block is not None
+            and isinstance(src, pd.DataFrame)
+            and block[1] - block[0] == len(src)
+            and src.index.is_unique
+            and _fact_source_matches(facts, src, key)
+        ):
+            pos = src.index.get_indexer(sel.index)
+            if (pos < 0).any():
+                pos = None
+        if pos is not None:
+            parts.append(facts.iloc[block[0] + pos])
+        else:
+            parts.append(build({key: sel}))
+    return parts
 
-    mapped = norm_raw.map(name_to_short)
-    mapped = mapped.where(mapped.notna(), norm_clean.map(name_to_short))
-    mapped = mapped.where(mapped.notna(), norm_sort.map(name_to_short))
+def select_activity_facts(
+    facts: pd.DataFrame | None,
+    tables: dict[str, pd.DataFrame],
+    selected: dict[str, pd.DataFrame],
+) -> pd.DataFrame:
+    parts = _select_fact_rows(facts, tables, selected, ACTIVITY_TYPES, build_activity_facts)
+    if not parts:
+        return pd.DataFrame(columns=_ACTIVITY_VIEW_COLS + ["DateSort"])
+    out = pd.concat(parts, ignore_index=True)
+    out["Type"] = out["Type"].astype(str)
+    return out
 
-    short = short.where(short.astype(str).str.strip() != "", mapped)
-    d["LobbyShort"] = short.fillna("")
-    return d
+def _sorted_fact_view(facts: pd.DataFrame, cols: list[str], sort_cols: list[str]) -> pd.DataFrame:
+    result = facts[cols].copy()
+    for c in cols:
+        result[c] = result[c].fillna("").astype(str)
+    return result.assign(_date_sort=facts["DateSort"]).sort_values(
+        ["_date_sort"] + sort_cols, ascending=[False] + [True] * len(sort_cols)
+    ).drop(columns=["_date_sort"])
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_member_activities(
     df_food,
     df_ent,
@@ -13762,14 +15515,19 @@ def build_member_activities(
     name_to_short: dict,
     filerid_to_short: dict | None,
     lobbyshort_to_name: dict | None = None,
+    _facts: pd.DataFrame | None = None,
+    _row_indexes: dict | None = None,
 ) -> pd.DataFrame:
     member_info = parse_member_name(member_name)
     lobbyshort_to_name = lobbyshort_to_name or {}
+    row_indexes = _row_indexes or {}
 
-    def keep(df: pd.DataFrame) -> pd.DataFrame:
-        d = df.copy()
+    def keep(df: pd.DataFrame, key: str) -> pd.DataFrame:
+        # Narrow to indexed candidates first; member_match_mask still decides the exact match.
+        cand = _member_index_candidates(df, row_indexes.get(key), member_info)
+        d = (df if cand is None else cand).copy()
         if session is not None and "Session" in d.columns:
-            d = d[d["Session"].astype(str).str.strip() == str(session)].copy()
+            d = session_rows(d, session).copy()
         if d.empty:
             return d
         mask = member_match_mask(d, member_info)
@@ -13786,114 +15544,18 @@ def build_member_activities(
         filer = d.get("filerName", pd.Series([""] * len(d))).fillna("").astype(str)
         return mapped.where(mapped.astype(str).str.strip().ne(""), filer)
 
-    out = []
-
-    d = keep(df_food)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Food",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": d.get("restaurantName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_ent)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Entertainment",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": d.get("entertainmentName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_tran)
-    if not d.empty:
-        desc = d.get("travelPurpose", pd.Series([""] * len(d))).fillna("").astype(str)
-        fallback = d.get("transportationTypeDescr", pd.Series([""] * len(d))).fillna("").astype(str)
-        desc = desc.where(desc.str.len() > 0, fallback)
-        route = (d.get("departureCity", "").fillna("").astype(str) + " -> " + d.get("arrivalCity", "").fillna("").astype(str)).str.strip()
-        desc2 = (desc + " | " + route).str.replace(r"\s+\|\s+$", "", regex=True)
-        date = d.get("departureDt", d.get("checkInDt", d.get("periodStartDt", ""))).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Travel",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": desc2,
-            "Amount": "",
-        }))
-
-    d = keep(df_gift)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Gift",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_evnt)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Event",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": "",
-        }))
-
-    d = keep(df_awrd)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Award",
-            "LobbyShort": d.get("LobbyShort", ""),
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": member_name,
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    if not out:
+    frames = dict(zip(ACTIVITY_TYPES, (df_food, df_ent, df_tran, df_gift, df_evnt, df_awrd)))
+    selected = {key: keep(df, key) for key, df in frames.items()}
+    facts = select_activity_facts(_facts, frames, selected)
+    if facts.empty:
         return pd.DataFrame(columns=["Session", "Date", "Type", "LobbyShort", "Lobbyist", "Filer", "Member", "Description", "Amount"])
 
-    result = pd.concat(out, ignore_index=True)
-    for c in ["Session", "Date", "LobbyShort", "Lobbyist", "Filer", "Member", "Description", "Amount"]:
-        result[c] = result[c].fillna("").astype(str)
-    date_sort = pd.to_datetime(result["Date"], errors="coerce")
-    result = result.assign(_date_sort=date_sort).sort_values(
-        ["_date_sort", "Type", "Lobbyist", "Member"], ascending=[False, True, True, True]
-    ).drop(columns=["_date_sort"])
-    return result
+    matched = [d for d in selected.values() if not d.empty]
+    facts["LobbyShort"] = pd.concat([d.get("LobbyShort", pd.Series("", index=d.index)) for d in matched]).to_numpy()
+    facts["Lobbyist"] = pd.concat([lobbyist_display(d) for d in matched]).to_numpy()
+    facts["Member"] = member_name
+    cols = ["Session", "Date", "Type", "LobbyShort", "Lobbyist", "Filer", "Member", "Description", "Amount"]
+    return _sorted_fact_view(facts, cols, ["Type", "Lobbyist", "Member"])
 
 def normalize_bill(q: str) -> str:
     s = (q or "").strip().upper()
@@ -13915,10 +15577,7 @@ def render_bill_search_results(bill_query: str, session_val: str | None, tfl_ses
     if not q:
         return False
 
-    d = wit_all.copy()
-    d["Session"] = d["Session"].astype(str).str.strip()
-    if session_val is not None:
-        d = d[d["Session"] == str(session_val)].copy()
+    d = session_scope(wit_all, session_val)
 
     d_bill_norm = d["Bill"].astype(str).str.upper().str.replace(r"\s+", " ", regex=True)
     d = d[d_bill_norm == q].copy()
@@ -13927,10 +15586,7 @@ def render_bill_search_results(bill_query: str, session_val: str | None, tfl_ses
     if "LobbyShortNorm" not in d.columns:
         d["LobbyShortNorm"] = norm_name_series(d["LobbyShort"])
 
-    tfl = lobby_tfl_client_all.copy()
-    tfl["Session"] = tfl["Session"].astype(str).str.strip()
-    if tfl_session_val is not None:
-        tfl = tfl[tfl["Session"] == str(tfl_session_val)].copy()
+    tfl = session_scope(lobby_tfl_client_all, tfl_session_val)
     tfl = ensure_cols(tfl, {"LobbyShort": ""})
     if "LobbyShortNorm" not in tfl.columns:
         tfl["LobbyShortNorm"] = norm_name_series(tfl["LobbyShort"])
@@ -13958,17 +15614,11 @@ def render_bill_search_results(bill_query: str, session_val: str | None, tfl_ses
         return True
 
     pos = bill_position_from_flags(d)
-    bs = bill_status_all.copy()
-    bs["Session"] = bs["Session"].astype(str).str.strip()
-    if session_val is not None:
-        bs = bs[bs["Session"] == str(session_val)].copy()
+    bs = session_scope(bill_status_all, session_val)
 
     merged = pos.merge(bs, on=["Session", "Bill"], how="left")
     merged["Lobbyist"] = merged["LobbyShort"].map(lambda s: _candidate_label(str(s), short_to_names))
-    tfl = lobby_tfl_client_all.copy()
-    tfl["Session"] = tfl["Session"].astype(str).str.strip()
-    if tfl_session_val is not None:
-        tfl = tfl[tfl["Session"] == str(tfl_session_val)].copy()
+    tfl = session_scope(lobby_tfl_client_all, tfl_session_val)
     tfl = ensure_cols(tfl, {"LobbyShort": "", "IsTFL": 0})
     tfl_flag = (
         tfl.groupby("LobbyShort", as_index=False)["IsTFL"]
@@ -14065,256 +15715,352 @@ def safe_read_excel_xf(xf: pd.ExcelFile, sheet_name: str, cols: list[str]) -> pd
 def _empty_df(cols: list[str]) -> pd.DataFrame:
     return pd.DataFrame(columns=cols)
 
+def _numpy_non_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Arrow-backed read: text stays Arrow; numbers and dates get the usual NumPy dtypes."""
+    import pyarrow as pa
+
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.ArrowDtype) and not is_arrow_string(df[col]):
+            df[col] = pd.Series(pa.array(df[col].array).to_pandas(), index=df.index)
+    return df
+
 def read_parquet_cols(path: Path, cols: list[str]) -> pd.DataFrame:
+    backend = {"dtype_backend": "pyarrow"} if ARROW_STRINGS else {}
     try:
         import pyarrow.parquet as pq
         pf = pq.ParquetFile(path)
         available = set(pf.schema.names)
         use_cols = [c for c in cols if c in available]
         if use_cols:
-            return pd.read_parquet(path, columns=use_cols)
-        return pd.read_parquet(path)
+            df = pd.read_parquet(path, columns=use_cols, **backend)
+        else:
+            df = pd.read_parquet(path, **backend)
     except Exception:
         try:
-            df = pd.read_parquet(path)
+            df = pd.read_parquet(path, **backend)
             keep = [c for c in cols if c in df.columns]
-            return df[keep].copy() if keep else df
+            df = df[keep].copy() if keep else df
         except Exception:
             return pd.DataFrame(columns=cols)
+    return _numpy_non_strings(df) if backend else df
+
+WORKBOOK_CFG = {
+    "Wit_All": ["session", "bill", "position", "LobbyShort", "name", "org"],
+    "Bill_Status_All": ["Session", "Bill", "Authors", "Author", "Caption", "Status"],
+    "Fiscal_Impact": ["Session", "Bill", "Version", "EstimatedTwoYearNetImpactGR"],
+    "Bill_Sub_All": ["Session", "Bill", "Subject"],
+    "Lobby_Sub_All": [
+        "Session",
+        "legislative_session",
+        "Subject Matter",
+        "Other Subject Matter Description",
+        "Primary Business",
+        "FilerID",
+        "LobbyShort",
+        "lobbyshort",
+        "Lobby Name",
+        "Unnamed: 0",
+    ],
+    "Lobbyist_Pol_Funds": [],
+    "Lobby_TFL_Client_All": ["Session", "Client", "Lobby Name", "LobbyShort", "IsTFL", "Low", "High", "Amount", "Mid", "FilerID"],
+    "Staff_All": ["Session", "session", "Legislator", "member_or_committee", "legislator_name", "Title", "role",
+                  "Staffer", "name", "staff_name_last_initial", "lobby name", "source"],
+    "LaFood": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+               "restaurantName", "activityDate", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
+    "LaEnt": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+              "entertainmentName", "activityDate", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
+    "LaTran": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+               "travelPurpose", "transportationTypeDescr", "departureCity", "arrivalCity", "checkInDt", "checkOutDt", "departureDt", "periodStartDt"],
+    "LaGift": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+               "activityDescription", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
+    "LaEvnt": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+               "activityDescription", "activityDate", "periodStartDt"],
+    "LaAwrd": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
+               "activityDescription", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
+    "LaCvr": ["Session", "filerIdent", "filerName", "filerSort", "filedDt", "periodStartDt", "sourceCategoryCd",
+              "subjectMatterMemo", "docketsMemo", "filerNameOrganization"],
+    "LaDock": ["Session", "filerIdent", "filerName", "filerSort", "receivedDt", "periodStartDt", "designationText", "agencyName"],
+    "LaI4E": ["Session", "filerIdent", "filerName", "filerSort", "periodStartDt", "onbehalfName",
+              "onbehalfMailingCity", "onbehalfPrimaryPhoneNumber"],
+    "LaSub": ["Session", "filerIdent", "filerName", "filerSort", "periodStartDt", "subjectMatterCodeValue", "subjectMatterDescr"],
+}
+
+WORKBOOK_PARQUET_MAP = {
+    "Wit_All": ["Witness_Lists.parquet", "Witness List.parquet", "Witness_List.parquet", "witnesslist.parquet"],
+    "Bill_Status_All": "Bill_Status.parquet",
+    "Fiscal_Impact": "Fiscal_Notes.parquet",
+    "Bill_Sub_All": "Bill_Sub_All.parquet",
+    "Lobby_Sub_All": "Lobby.Sub.parquet",
+    "Lobbyist_Pol_Funds": "Lobbyist.Pol.Funds.parquet",
+    "Lobby_TFL_Client_All": "Lobby_TFL_Client_All.parquet",
+    "Staff_All": ["Staff.parquet", "staff.parquet"],
+    "LaFood": "LaFood.parquet",
+    "LaEnt": "LaEnt.parquet",
+    "LaTran": "LaTran.parquet",
+    "LaGift": "LaGift.parquet",
+    "LaEvnt": "LaEvnt.parquet",
+    "LaAwrd": "LaAwrd.parquet",
+    "LaCvr": "LaCvr.parquet",
+    "LaDock": "LaDock.parquet",
+    "LaI4E": "LaI4E.parquet",
+    "LaSub": "LaSub.parquet",
+}
+
+# pyarrow releases the GIL while decoding, so table reads overlap well in threads.
+WORKBOOK_READ_WORKERS = max(1, int(os.environ.get("WORKBOOK_READ_WORKERS", "8") or 8))
+
+_PENDING = object()
+
+class LazyTables(dict):
+    """Dict whose values are built on first access.
+
+    Each loader receives the mapping itself so it can pull its dependencies;
+    resolution is serialized with a re-entrant lock because Streamlit sessions
+    share the cached workbook across threads.
+    """
 
-@st.cache_resource(show_spinner=False, ttl=600, max_entries=2)
-def load_workbook(path: str) -> dict:
-    cfg = {
-        "Wit_All": ["session", "bill", "position", "LobbyShort", "name", "org"],
-        "Bill_Status_All": ["Session", "Bill", "Authors", "Author", "Caption", "Status"],
-        "Fiscal_Impact": ["Session", "Bill", "Version", "EstimatedTwoYearNetImpactGR"],
-        "Bill_Sub_All": ["Session", "Bill", "Subject"],
-        "Lobby_Sub_All": [
-            "Session",
-            "legislative_session",
-            "Subject Matter",
-            "Other Subject Matter Description",
-            "Primary Business",
-            "FilerID",
-            "LobbyShort",
-            "lobbyshort",
-            "Lobby Name",
-            "Unnamed: 0",
-        ],
-        "Lobbyist_Pol_Funds": [],
-        "Lobby_TFL_Client_All": ["Session", "Client", "Lobby Name", "LobbyShort", "IsTFL", "Low", "High", "Amount", "Mid", "FilerID"],
-        "Staff_All": ["Session", "session", "Legislator", "member_or_committee", "legislator_name", "Title", "role",
-                      "Staffer", "name", "staff_name_last_initial", "lobby name", "source"],
-        "LaFood": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                   "restaurantName", "activityDate", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
-        "LaEnt": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                  "entertainmentName", "activityDate", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
-        "LaTran": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                   "travelPurpose", "transportationTypeDescr", "departureCity", "arrivalCity", "checkInDt", "checkOutDt", "departureDt", "periodStartDt"],
-        "LaGift": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                   "activityDescription", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
-        "LaEvnt": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                   "activityDescription", "activityDate", "periodStartDt"],
-        "LaAwrd": ["Session", "applicableYear", "filerIdent", "filerName", "filerSort", "recipientNameOrganization", "recipientNameLast", "recipientNameFirst",
-                   "activityDescription", "periodStartDt", "activityExactAmount", "activityAmountRangeLow", "activityAmountRangeHigh", "activityAmountCd"],
-        "LaCvr": ["Session", "filerIdent", "filerName", "filerSort", "filedDt", "periodStartDt", "sourceCategoryCd",
-                  "subjectMatterMemo", "docketsMemo", "filerNameOrganization"],
-        "LaDock": ["Session", "filerIdent", "filerName", "filerSort", "receivedDt", "periodStartDt", "designationText", "agencyName"],
-        "LaI4E": ["Session", "filerIdent", "filerName", "filerSort", "periodStartDt", "onbehalfName",
-                  "onbehalfMailingCity", "onbehalfPrimaryPhoneNumber"],
-        "LaSub": ["Session", "filerIdent", "filerName", "filerSort", "periodStartDt", "subjectMatterCodeValue", "subjectMatterDescr"],
-    }
-
-    base = Path(path)
-    if not base.exists():
-        return {k: _empty_df(v) for k, v in cfg.items()}
-    if base.is_dir():
-        parquet_map = {
-        "Wit_All": ["Witness_Lists.parquet", "Witness List.parquet", "Witness_List.parquet", "witnesslist.parquet"],
-            "Bill_Status_All": "Bill_Status.parquet",
-            "Fiscal_Impact": "Fiscal_Notes.parquet",
-            "Bill_Sub_All": "Bill_Sub_All.parquet",
-            "Lobby_Sub_All": "Lobby.Sub.parquet",
-            "Lobbyist_Pol_Funds": "Lobbyist.Pol.Funds.parquet",
-            "Lobby_TFL_Client_All": "Lobby_TFL_Client_All.parquet",
-            "Staff_All": ["Staff.parquet", "staff.parquet"],
-            "LaFood": "LaFood.parquet",
-            "LaEnt": "LaEnt.parquet",
-            "LaTran": "LaTran.parquet",
-            "LaGift": "LaGift.parquet",
-            "LaEvnt": "LaEvnt.parquet",
-            "LaAwrd": "LaAwrd.parquet",
-            "LaCvr": "LaCvr.parquet",
-            "LaDock": "LaDock.parquet",
-            "LaI4E": "LaI4E.parquet",
-            "LaSub": "LaSub.parquet",
-        }
-        data = {}
-        for key, cols in cfg.items():
-            fname = parquet_map.get(key)
-            if not fname:
-                data[key] = _empty_df(cols)
-                continue
-            fpath = None
-            if isinstance(fname, (list, tuple)):
-                if key == "Wit_All":
-                    frames = []
-                    for cand in fname:
-                        cand_path = base / cand
-                        if cand_path.exists():
-                            try:
-                                frames.append(read_parquet_cols(cand_path, cols))
-                            except Exception:
-                                continue
-                    if frames:
-                        data[key] = pd.concat(frames, ignore_index=True).drop_duplicates()
-                    else:
-                        data[key] = _empty_df(cols)
-                    continue
-                for cand in fname:
-                    cand_path = base / cand
-                    if cand_path.exists():
-                        fpath = cand_path
-                        break
-            else:
-                cand_path = base / fname
+    def __init__(self, loaders: dict, on_load=None):
+        super().__init__((k, _PENDING) for k in loaders)
+        self._loaders = dict(loaders)
+        self._on_load = on_load
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        val = dict.__getitem__(self, key)
+        if val is not _PENDING:
+            return val
+        with self._lock:
+            val = dict.__getitem__(self, key)
+            if val is _PENDING:
+                t0 = time.perf_counter()
+                val = self._loaders[key](self)
+                dict.__setitem__(self, key, val)
+                if self._on_load is not None:
+                    self._on_load(key, val, time.perf_counter() - t0)
+        return val
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def is_loaded(self, key) -> bool:
+        return key in self and dict.__getitem__(self, key) is not _PENDING
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+def _read_parquet_table(base: Path, key: str, cols: list[str], fname, report: dict) -> pd.DataFrame:
+    t0 = time.perf_counter()
+    entry = report.setdefault(key, {})
+    df = None
+    if isinstance(fname, (list, tuple)):
+        if key == "Wit_All":
+            frames = []
+            for cand in fname:
+                cand_path = base / cand
                 if cand_path.exists():
-                    fpath = cand_path
-            if not fpath or not fpath.exists():
-                data[key] = _empty_df(cols)
-                continue
+                    try:
+                        frames.append(read_parquet_cols(cand_path, cols))
+                    except Exception:
+                        continue
+            if frames:
+                df = pd.concat(frames, ignore_index=True).drop_duplicates()
+        else:
+            for cand in fname:
+                cand_path = base / cand
+                if cand_path.exists():
+                    df = read_parquet_cols(cand_path, cols)
+                    break
+    elif fname:
+        cand_path = base / fname
+        if cand_path.exists():
             try:
-                data[key] = read_parquet_cols(fpath, cols)
+                df = read_parquet_cols(cand_path, cols)
             except Exception:
-                data[key] = _empty_df(cols)
-    else:
-        xf = pd.ExcelFile(path, engine="openpyxl")  # OPEN ONCE
-        data = {k: safe_read_excel_xf(xf, k, v) for k, v in cfg.items()}
+                df = None
+    entry["missing"] = df is None
+    if df is None:
+        df = pd.DataFrame(columns=cols)
+    entry["read_s"] = time.perf_counter() - t0
+    return df
+
+def _read_workbook_tables(path: str, report: dict, skip: set[str] | None = None) -> dict:
+    """Start reading every table; returns key -> Future (parquet dir) or DataFrame (Excel)."""
+    base = Path(path)
+    if base.is_dir():
+        pool = ThreadPoolExecutor(max_workers=WORKBOOK_READ_WORKERS, thread_name_prefix="workbook-read")
+        futures = {
+            key: pool.submit(_read_parquet_table, base, key, cols, WORKBOOK_PARQUET_MAP.get(key), report)
+            for key, cols in WORKBOOK_CFG.items()
+            if key not in (skip or ())
+        }
+        # Reads keep running in the background; tables block only when first requested.
+        pool.shutdown(wait=False)
+        return futures
+    xf = pd.ExcelFile(path, engine="openpyxl")  # OPEN ONCE
+    raw = {}
+    for key, cols in WORKBOOK_CFG.items():
+        t0 = time.perf_counter()
+        raw[key] = safe_read_excel_xf(xf, key, cols)
+        report.setdefault(key, {})["read_s"] = time.perf_counter() - t0
+    return raw
+
+def _strip_session(df: pd.DataFrame) -> pd.DataFrame:
+    if isinstance(df, pd.DataFrame) and "Session" in df.columns:
+        df["Session"] = df["Session"].astype(str).str.strip()
+    return df
+
+def _add_lobbyshort_norm(df: pd.DataFrame) -> pd.DataFrame:
+    # Normalize LobbyShort for robust matching (hyphens/case/spacing).
+    if isinstance(df, pd.DataFrame) and "LobbyShort" in df.columns:
+        df["LobbyShortNorm"] = norm_name_series(df["LobbyShort"])
+    return df
 
+def _prepare_wit_base(wit: pd.DataFrame) -> pd.DataFrame:
     # Normalize parquet schema differences
-    wit = data.get("Wit_All")
-    if isinstance(wit, pd.DataFrame):
+    wit = wit.copy()
+    if "session" in wit.columns and "Session" not in wit.columns:
+        wit = wit.rename(columns={"session": "Session"})
+    if "bill" in wit.columns and "Bill" not in wit.columns:
+        wit = wit.rename(columns={"bill": "Bill"})
+    if "position" in wit.columns:
+        pos = wit["position"].fillna("").astype(str).str.upper()
+        if "IsFor" not in wit.columns:
+            wit["IsFor"] = pos.str.contains(r"\bFOR\b").astype(int)
+        if "IsAgainst" not in wit.columns:
+            wit["IsAgainst"] = pos.str.contains(r"\bAGAINST\b").astype(int)
+        if "IsOn" not in wit.columns:
+            wit["IsOn"] = pos.str.contains(r"\bON\b").astype(int)
+    if "LobbyShort" not in wit.columns:
+        wit["LobbyShort"] = ""
+    unnamed = [c for c in wit.columns if str(c).startswith("Unnamed:")]
+    if unnamed:
+        wit = wit.drop(columns=unnamed)
+    return _strip_session(wit)
+
+def _prepare_wit(wit: pd.DataFrame, name_to_short: dict, initial_to_short: dict) -> pd.DataFrame:
+    # Map witness list names/orgs to LobbyShort where possible
+    if not wit.empty:
         wit = wit.copy()
-        if "session" in wit.columns and "Session" not in wit.columns:
-            wit = wit.rename(columns={"session": "Session"})
-        if "bill" in wit.columns and "Bill" not in wit.columns:
-            wit = wit.rename(columns={"bill": "Bill"})
-        if "position" in wit.columns:
-            pos = wit["position"].fillna("").astype(str).str.upper()
-            if "IsFor" not in wit.columns:
-                wit["IsFor"] = pos.str.contains(r"\bFOR\b").astype(int)
-            if "IsAgainst" not in wit.columns:
-                wit["IsAgainst"] = pos.str.contains(r"\bAGAINST\b").astype(int)
-            if "IsOn" not in wit.columns:
-                wit["IsOn"] = pos.str.contains(r"\bON\b").astype(int)
         if "LobbyShort" not in wit.columns:
             wit["LobbyShort"] = ""
-        unnamed = [c for c in wit.columns if str(c).startswith("Unnamed:")]
-        if unnamed:
-            wit = wit.drop(columns=unnamed)
-        data["Wit_All"] = wit
-
-    bs = data.get("Bill_Status_All")
-    if isinstance(bs, pd.DataFrame):
-        bs = bs.copy()
-        if "Authors" in bs.columns and "Author" not in bs.columns:
-            bs["Author"] = bs["Authors"]
-        data["Bill_Status_All"] = bs
-
-    fi = data.get("Fiscal_Impact")
-    if isinstance(fi, pd.DataFrame):
-        fi = fi.copy()
-        data["Fiscal_Impact"] = fi
-
-    lt = data.get("Lobby_TFL_Client_All")
-    if isinstance(lt, pd.DataFrame):
-        lt = lt.copy()
-        if "IsTFL" not in lt.columns and "TFL?" in lt.columns:
-            lt["IsTFL"] = lt["TFL?"].astype(str).str.upper().isin(["Y", "YES", "TRUE", "1"]).astype(int)
-        if "IsTFL" in lt.columns:
-            lt["IsTFL"] = pd.to_numeric(lt["IsTFL"], errors="coerce").fillna(0).astype(int)
-        data["Lobby_TFL_Client_All"] = lt
-
-    staff = data.get("Staff_All")
-    if isinstance(staff, pd.DataFrame) and not staff.empty:
-        staff = staff.copy()
-        # Rename session column if needed
-        if "session" in staff.columns and "Session" not in staff.columns:
-            staff = staff.rename(columns={"session": "Session"})
-        # Map staff parquet schema to expected columns
-        if "Legislator" not in staff.columns:
-            if "legislator_name" in staff.columns:
-                leg = staff["legislator_name"].fillna("").astype(str).str.strip()
-                if "member_or_committee" in staff.columns:
-                    fallback = staff["member_or_committee"].fillna("").astype(str).str.strip()
-                    staff["Legislator"] = leg.where(leg != "", fallback)
-                else:
-                    staff["Legislator"] = leg
-            elif "member_or_committee" in staff.columns:
-                staff["Legislator"] = staff["member_or_committee"]
-            else:
-                staff["Legislator"] = ""
-        if "Title" not in staff.columns:
-            staff["Title"] = staff.get("role", "")
-        if "Staffer" not in staff.columns:
-            staff["Staffer"] = staff.get("name", staff.get("staff_name_last_initial", ""))
-        if "lobby name" not in staff.columns:
-            staff["lobby name"] = staff.get("staff_name_last_initial", staff.get("name", ""))
-        # Normalized staff name helpers for matching
-        staff["StaffNameNorm"] = norm_name_series(staff.get("name", pd.Series(dtype=object)))
-        staff["StaffLastInitialNorm"] = norm_name_series(
-            staff.get("staff_name_last_initial", staff.get("name", pd.Series(dtype=object)))
-        )
-        staff["StaffLastNorm"] = last_name_norm_series(
-            staff.get("name", staff.get("staff_name_last_initial", pd.Series(dtype=object)))
-        )
-        # Normalize Session to match app sessions (e.g., 89 -> 89R)
-        if "Session" in staff.columns:
-            sess = staff["Session"].astype(str).str.strip()
-            staff["Session"] = sess.where(~sess.str.fullmatch(r"\d+"), sess + "R")
-        data["Staff_All"] = staff
-
-    ls = data.get("Lobby_Sub_All")
-    if isinstance(ls, pd.DataFrame):
-        ls = ls.copy()
-        if "Session" not in ls.columns:
-            if "legislative_session" in ls.columns:
-                ls = ls.rename(columns={"legislative_session": "Session"})
-            elif "session" in ls.columns:
-                ls = ls.rename(columns={"session": "Session"})
-        if "LobbyShort" not in ls.columns:
-            if "lobbyshort" in ls.columns:
-                ls = ls.rename(columns={"lobbyshort": "LobbyShort"})
-            elif "lobby_short" in ls.columns:
-                ls = ls.rename(columns={"lobby_short": "LobbyShort"})
-        data["Lobby_Sub_All"] = ls
-
-    pf = data.get("Lobbyist_Pol_Funds")
-    if isinstance(pf, pd.DataFrame):
-        pf = pf.copy()
-        if "Session" not in pf.columns and "legislative_session" in pf.columns:
-            pf = pf.rename(columns={"legislative_session": "Session"})
-        if "LobbyShort" not in pf.columns:
-            if "lobbyshort" in pf.columns:
-                pf = pf.rename(columns={"lobbyshort": "LobbyShort"})
-            elif "lobby_short" in pf.columns:
-                pf = pf.rename(columns={"lobby_short": "LobbyShort"})
-        data["Lobbyist_Pol_Funds"] = pf
-
-    for key in ["LaFood", "LaEnt", "LaTran", "LaGift", "LaEvnt", "LaAwrd", "LaCvr", "LaDock", "LaI4E", "LaSub"]:
-        df = data.get(key)
-        if isinstance(df, pd.DataFrame):
-            data[key] = _add_session_from_year(df)
-
-    # Normalize Session everywhere
-    for df in data.values():
-        if isinstance(df, pd.DataFrame) and "Session" in df.columns:
-            df["Session"] = df["Session"].astype(str).str.strip()
-
+        name_series = wit.get("name", pd.Series([""] * len(wit))).fillna("").astype(str)
+        if "name" in wit.columns:
+            wit["NameNorm"] = norm_name_series(name_series)
+            wit["NameLastNorm"] = last_name_norm_series(name_series)
+            wit["NameFirstNorm"] = first_name_norm_series(name_series)
+            wit["NameFirstInitialNorm"] = wit["NameFirstNorm"].str.slice(0, 1)
+        if name_to_short:
+            name_norm = wit.get("NameNorm", name_series.map(norm_name))
+            mapped = name_norm.map(name_to_short)
+            if initial_to_short:
+                init_key = name_series.map(_last_first_initial_key)
+                mapped_init = init_key.map(initial_to_short)
+                mapped = mapped.where(mapped.notna() & mapped.astype(str).str.strip().ne(""), mapped_init)
+            if "org" in wit.columns:
+                org_series = wit.get("org", pd.Series([""] * len(wit))).fillna("").astype(str)
+                org_norm = norm_name_series(org_series)
+                mapped = mapped.where(mapped.notna() & mapped.astype(str).str.strip().ne(""), org_norm.map(name_to_short))
+            blank = wit["LobbyShort"].isna() | (wit["LobbyShort"].astype(str).str.strip() == "")
+            wit.loc[blank, "LobbyShort"] = mapped[blank].fillna("")
+    return _add_lobbyshort_norm(wit)
+
+def _prepare_bill_status(bs: pd.DataFrame) -> pd.DataFrame:
+    bs = bs.copy()
+    if "Authors" in bs.columns and "Author" not in bs.columns:
+        bs["Author"] = bs["Authors"]
+    return _strip_session(bs)
+
+def _prepare_tfl(lt: pd.DataFrame) -> pd.DataFrame:
+    lt = lt.copy()
+    if "IsTFL" not in lt.columns and "TFL?" in lt.columns:
+        lt["IsTFL"] = lt["TFL?"].astype(str).str.upper().isin(["Y", "YES", "TRUE", "1"]).astype(int)
+    if "IsTFL" in lt.columns:
+        lt["IsTFL"] = pd.to_numeric(lt["IsTFL"], errors="coerce").fillna(0).astype(int)
+    lt = _strip_session(lt)
     # Precompute Low_num/High_num once (speed for overview + per-lobbyist)
-    if isinstance(data.get("Lobby_TFL_Client_All"), pd.DataFrame) and not data["Lobby_TFL_Client_All"].empty:
-        data["Lobby_TFL_Client_All"] = add_low_high_numeric(data["Lobby_TFL_Client_All"])
-
+    if not lt.empty:
+        lt = add_low_high_numeric(lt)
+    return _add_lobbyshort_norm(lt)
+
+def _prepare_staff(staff: pd.DataFrame) -> pd.DataFrame:
+    if staff.empty:
+        return _strip_session(staff)
+    staff = staff.copy()
+    # Rename session column if needed
+    if "session" in staff.columns and "Session" not in staff.columns:
+        staff = staff.rename(columns={"session": "Session"})
+    # Map staff parquet schema to expected columns
+    if "Legislator" not in staff.columns:
+        if "legislator_name" in staff.columns:
+            leg = staff["legislator_name"].fillna("").astype(str).str.strip()
+            if "member_or_committee" in staff.columns:
+                fallback = staff["member_or_committee"].fillna("").astype(str).str.strip()
+                staff["Legislator"] = leg.where(leg != "", fallback)
+            else:
+                staff["Legislator"] = leg
+        elif "member_or_committee" in staff.columns:
+            staff["Legislator"] = staff["member_or_committee"]
+        else:
+            staff["Legislator"] = ""
+    if "Title" not in staff.columns:
+        staff["Title"] = staff.get("role", "")
+    if "Staffer" not in staff.columns:
+        staff["Staffer"] = staff.get("name", staff.get("staff_name_last_initial", ""))
+    if "lobby name" not in staff.columns:
+        staff["lobby name"] = staff.get("staff_name_last_initial", staff.get("name", ""))
+    # Normalized staff name helpers for matching
+    staff["StaffNameNorm"] = norm_name_series(staff.get("name", pd.Series(dtype=object)))
+    staff["StaffLastInitialNorm"] = norm_name_series(
+        staff.get("staff_name_last_initial", staff.get("name", pd.Series(dtype=object)))
+    )
+    staff["StaffLastNorm"] = last_name_norm_series(
+        staff.get("name", staff.get("staff_name_last_initial", pd.Series(dtype=object)))
+    )
+    # Normalize Session to match app sessions (e.g., 89 -> 89R)
+    if "Session" in staff.columns:
+        sess = staff["Session"].astype(str).str.strip()
+        staff["Session"] = sess.where(~sess.str.fullmatch(r"\d+"), sess + "R")
+    return _strip_session(staff)
+
+def _prepare_lobby_sub_base(ls: pd.DataFrame) -> pd.DataFrame:
+    ls = ls.copy()
+    if "Session" not in ls.columns:
+        if "legislative_session" in ls.columns:
+            ls = ls.rename(columns={"legislative_session": "Session"})
+        elif "session" in ls.columns:
+            ls = ls.rename(columns={"session": "Session"})
+    if "LobbyShort" not in ls.columns:
+        if "lobbyshort" in ls.columns:
+            ls = ls.rename(columns={"lobbyshort": "LobbyShort"})
+        elif "lobby_short" in ls.columns:
+            ls = ls.rename(columns={"lobby_short": "LobbyShort"})
+    return _add_lobbyshort_norm(_strip_session(ls))
+
+def _prepare_lobby_sub(ls: pd.DataFrame, filerid_to_short: dict) -> pd.DataFrame:
+    # Fill Lobby_Sub_All LobbyShort from FilerID when missing
+    if not ls.empty and filerid_to_short:
+        if "FilerID" in ls.columns and "LobbyShort" in ls.columns:
+            ls = ls.copy()
+            fid = pd.to_numeric(ls["FilerID"], errors="coerce").fillna(-1).astype(int)
+            missing = ls["LobbyShort"].isna() | ls["LobbyShort"].astype(str).str.strip().eq("")
+            ls.loc[missing, "LobbyShort"] = fid.map(filerid_to_short)
+    return ls
+
+def _prepare_pol_funds(pf: pd.DataFrame) -> pd.DataFrame:
+    pf = pf.copy()
+    if "Session" not in pf.columns and "legislative_session" in pf.columns:
+        pf = pf.rename(columns={"legislative_session": "Session"})
+    if "LobbyShort" not in pf.columns:
+        if "lobbyshort" in pf.columns:
+            pf = pf.rename(columns={"lobbyshort": "LobbyShort"})
+        elif "lobby_short" in pf.columns:
+            pf = pf.rename(columns={"lobby_short": "LobbyShort"})
+    return _strip_session(pf)
+
+def _build_workbook_lookups(tfl: pd.DataFrame, lobby_sub: pd.DataFrame, pol_funds: pd.DataFrame) -> dict:
     # Build mapping from Lobby Name -> LobbyShort (across all sessions)
     lobby_name_rows = []
 
@@ -14328,9 +16074,9 @@ def load_workbook(path: str) -> dict:
         tmp["FilerID"] = df[fid_col] if fid_col in df.columns else pd.NA
         lobby_name_rows.append(tmp)
 
-    _append_lobby_names(data.get("Lobby_TFL_Client_All"), "Lobby Name", "LobbyShort", "FilerID")
-    _append_lobby_names(data.get("Lobby_Sub_All"), "Lobby Name", "LobbyShort", "FilerID")
-    _append_lobby_names(data.get("Lobbyist_Pol_Funds"), "Lobbyist", "LobbyShort", "FilerID")
+    _append_lobby_names(tfl, "Lobby Name", "LobbyShort", "FilerID")
+    _append_lobby_names(lobby_sub, "Lobby Name", "LobbyShort", "FilerID")
+    _append_lobby_names(pol_funds, "Lobbyist", "LobbyShort", "FilerID")
 
     if lobby_name_rows:
         lobby_names = pd.concat(lobby_name_rows, ignore_index=True)
@@ -14399,62 +16145,366 @@ def load_workbook(path: str) -> dict:
 
     # Map FilerID -> LobbyShort (used for activity matching)
     filerid_to_short = _build_filerid_map([
-        (data.get("Lobby_TFL_Client_All"), "FilerID", "LobbyShort"),
-        (data.get("Lobby_Sub_All"), "FilerID", "LobbyShort"),
-        (data.get("Lobbyist_Pol_Funds"), "FilerID", "LobbyShort"),
+        (tfl, "FilerID", "LobbyShort"),
+        (lobby_sub, "FilerID", "LobbyShort"),
+        (pol_funds, "FilerID", "LobbyShort"),
     ])
 
-    # Map witness list names/orgs to LobbyShort where possible
-    wit = data.get("Wit_All")
-    if isinstance(wit, pd.DataFrame) and not wit.empty:
-        wit = wit.copy()
-        if "LobbyShort" not in wit.columns:
-            wit["LobbyShort"] = ""
-        name_series = wit.get("name", pd.Series([""] * len(wit))).fillna("").astype(str)
-        if "name" in wit.columns:
-            wit["NameNorm"] = norm_name_series(name_series)
-            wit["NameLastNorm"] = last_name_norm_series(name_series)
-            wit["NameFirstNorm"] = first_name_norm_series(name_series)
-            wit["NameFirstInitialNorm"] = wit["NameFirstNorm"].str.slice(0, 1)
-        if name_to_short:
-            name_norm = wit.get("NameNorm", name_series.map(norm_name))
-            mapped = name_norm.map(name_to_short)
-            if initial_to_short:
-                init_key = name_series.map(_last_first_initial_key)
-                mapped_init = init_key.map(initial_to_short)
-                mapped = mapped.where(mapped.notna() & mapped.astype(str).str.strip().ne(""), mapped_init)
-            if "org" in wit.columns:
-                org_series = wit.get("org", pd.Series([""] * len(wit))).fillna("").astype(str)
-                org_norm = norm_name_series(org_series)
-                mapped = mapped.where(mapped.notna() & mapped.astype(str).str.strip().ne(""), org_norm.map(name_to_short))
-            blank = wit["LobbyShort"].isna() | (wit["LobbyShort"].astype(str).str.strip() == "")
-            wit.loc[blank, "LobbyShort"] = mapped[blank].fillna("")
-        data["Wit_All"] = wit
+    return {
+        "name_to_short": name_to_short,
+        "short_to_names": short_to_names,
+        "lobby_index": lobby_index,
+        "lobbyist_index": lobbyist_index,
+        "known_shorts": known_shorts,
+        "initial_to_short": initial_to_short,
+        "filerid_to_short": filerid_to_short,
+    }
 
-    # Normalize LobbyShort for robust matching (hyphens/case/spacing).
-    for key in ["Wit_All", "Lobby_TFL_Client_All", "Lobby_Sub_All"]:
-        df = data.get(key)
-        if isinstance(df, pd.DataFrame) and "LobbyShort" in df.columns:
-            df["LobbyShortNorm"] = norm_name_series(df["LobbyShort"])
+# ---------------------------------------------------------
+# Derived-data disk cache: prepared tables (Arrow IPC) and lookup maps (JSON)
+# keyed by the dataset fingerprint (and ARROW_STRINGS / COMPACT_TABLES modes), so warm restarts skip
+# normalization.
+# Bump _DERIVED_CACHE_VERSION whenever a _prepare_* step or lookup changes.
+# ---------------------------------------------------------
+_DERIVED_CACHE_VERSION = 7
+_DERIVED_CACHE_KEEP = 2
+DERIVED_CACHE_DIR = os.environ.get("DERIVED_CACHE_DIR", str(Path(__file__).resolve().parent / ".cache" / "derived"))
+_DERIVED_CACHE_KEYS = tuple(WORKBOOK_CFG) + ("_lookups", "activity_facts", "disclosure_facts")
+
+def _derived_cache_dir(path: str, fingerprint: str) -> Path | None:
+    root = str(DERIVED_CACHE_DIR or "").strip()
+    if not root or root.lower() in {"0", "off", "none", "false"} or _is_url(path):
+        return None
+    suffix = ("-arrow" if ARROW_STRINGS else "") + ("-cat" if _compact_tables_on() else "")
+    return Path(root) / f"v{_DERIVED_CACHE_VERSION}-{fingerprint}{suffix}"
 
-    data["name_to_short"] = name_to_short
-    data["short_to_names"] = short_to_names
-    data["lobby_index"] = lobby_index
-    data["lobbyist_index"] = lobbyist_index
-    data["known_shorts"] = known_shorts
-    data["filerid_to_short"] = filerid_to_short
+def _derived_cache_keys(cache_dir: Path | None) -> set[str]:
+    if cache_dir is None:
+        return set()
+    return {k for k in _DERIVED_CACHE_KEYS if (cache_dir / f"{k}.arrow").exists()}
 
-    # Fill Lobby_Sub_All LobbyShort from FilerID when missing
-    ls = data.get("Lobby_Sub_All")
-    if isinstance(ls, pd.DataFrame) and not ls.empty and filerid_to_short:
-        if "FilerID" in ls.columns and "LobbyShort" in ls.columns:
-            ls = ls.copy()
-            fid = pd.to_numeric(ls["FilerID"], errors="coerce").fillna(-1).astype(int)
-            missing = ls["LobbyShort"].isna() | ls["LobbyShort"].astype(str).str.strip().eq("")
-            ls.loc[missing, "LobbyShort"] = fid.map(filerid_to_short)
-            data["Lobby_Sub_All"] = ls
+def _write_arrow_frame(df: pd.DataFrame, target: Path) -> None:
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, target)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def _read_arrow_frame(target: Path) -> pd.DataFrame:
+    import pyarrow as pa
+
+    with pa.memory_map(str(target), "r") as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+_RE_DERIVED_CACHE_NAME = re.compile(r"^v(\d+)-[0-9a-f]{16}(?:-arrow)?(?:-cat)?$")
+
+def _prune_derived_cache(cache_dir: Path) -> None:
+    """Keep the newest snapshots of this cache version; drop other versions."""
+    siblings = []
+    for p in cache_dir.parent.iterdir():
+        m = _RE_DERIVED_CACHE_NAME.match(p.name)
+        if not m or not p.is_dir() or p == cache_dir:
+            continue
+        if int(m.group(1)) != _DERIVED_CACHE_VERSION:
+            shutil.rmtree(p, ignore_errors=True)
+        else:
+            siblings.append(p)
+    siblings.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in siblings[_DERIVED_CACHE_KEEP - 1:]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+def _load_derived(cache_dir: Path, key: str):
+    frame_path = cache_dir / f"{key}.arrow"
+    if not frame_path.exists():
+        return None
+    try:
+        frame = _read_arrow_frame(frame_path)
+        if key != "_lookups":
+            return frame
+        maps = json.loads((cache_dir / "lookups.json").read_text(encoding="utf-8"))
+        return {
+            "name_to_short": maps["name_to_short"],
+            "short_to_names": maps["short_to_names"],
+            "lobby_index": frame.copy(),
+            "lobbyist_index": frame,
+            "known_shorts": set(maps["known_shorts"]),
+            "initial_to_short": maps["initial_to_short"],
+            "filerid_to_short": {int(k): v for k, v in maps["filerid_to_short"].items()},
+        }
+    except Exception:
+        return None
+
+def _store_derived(cache_dir: Path, key: str, val) -> None:
+    """Best effort: a read-only disk or an unserializable column just skips the cache."""
+    try:
+        fresh = not cache_dir.exists()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        if fresh:
+            _prune_derived_cache(cache_dir)
+        if key == "_lookups":
+            maps = {
+                "name_to_short": val["name_to_short"],
+                "short_to_names": val["short_to_names"],
+                "known_shorts": sorted(val["known_shorts"]),
+                "initial_to_short": val["initial_to_short"],
+                "filerid_to_short": {str(k): v for k, v in val["filerid_to_short"].items()},
+            }
+            (cache_dir / "lookups.json").write_text(json.dumps(maps), encoding="utf-8")
+            val = val["lobbyist_index"]
+        _write_arrow_frame(val, cache_dir / f"{key}.arrow")
+    except Exception:
+        return
+
+def _with_derived_cache(loaders: dict, cache_dir: Path | None, report: dict) -> dict:
+    if cache_dir is None:
+        return loaders
+    wrapped = dict(loaders)
+
+    def cached(key: str, build):
+        def load(wb):
+            val = _load_derived(cache_dir, key)
+            if val is not None:
+                report.get(key, {})["cached"] = True
+                return val
+            val = build(wb)
+            _store_derived(cache_dir, key, val)
+            return val
+        return load
+
+    for key in _DERIVED_CACHE_KEYS:
+        wrapped[key] = cached(key, loaders[key])
+    return wrapped
+
+# ---------------------------------------------------------
+# Compact tables: low-cardinality text columns are held as categoricals with
+# sorted categories (plus "", so fillna("") and where(..., "") keep working).
+# Only columns that are matched, filtered or decoded with astype(str) are listed;
+# display and grouping columns that get edited in place stay plain objects.
+# ---------------------------------------------------------
+COMPACT_TABLES = os.environ.get("COMPACT_TABLES", "on")
+CATEGORY_MAX_RATIO = 0.5
+_CATEGORICAL_COLUMNS = (
+    "Session",
+    "filerName",
+    "filerSort",
+    "FilerNormRaw",
+    "FilerNormClean",
+    "FilerSortNorm",
+    "FilerShortFromId",
+    "FilerShortMapped",
+    "RecipientOrgNorm",
+    "RecipientLastNorm",
+    "RecipientFirstNorm",
+)
+_CATEGORICAL_TABLE_COLUMNS = {
+    "Wit_All": ("position", "name", "org", "NameNorm", "NameLastNorm", "NameFirstNorm", "NameFirstInitialNorm"),
+    "LaSub": ("subjectMatterCodeValue", "subjectMatterDescr"),
+    "activity_facts": ("Date", "Filer", "Member", "Description", "Amount"),
+    "disclosure_facts": ("Date", "Filer", "Description"),
+}
+_COMPACT_TABLE_KEYS = tuple(WORKBOOK_CFG) + ("activity_facts", "disclosure_facts")
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    return float(df.memory_usage(deep=True).sum()) / 2**20
+
+def _as_categorical(s: pd.Series, max_ratio: float) -> pd.Categorical | None:
+    codes, uniques = pd.factorize(s, sort=True)
+    if len(uniques) > max_ratio * len(s) or not all(isinstance(v, str) for v in uniques):
+        return None
+    categories = list(uniques)
+    if "" not in categories:
+        pos = int(np.searchsorted(np.asarray(uniques, dtype=object), ""))
+        categories.insert(pos, "")
+        codes = np.where(codes >= pos, codes + 1, codes)
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+def compact_categoricals(df: pd.DataFrame, columns, max_ratio: float = CATEGORY_MAX_RATIO) -> pd.DataFrame:
+    """Store the listed low-cardinality text columns of df as categoricals; others are untouched."""
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return df
+    encoded = {}
+    for col in columns:
+        if col not in df.columns or not (df[col].dtype == object or is_arrow_string(df[col])):
+            continue
+        cat = _as_categorical(df[col], max_ratio)
+        if cat is not None:
+            encoded[col] = pd.Series(cat, index=df.index)
+    return df.assign(**encoded) if encoded else df
+
+def _compact_tables_on() -> bool:
+    return str(COMPACT_TABLES or "").strip().lower() not in {"0", "off", "none", "false"}
+
+def _with_compact_tables(loaders: dict, report: dict) -> dict:
+    if not _compact_tables_on():
+        return loaders
+    wrapped = dict(loaders)
+
+    def compact(key: str, build):
+        columns = _CATEGORICAL_COLUMNS + _CATEGORICAL_TABLE_COLUMNS.get(key, ())
+
+        def load(wb):
+            val = build(wb)
+            if not isinstance(val, pd.DataFrame):
+                return val
+            if key in report:
+                report[key]["memory_before_mb"] = frame_memory_mb(val)
+            return compact_categoricals(val, columns)
+        return load
+
+    for key in _COMPACT_TABLE_KEYS:
+        wrapped[key] = compact(key, loaders[key])
+    return wrapped
+
+# Multi-session tables that pages and builders slice by Session (see session_rows).
+# The activity/disclosure tables keep file order: they are reached through the
+# filer/recipient row indexes, and their fact tables record source row positions.
+_SESSION_GROUPED_TABLES = (
+    "Wit_All",
+    "Bill_Status_All",
+    "Fiscal_Impact",
+    "Bill_Sub_All",
+    "Lobby_Sub_All",
+    "Lobbyist_Pol_Funds",
+    "Lobby_TFL_Client_All",
+    "Staff_All",
+)
+
+def _with_session_groups(loaders: dict) -> dict:
+    wrapped = dict(loaders)
+
+    def grouped(build):
+        return lambda wb: group_by_session(build(wb))
+
+    for key in _SESSION_GROUPED_TABLES:
+        wrapped[key] = grouped(loaders[key])
+    return wrapped
+
+def _workbook_loaders(raw: dict, path: str, report: dict) -> dict:
+    base = Path(path)
+
+    def raw_table(key: str) -> pd.DataFrame:
+        val = raw.pop(key, None)
+        if val is None and base.is_dir():
+            # Skipped up front because a cached copy existed; read now on demand.
+            val = _read_parquet_table(base, key, WORKBOOK_CFG.get(key, []), WORKBOOK_PARQUET_MAP.get(key), report)
+        if isinstance(val, Future):
+            try:
+                val = val.result()
+            except Exception:
+                val = None
+        if not isinstance(val, pd.DataFrame):
+            val = pd.DataFrame(columns=WORKBOOK_CFG.get(key, []))
+        return val
+
+    def la_table(key: str):
+        def load(wb):
+            df = _strip_session(_add_session_from_year(raw_table(key)))
+            # Precompute filer-name normalization once so per-lobbyist filters are plain comparisons.
+            df = add_filer_norm_columns(df, wb["name_to_short"], wb["filerid_to_short"])
+            if key in _LA_ACTIVITY_TABLES:
+                df = add_recipient_norm_columns(add_activity_display_columns(df))
+            return df
+        return load
+
+    def lookup(name: str):
+        return lambda wb: wb["_lookups"][name]
+
+    loaders = {
+        "Wit_All": lambda wb: _prepare_wit(wb["_wit_base"], wb["name_to_short"], wb["_lookups"]["initial_to_short"]),
+        "Bill_Status_All": lambda wb: _prepare_bill_status(raw_table("Bill_Status_All")),
+        "Fiscal_Impact": lambda wb: _strip_session(raw_table("Fiscal_Impact").copy()),
+        "Bill_Sub_All": lambda wb: _strip_session(raw_table("Bill_Sub_All")),
+        "Lobby_Sub_All": lambda wb: _prepare_lobby_sub(wb["_lobby_sub_base"], wb["filerid_to_short"]),
+        "Lobbyist_Pol_Funds": lambda wb: _prepare_pol_funds(raw_table("Lobbyist_Pol_Funds")),
+        "Lobby_TFL_Client_All": lambda wb: _prepare_tfl(raw_table("Lobby_TFL_Client_All")),
+        "Staff_All": lambda wb: _prepare_staff(raw_table("Staff_All")),
+    }
+    for key in _LA_FILER_TABLES:
+        loaders[key] = la_table(key)
+    loaders.update({
+        "_wit_base": lambda wb: _prepare_wit_base(raw_table("Wit_All")),
+        "_lobby_sub_base": lambda wb: _prepare_lobby_sub_base(raw_table("Lobby_Sub_All")),
+        "_lookups": lambda wb: _build_workbook_lookups(
+            wb["Lobby_TFL_Client_All"], wb["_lobby_sub_base"], wb["Lobbyist_Pol_Funds"]
+        ),
+        "name_to_short": lookup("name_to_short"),
+        "short_to_names": lookup("short_to_names"),
+        "lobby_index": lookup("lobby_index"),
+        "lobbyist_index": lookup("lobbyist_index"),
+        "known_shorts": lookup("known_shorts"),
+        "filerid_to_short": lookup("filerid_to_short"),
+        "nav_search_index": build_nav_search_index,
+        "activity_facts": lambda wb: build_activity_facts({key: wb[key] for key in _LA_ACTIVITY_TABLES}),
+        "disclosure_facts": lambda wb: build_disclosure_facts({key: wb[key] for key in DISCLOSURE_TYPES}),
+        "filer_row_index": lambda wb: LazyTables(
+            {key: (lambda _idx, k=key: build_filer_row_index(wb[k])) for key in _LA_FILER_TABLES}
+        ),
+        "recipient_row_index": lambda wb: LazyTables(
+            {key: (lambda _idx, k=key: build_recipient_row_index(wb[k])) for key in _LA_ACTIVITY_TABLES}
+        ),
+    })
+    return loaders
+
+@st.cache_resource(show_spinner=False, ttl=600, max_entries=2)
+def load_workbook(path: str) -> dict:
+    base = Path(path)
+    if not base.exists():
+        return {k: _empty_df(v) for k, v in WORKBOOK_CFG.items()}
+
+    started = time.perf_counter()
+    report = {key: {} for key in WORKBOOK_CFG}
+    fingerprint = _dataset_fingerprint(path)
+    cache_dir = _derived_cache_dir(path, fingerprint)
+    raw = _read_workbook_tables(path, report, skip=_derived_cache_keys(cache_dir))
+    generation = _new_dataset_generation()
+
+    def on_load(key, val, secs):
+        register_dataset_object(val, f"{fingerprint}:{key}", generation)
+        if key in report:
+            report[key]["prepare_s"] = secs
+            if isinstance(val, pd.DataFrame):
+                report[key]["rows"] = len(val)
+                report[key]["memory_mb"] = frame_memory_mb(val)
+        if key in _SESSION_GROUPED_TABLES:
+            register_session_bounds(val, generation)
+
+    loaders = _workbook_loaders(raw, path, report)
+    loaders = _with_derived_cache(_with_compact_tables(_with_session_groups(loaders), report), cache_dir, report)
+    data = LazyTables(loaders, on_load=on_load)
+    data["dataset_fingerprint"] = fingerprint
+    data["load_report"] = {"started": started, "workers": WORKBOOK_READ_WORKERS, "tables": report}
     return data
 
+def load_report_table(data: dict) -> pd.DataFrame:
+    """Per-table read/prepare timings and memory recorded by load_workbook (does not trigger loads)."""
+    info = dict.get(data, "load_report") if isinstance(data, dict) else None
+    if not isinstance(info, dict):
+        return pd.DataFrame(columns=["Source", "Read (s)", "Prepare (s)", "Rows", "Memory (MB)", "Before compaction (MB)", "Status"])
+    rows = []
+    for key, entry in info.get("tables", {}).items():
+        if isinstance(data, LazyTables) and data.is_loaded(key):
+            status = "Ready (disk cache)" if entry.get("cached") else "Ready"
+        elif "read_s" in entry:
+            status = "Missing" if entry.get("missing") else "Read"
+        else:
+            status = "Pending"
+        rows.append({
+            "Source": _source_label(key),
+            "Read (s)": round(entry["read_s"], 3) if "read_s" in entry else None,
+            "Prepare (s)": round(entry["prepare_s"], 3) if "prepare_s" in entry else None,
+            "Rows": entry.get("rows"),
+            "Memory (MB)": round(entry["memory_mb"], 1) if "memory_mb" in entry else None,
+            "Before compaction (MB)": round(entry["memory_before_mb"], 1) if "memory_before_mb" in entry else None,
+            "Status": status,
+        })
+    return pd.DataFrame(rows)
+
 DATA_SOURCE_LABELS = {
     "Wit_All": "Texas Legislature Online (Witness lists)",
     "Bill_Status_All": "Texas Legislature Online (Bill status)",
@@ -14500,8 +16550,21 @@ def data_health_table(data: dict) -> pd.DataFrame:
     ]
     rows = []
     for key in order:
-        df = data.get(key)
         label = _source_label(key)
+        if isinstance(data, LazyTables) and key in data and not data.is_loaded(key):
+            # Rendered on every page run: report pending tables instead of loading them here.
+            rows.append({
+                "Source": label,
+                "Rows": None,
+                "Cols": None,
+                "Has Session": "",
+                "Empty": "",
+                "Sessions": None,
+                "Last name + first initial": None,
+                "Status": "Not loaded yet",
+            })
+            continue
+        df = data.get(key)
         if isinstance(df, pd.DataFrame):
             sess_count = int(df["Session"].dropna().astype(str).nunique()) if "Session" in df.columns else 0
             lobby_count = int(df["LobbyShort"].dropna().astype(str).nunique()) if "LobbyShort" in df.columns else 0
@@ -14513,6 +16576,7 @@ def data_health_table(data: dict) -> pd.DataFrame:
                 "Empty": "Yes" if df.empty else "No",
                 "Sessions": sess_count,
                 "Last name + first initial": lobby_count,
+                "Status": "Loaded",
             })
         else:
             rows.append({
@@ -14523,22 +16587,26 @@ def data_health_table(data: dict) -> pd.DataFrame:
                 "Empty": "Yes",
                 "Sessions": 0,
                 "Last name + first initial": 0,
+                "Status": "Missing",
             })
     return pd.DataFrame(rows)
 
 # =========================================================
 # ACTIVITIES (unchanged logic, still cached)
 # =========================================================
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_activities(df_food, df_ent, df_tran, df_gift, df_evnt, df_awrd,
                      lobbyshort: str, session: str | None, name_to_short: dict,
                      lobbyist_norms_tuple: tuple[str, ...], filerid_to_short: dict | None = None,
-                     filer_ids: tuple[int, ...] | None = None) -> pd.DataFrame:
+                     filer_ids: tuple[int, ...] | None = None,
+                     _row_indexes: dict | None = None,
+                     _facts: pd.DataFrame | None = None) -> pd.DataFrame:
 
     lobbyist_norms = set(lobbyist_norms_tuple)
     filer_ids_set = set(filer_ids) if filer_ids else None
+    row_indexes = _row_indexes or {}
 
-    def keep(df: pd.DataFrame) -> pd.DataFrame:
+    def keep(df: pd.DataFrame, key: str) -> pd.DataFrame:
         return filter_filer_rows(
             df,
             session=session,
@@ -14548,106 +16616,17 @@ def build_activities(df_food, df_ent, df_tran, df_gift, df_evnt, df_awrd,
             filerid_to_short=filerid_to_short,
             filer_ids=filer_ids_set,
             loose=True,
+            row_index=row_indexes.get(key),
         )
 
-    out = []
-
-    d = keep(df_food)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Food",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("restaurantName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_ent)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Entertainment",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("entertainmentName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_tran)
-    if not d.empty:
-        desc = d.get("travelPurpose", pd.Series([""] * len(d))).fillna("").astype(str)
-        fallback = d.get("transportationTypeDescr", pd.Series([""] * len(d))).fillna("").astype(str)
-        desc = desc.where(desc.str.len() > 0, fallback)
-        route = (d.get("departureCity", "").fillna("").astype(str) + " -> " + d.get("arrivalCity", "").fillna("").astype(str)).str.strip()
-        desc2 = (desc + " | " + route).str.replace(r"\s+\|\s+$", "", regex=True)
-        date = d.get("departureDt", d.get("checkInDt", d.get("periodStartDt", ""))).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Travel",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": desc2,
-            "Amount": "",
-        }))
-
-    d = keep(df_gift)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Gift",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_evnt)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Event",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": "",
-        }))
-
-    d = keep(df_awrd)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Award",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    if not out:
-        return pd.DataFrame(columns=["Session", "Date", "Type", "Filer", "Member", "Description", "Amount"])
-
-    result = pd.concat(out, ignore_index=True)
-    for c in ["Session", "Date", "Filer", "Member", "Description", "Amount"]:
-        result[c] = result[c].fillna("").astype(str)
-    date_sort = pd.to_datetime(result["Date"], errors="coerce")
-    result = result.assign(_date_sort=date_sort).sort_values(
-        ["_date_sort", "Type", "Member"], ascending=[False, True, True]
-    ).drop(columns=["_date_sort"])
-    return result
+    frames = dict(zip(ACTIVITY_TYPES, (df_food, df_ent, df_tran, df_gift, df_evnt, df_awrd)))
+    selected = {key: keep(df, key) for key, df in frames.items()}
+    facts = select_activity_facts(_facts, frames, selected)
+    if facts.empty:
+        return pd.DataFrame(columns=_ACTIVITY_VIEW_COLS)
+    return _sorted_fact_view(facts, _ACTIVITY_VIEW_COLS, ["Type", "Member"])
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_activities_multi(
     df_food,
     df_ent,
@@ -14661,11 +16640,14 @@ def build_activities_multi(
     lobbyist_norms_tuple: tuple[str, ...],
     filerid_to_short: dict | None = None,
     lobbyshort_to_name: dict | None = None,
+    _row_indexes: dict | None = None,
+    _facts: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     lobbyist_norms = set(lobbyist_norms_tuple)
     lobbyshort_to_name = lobbyshort_to_name or {}
+    row_indexes = _row_indexes or {}
 
-    def keep(df: pd.DataFrame) -> pd.DataFrame:
+    def keep(df: pd.DataFrame, key: str) -> pd.DataFrame:
         return filter_filer_rows_multi(
             df,
             session=session,
@@ -14674,6 +16656,7 @@ def build_activities_multi(
             lobbyist_norms=lobbyist_norms,
             filerid_to_short=filerid_to_short,
             loose=True,
+            row_index=row_indexes.get(key),
         )
 
     def lobbyist_display(d: pd.DataFrame) -> pd.Series:
@@ -14683,110 +16666,107 @@ def build_activities_multi(
         filer = d.get("filerName", pd.Series([""] * len(d))).fillna("").astype(str)
         return mapped.where(mapped.astype(str).str.strip().ne(""), filer)
 
-    out = []
-
-    d = keep(df_food)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Food",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("restaurantName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_ent)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Entertainment",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("entertainmentName", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_tran)
-    if not d.empty:
-        desc = d.get("travelPurpose", pd.Series([""] * len(d))).fillna("").astype(str)
-        fallback = d.get("transportationTypeDescr", pd.Series([""] * len(d))).fillna("").astype(str)
-        desc = desc.where(desc.str.len() > 0, fallback)
-        route = (d.get("departureCity", "").fillna("").astype(str) + " -> " + d.get("arrivalCity", "").fillna("").astype(str)).str.strip()
-        desc2 = (desc + " | " + route).str.replace(r"\s+\|\s+$", "", regex=True)
-        date = d.get("departureDt", d.get("checkInDt", d.get("periodStartDt", ""))).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Travel",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": desc2,
-            "Amount": "",
-        }))
-
-    d = keep(df_gift)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Gift",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    d = keep(df_evnt)
-    if not d.empty:
-        date = d.get("activityDate", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Event",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": "",
-        }))
-
-    d = keep(df_awrd)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Award",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Member": d.apply(lambda r: person_display(r.get("recipientNameOrganization"), r.get("recipientNameLast"), r.get("recipientNameFirst")), axis=1),
-            "Description": d.get("activityDescription", "").fillna("").astype(str),
-            "Amount": d.apply(lambda r: amount_display(r.get("activityExactAmount"), r.get("activityAmountRangeLow"), r.get("activityAmountRangeHigh"), r.get("activityAmountCd")), axis=1),
-        }))
-
-    if not out:
+    frames = dict(zip(ACTIVITY_TYPES, (df_food, df_ent, df_tran, df_gift, df_evnt, df_awrd)))
+    selected = {key: keep(df, key) for key, df in frames.items()}
+    facts = select_activity_facts(_facts, frames, selected)
+    if facts.empty:
         return pd.DataFrame(columns=["Session", "Date", "Type", "Lobbyist", "Filer", "Member", "Description", "Amount"])
 
-    result = pd.concat(out, ignore_index=True)
-    for c in ["Session", "Date", "Lobbyist", "Filer", "Member", "Description", "Amount"]:
-        result[c] = result[c].fillna("").astype(str)
-    date_sort = pd.to_datetime(result["Date"], errors="coerce")
-    result = result.assign(_date_sort=date_sort).sort_values(
-        ["_date_sort", "Type", "Lobbyist", "Member"], ascending=[False, True, True, True]
-    ).drop(columns=["_date_sort"])
-    return result
+    facts["Lobbyist"] = pd.concat([lobbyist_display(d) for d in selected.values() if not d.empty]).to_numpy()
+    cols = ["Session", "Date", "Type", "Lobbyist", "Filer", "Member", "Description", "Amount"]
+    return _sorted_fact_view(facts, cols, ["Type", "Lobbyist", "Member"])
+
+# ---------------------------------------------------------
+# Disclosures fact table: LaCvr / LaDock / LaI4E / LaSub in the Disclosures
+# tab schema, laid out like the activities fact table.
+# ---------------------------------------------------------
+DISCLOSURE_TYPES = {
+    "LaCvr": "Coverage",
+    "LaDock": "Docket",
+    "LaI4E": "On Behalf",
+    "LaSub": "Subject Matter",
+}
+_DISCLOSURE_DATE_COLS = {
+    "LaCvr": ("filedDt", "periodStartDt"),
+    "LaDock": ("receivedDt", "periodStartDt"),
+    "LaI4E": ("periodStartDt",),
+    "LaSub": ("periodStartDt",),
+}
+_DISCLOSURE_VIEW_COLS = ["Session", "Date", "Type", "Filer", "Description", "Entity"]
+
+def _disclosure_fact_part(key: str, d: pd.DataFrame) -> pd.DataFrame:
+    date_col = next((c for c in _DISCLOSURE_DATE_COLS[key] if c in d.columns), None)
+    date = _text_col(d, date_col) if date_col else pd.Series("", index=d.index, dtype=object)
+    if key == "LaCvr":
+        desc = _text_col(d, "subjectMatterMemo")
+        desc = desc.where(desc.str.strip() != "", _text_col(d, "docketsMemo"))
+        desc = desc.where(desc.str.strip() != "", _text_col(d, "sourceCategoryCd"))
+        entity = _text_col(d, "filerNameOrganization")
+    elif key == "LaDock":
+        desc = _text_col(d, "designationText")
+        entity = _text_col(d, "agencyName")
+    elif key == "LaI4E":
+        desc = _text_col(d, "onbehalfPrimaryPhoneNumber")
+        entity = _text_col(d, "onbehalfName")
+    else:
+        entity = _text_col(d, "subjectMatterDescr")
+        desc = _text_col(d, "subjectMatterCodeValue")
+        desc = desc.where(desc.str.strip() != "", entity)
+    part = pd.DataFrame({
+        "Session": _text_col(d, "Session"),
+        "Date": date,
+        "DateSort": activity_date_sort(date),
+        "Type": DISCLOSURE_TYPES[key],
+        "Filer": _text_col(d, "filerName"),
+        "Description": desc,
+        "Entity": entity,
+        "EntityCity": _text_col(d, "onbehalfMailingCity") if key == "LaI4E" else "",
+        "Source": key,
+        "SourceRow": np.arange(len(d), dtype=np.int64),
+    })
+    for col in _FILER_NORM_COLS:
+        if col in d.columns:
+            part[col] = d[col]
+    return part.reset_index(drop=True)
+
+def build_disclosure_facts(tables: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One row per disclosure across LaCvr / LaDock / LaI4E / LaSub, in table then row order."""
+    parts = [
+        _disclosure_fact_part(key, df)
+        for key, df in tables.items()
+        if key in DISCLOSURE_TYPES and isinstance(df, pd.DataFrame) and not df.empty
+    ]
+    if not parts:
+        return pd.DataFrame(columns=_DISCLOSURE_VIEW_COLS + ["EntityCity", "DateSort", "Source", "SourceRow"])
+    facts = pd.concat(parts, ignore_index=True)
+    facts["Type"] = pd.Categorical(facts["Type"], categories=sorted(DISCLOSURE_TYPES.values()))
+    facts["Entity"] = facts["Entity"].astype("category")
+    facts["EntityCity"] = facts["EntityCity"].astype("category")
+    facts["Source"] = pd.Categorical(facts["Source"], categories=list(DISCLOSURE_TYPES))
+    return facts
+
+def select_disclosure_facts(
+    facts: pd.DataFrame | None,
+    tables: dict[str, pd.DataFrame],
+    selected: dict[str, pd.DataFrame],
+) -> pd.DataFrame:
+    parts = _select_fact_rows(facts, tables, selected, DISCLOSURE_TYPES, build_disclosure_facts)
+    if not parts:
+        return pd.DataFrame(columns=_DISCLOSURE_VIEW_COLS + ["EntityCity", "DateSort", "Source"])
+    out = pd.concat(
+        [p.astype({"Type": str, "Entity": str, "EntityCity": str, "Source": str}) for p in parts],
+        ignore_index=True,
+    )
+    return out
+
+def _disclosure_entity(facts: pd.DataFrame, sep: str) -> pd.Series:
+    """Entity column with LaI4E rows shown as "name<sep>city" (sep dropped when there is no city)."""
+    joined = (facts["Entity"] + sep + facts["EntityCity"]).str.replace(
+        r"\s+" + re.escape(sep.strip()) + r"\s+$", "", regex=True
+    )
+    return facts["Entity"].where(facts["Source"] != "LaI4E", joined)
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_disclosures(
     df_cvr: pd.DataFrame,
     df_dock: pd.DataFrame,
@@ -14798,82 +16778,28 @@ def build_disclosures(
     lobbyist_norms_tuple: tuple[str, ...],
     filerid_to_short: dict | None = None,
     filer_ids: tuple[int, ...] | None = None,
+    _row_indexes: dict | None = None,
+    _facts: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     lobbyist_norms = set(lobbyist_norms_tuple)
     filer_ids_set = set(filer_ids) if filer_ids else None
-    out = []
+    row_indexes = _row_indexes or {}
 
-    d = filter_filer_rows(df_cvr, session, lobbyshort, name_to_short, lobbyist_norms, filerid_to_short, filer_ids_set)
-    if not d.empty:
-        date = d.get("filedDt", d.get("periodStartDt", "")).fillna("").astype(str)
-        desc = d.get("subjectMatterMemo", "").fillna("").astype(str)
-        desc = desc.where(desc.str.strip() != "", d.get("docketsMemo", "").fillna("").astype(str))
-        desc = desc.where(desc.str.strip() != "", d.get("sourceCategoryCd", "").fillna("").astype(str))
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Coverage",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": desc,
-            "Entity": d.get("filerNameOrganization", "").fillna("").astype(str),
-        }))
-
-    d = filter_filer_rows(df_dock, session, lobbyshort, name_to_short, lobbyist_norms, filerid_to_short, filer_ids_set)
-    if not d.empty:
-        date = d.get("receivedDt", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Docket",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": d.get("designationText", "").fillna("").astype(str),
-            "Entity": d.get("agencyName", "").fillna("").astype(str),
-        }))
-
-    d = filter_filer_rows(df_i4e, session, lobbyshort, name_to_short, lobbyist_norms, filerid_to_short, filer_ids_set)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        entity = (
-            d.get("onbehalfName", "").fillna("").astype(str)
-            + " -- "
-            + d.get("onbehalfMailingCity", "").fillna("").astype(str)
-        ).str.replace(r"\s+--\s+$", "", regex=True)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "On Behalf",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": d.get("onbehalfPrimaryPhoneNumber", "").fillna("").astype(str),
-            "Entity": entity,
-        }))
-
-    d = filter_filer_rows(df_sub, session, lobbyshort, name_to_short, lobbyist_norms, filerid_to_short, filer_ids_set)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        desc = d.get("subjectMatterCodeValue", "").fillna("").astype(str)
-        desc = desc.where(desc.str.strip() != "", d.get("subjectMatterDescr", "").fillna("").astype(str))
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Subject Matter",
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": desc,
-            "Entity": d.get("subjectMatterDescr", "").fillna("").astype(str),
-        }))
-
-    if not out:
-        return pd.DataFrame(columns=["Session", "Date", "Type", "Filer", "Description", "Entity"])
-
-    result = pd.concat(out, ignore_index=True)
-    for c in ["Session", "Date", "Type", "Filer", "Description", "Entity"]:
-        result[c] = result[c].fillna("").astype(str)
-    date_sort = pd.to_datetime(result["Date"], errors="coerce")
-    result = result.assign(_date_sort=date_sort).sort_values(
-        ["_date_sort", "Type", "Description"], ascending=[False, True, True]
-    ).drop(columns=["_date_sort"])
-    return result
+    frames = dict(zip(DISCLOSURE_TYPES, (df_cvr, df_dock, df_i4e, df_sub)))
+    selected = {
+        key: filter_filer_rows(
+            df, session, lobbyshort, name_to_short, lobbyist_norms, filerid_to_short, filer_ids_set,
+            row_index=row_indexes.get(key),
+        )
+        for key, df in frames.items()
+    }
+    facts = select_disclosure_facts(_facts, frames, selected)
+    if facts.empty:
+        return pd.DataFrame(columns=_DISCLOSURE_VIEW_COLS)
+    facts["Entity"] = _disclosure_entity(facts, " -- ")
+    return _sorted_fact_view(facts, _DISCLOSURE_VIEW_COLS, ["Type", "Description"])
 
-@st.cache_data(show_spinner=False, ttl=300, max_entries=8)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=8, hash_funcs=DATASET_HASH_FUNCS)
 def build_disclosures_multi(
     df_cvr: pd.DataFrame,
     df_dock: pd.DataFrame,
@@ -14885,11 +16811,14 @@ def build_disclosures_multi(
     lobbyist_norms_tuple: tuple[str, ...],
     filerid_to_short: dict | None = None,
     lobbyshort_to_name: dict | None = None,
+    _row_indexes: dict | None = None,
+    _facts: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     lobbyist_norms = set(lobbyist_norms_tuple)
     lobbyshort_to_name = lobbyshort_to_name or {}
+    row_indexes = _row_indexes or {}
 
-    def keep(df: pd.DataFrame) -> pd.DataFrame:
+    def keep(df: pd.DataFrame, key: str) -> pd.DataFrame:
         return filter_filer_rows_multi(
             df,
             session=session,
@@ -14898,6 +16827,7 @@ def build_disclosures_multi(
             lobbyist_norms=lobbyist_norms,
             filerid_to_short=filerid_to_short,
             loose=False,
+            row_index=row_indexes.get(key),
         )
 
     def lobbyist_display(d: pd.DataFrame) -> pd.Series:
@@ -14907,123 +16837,219 @@ def build_disclosures_multi(
         filer = d.get("filerName", pd.Series([""] * len(d))).fillna("").astype(str)
         return mapped.where(mapped.astype(str).str.strip().ne(""), filer)
 
-    out = []
-
-    d = keep(df_cvr)
-    if not d.empty:
-        date = d.get("filedDt", d.get("periodStartDt", "")).fillna("").astype(str)
-        desc = d.get("subjectMatterMemo", "").fillna("").astype(str)
-        desc = desc.where(desc.str.strip() != "", d.get("docketsMemo", "").fillna("").astype(str))
-        desc = desc.where(desc.str.strip() != "", d.get("sourceCategoryCd", "").fillna("").astype(str))
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Coverage",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": desc,
-            "Entity": d.get("filerNameOrganization", "").fillna("").astype(str),
-        }))
-
-    d = keep(df_dock)
-    if not d.empty:
-        date = d.get("receivedDt", d.get("periodStartDt", "")).fillna("").astype(str)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Docket",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": d.get("designationText", "").fillna("").astype(str),
-            "Entity": d.get("agencyName", "").fillna("").astype(str),
-        }))
-
-    d = keep(df_i4e)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        entity = (
-            d.get("onbehalfName", "").fillna("").astype(str)
-            + " - "
-            + d.get("onbehalfMailingCity", "").fillna("").astype(str)
-        ).str.replace(r"\s+-\s+$", "", regex=True)
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "On Behalf",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": d.get("onbehalfPrimaryPhoneNumber", "").fillna("").astype(str),
-            "Entity": entity,
-        }))
-
-    d = keep(df_sub)
-    if not d.empty:
-        date = d.get("periodStartDt", "").fillna("").astype(str)
-        desc = d.get("subjectMatterCodeValue", "").fillna("").astype(str)
-        desc = desc.where(desc.str.strip() != "", d.get("subjectMatterDescr", "").fillna("").astype(str))
-        out.append(pd.DataFrame({
-            "Session": d.get("Session", ""),
-            "Date": date,
-            "Type": "Subject Matter",
-            "Lobbyist": lobbyist_display(d),
-            "Filer": d.get("filerName", "").fillna("").astype(str),
-            "Description": desc,
-            "Entity": d.get("subjectMatterDescr", "").fillna("").astype(str),
-        }))
-
-    if not out:
+    frames = dict(zip(DISCLOSURE_TYPES, (df_cvr, df_dock, df_i4e, df_sub)))
+    selected = {key: keep(df, key) for key, df in frames.items()}
+    facts = select_disclosure_facts(_facts, frames, selected)
+    if facts.empty:
         return pd.DataFrame(columns=["Session", "Date", "Type", "Lobbyist", "Filer", "Description", "Entity"])
 
-    result = pd.concat(out, ignore_index=True)
-    for c in ["Session", "Date", "Type", "Lobbyist", "Filer", "Description", "Entity"]:
-        result[c] = result[c].fillna("").astype(str)
-    date_sort = pd.to_datetime(result["Date"], errors="coerce")
-    result = result.assign(_date_sort=date_sort).sort_values(
-        ["_date_sort", "Type", "Description"], ascending=[False, True, True]
-    ).drop(columns=["_date_sort"])
-    return result
+    facts["Entity"] = _disclosure_entity(facts, " - ")
+    facts["Lobbyist"] = pd.concat([lobbyist_display(d) for d in selected.values() if not d.empty]).to_numpy()
+    cols = ["Session", "Date", "Type", "Lobbyist", "Filer", "Description", "Entity"]
+    return _sorted_fact_view(facts, cols, ["Type", "Description"])
+
+# =========================================================
+# BATCH REPORTS (headless CLI)
+# =========================================================
+# `python main.py report-batch specs.csv --out reports` loads the workbook once and
+# builds one PDF per spec row with the same builders as the "Custom PDF report"
+# expanders. Worker processes are forked after the tables are prepared, so they
+# inherit them instead of re-reading the dataset.
+# Spec columns: session (blank = default session, "*" = every session), scope
+# ("This Session" / "All Sessions", default This Session) and focus ("all",
+# "lobbyist:<LobbyShort>", "client:<name>", "legislator:<name>" or "bill:<bill>").
+REPORT_BATCH_SCOPES = ("This Session", "All Sessions")
+_REPORT_BATCH_FOCUS_TYPES = ("lobbyist", "client", "legislator", "bill")
+_REPORT_BATCH_FOCUS_TABLES = ("Staff_All", "Lobby_Sub_All", *_LA_ACTIVITY_TABLES, "LaCvr", "LaDock", "LaI4E", "LaSub")
+_REPORT_BATCH_FOCUS_LOOKUPS = (
+    "name_to_short",
+    "short_to_names",
+    "filerid_to_short",
+    "filer_row_index",
+    "recipient_row_index",
+    "activity_facts",
+    "disclosure_facts",
+)
+
+def _report_batch_sessions(data: dict) -> list[str]:
+    frames = (data["Wit_All"], data["Lobby_TFL_Client_All"], data["Bill_Status_All"])
+    values = pd.concat([df.get("Session", pd.Series(dtype=object)) for df in frames], ignore_index=True)
+    sessions = values.dropna().astype(str).str.strip().unique().tolist()
+    sessions = [s for s in sessions if s and s.lower() not in {"none", "nan", "null"}]
+    return sorted(sessions, key=_session_sort_key)
+
+def parse_report_batch_specs(raw: pd.DataFrame, sessions: list[str]) -> list[dict]:
+    """Normalize a spec table to session / scope / focus rows, expanding session "*".
+
+    Raises ValueError for a missing focus column or an unknown session, scope or focus type.
+    """
+    by_name = {str(c).strip().lower(): c for c in raw.columns}
+    if "focus" not in by_name:
+        raise ValueError("Expected a 'focus' column (plus optional 'session' and 'scope' columns).")
+
+    def column(name: str) -> pd.Series:
+        if name not in by_name:
+            return pd.Series([""] * len(raw), index=raw.index)
+        return raw[by_name[name]].fillna("").astype(str).str.strip()
+
+    default_session = _default_session_from_list(sessions)
+    specs = []
+    for row, (session, scope, focus) in enumerate(zip(column("session"), column("scope"), column("focus")), start=1):
+        scope = next((s for s in REPORT_BATCH_SCOPES if s.lower() == scope.lower()), scope or REPORT_BATCH_SCOPES[0])
+        if scope not in REPORT_BATCH_SCOPES:
+            raise ValueError(f"Row {row}: scope must be one of {', '.join(REPORT_BATCH_SCOPES)}.")
+        kind, _, value = focus.partition(":")
+        kind, value = kind.strip().lower(), value.strip()
+        if kind in {"", "all"}:
+            kind, value = "", ""
+        elif kind not in _REPORT_BATCH_FOCUS_TYPES or not value:
+            kinds = ", ".join(f"{k}:<name>" for k in _REPORT_BATCH_FOCUS_TYPES)
+            raise ValueError(f"Row {row}: focus must be 'all' or one of {kinds}.")
+        if session == "*":
+            targets = sessions
+        elif not session:
+            targets = [default_session]
+        elif session in sessions:
+            targets = [session]
+        else:
+            raise ValueError(f"Row {row}: unknown session {session!r}.")
+        for s in targets:
+            spec = {"session": s, "scope": scope, "focus_type": kind, "focus": value}
+            if spec not in specs:
+                specs.append(spec)
+    return specs
+
+def _report_batch_job(data: dict, spec: dict) -> tuple[str, dict]:
+    """PDF filename and _build_report_payload kwargs for one spec, as the page report sections build them."""
+    kind, value = spec["focus_type"], spec["focus"]
+    focus_context = {
+        "type": kind,
+        "tables": {key: data.get(key, pd.DataFrame()) for key in _REPORT_BATCH_FOCUS_TABLES},
+        "lookups": {key: data.get(key) for key in _REPORT_BATCH_FOCUS_LOOKUPS},
+    }
+    if kind == "lobbyist":
+        if value not in data["known_shorts"]:
+            raise ValueError(f"Unknown lobbyist {value!r}; expected a LobbyShort key such as 'Smith, J'.")
+        names = data["short_to_names"].get(value, []) if isinstance(data["short_to_names"], dict) else []
+        display_name = names[0] if names else value
+        focus_label = f"Lobbyist: {display_name} ({value})" if display_name != value else f"Lobbyist: {value}"
+        focus_context.update({"lobbyshort": value, "display_name": display_name, "report_title": "Lobbyist Report"})
+    elif kind == "client":
+        focus_label = f"Client: {value}"
+        focus_context.update({"name": value, "report_title": "Client Report"})
+    elif kind == "legislator":
+        focus_label = f"Legislator: {value}"
+        focus_context.update({"name": value, "report_title": "Legislator Report"})
+    elif kind == "bill":
+        try:
+            bill_id = normalize_bill(value)
+        except Exception:
+            bill_id = ""
+        focus_label = f"Bill: {bill_id or value}"
+        focus_context.update({"bill": bill_id or value, "query": value, "report_title": "Bill Report"})
+    else:
+        focus_label = "All Lobbyists"
+        focus_context["report_title"] = "Lobbyist Report"
+
+    tfl = data["Lobby_TFL_Client_All"]
+    tfl_sessions = set(tfl.get("Session", pd.Series(dtype=object)).dropna().astype(str).str.strip().unique().tolist())
+    scope_part = "all-sessions-" if spec["scope"] == "All Sessions" else ""
+    filename = f"tfl-report-{_slugify(spec['session'])}-{scope_part}{_slugify(focus_label)}.pdf"
+    build_kwargs = dict(
+        session_val=spec["session"],
+        scope_label=spec["scope"],
+        focus_label=focus_label,
+        Lobby_TFL_Client_All=tfl,
+        Wit_All=data["Wit_All"],
+        Bill_Status_All=data["Bill_Status_All"],
+        Bill_Sub_All=data["Bill_Sub_All"],
+        tfl_session_val=_tfl_session_for_filter(spec["session"], tfl_sessions),
+        focus_context=focus_context,
+    )
+    return filename, build_kwargs
+
+def _report_batch_worker(path: str, spec: dict, out_dir: str) -> tuple[str, str, str]:
+    """Build and write one report; returns (filename, error, chart error)."""
+    filename, build_kwargs = _report_batch_job(load_workbook(path), spec)
+    job = {"status": "running", "stage": "Queued", "done": 0, "pdf": None, "error": "", "chart_error": "", "finished": 0.0}
+    _run_report_job(job, build_kwargs)
+    if job["pdf"]:
+        target = Path(out_dir) / filename
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(job["pdf"])
+            os.replace(tmp, target)
+        except OSError as exc:
+            job["error"] = f"Could not write {target}: {exc}"
+    elif not job["error"]:
+        job["error"] = "The PDF builder returned no output."
+    return filename, job["error"], job["chart_error"]
+
+def report_batch_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="main.py report-batch",
+        description="Build a PDF report for each row of a spec CSV without starting the app.",
+    )
+    parser.add_argument("specs", help="CSV with a focus column and optional session and scope columns.")
+    parser.add_argument("--out", default="reports", help="Directory for the PDFs (default: ./reports).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count).")
+    parser.add_argument("--data", default=PATH, help="Dataset path (default: DATA_PATH or ./data).")
+    args = parser.parse_args(argv)
+    if not args.data or (not _is_url(args.data) and not os.path.exists(args.data)):
+        parser.error("Data path not found. Set DATA_PATH, pass --data, or place the parquet file in ./data.")
+
+    t0 = time.perf_counter()
+    data = load_workbook(args.data)
+    try:
+        raw = pd.read_csv(args.specs, dtype=str, keep_default_na=False)
+        specs = parse_report_batch_specs(raw, _report_batch_sessions(data))
+        # Resolves every spec up front (bad rows fail before any work starts) and prepares
+        # the tables the reports read, so forked workers inherit them.
+        for spec in specs:
+            _report_batch_job(data, spec)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    if not specs:
+        parser.error("The spec file has no rows.")
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(args.workers, len(specs)))
+    print(f"Loaded data in {time.perf_counter() - t0:.1f}s; building {len(specs)} report(s) with {workers} worker(s)")
+
+    def results():
+        if workers == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            # Spawned workers would re-run this whole script, so build in this process instead.
+            for spec in specs:
+                yield _report_batch_worker(args.data, spec, str(out_dir))
+            return
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            futures = [pool.submit(_report_batch_worker, args.data, spec, str(out_dir)) for spec in specs]
+            for fut in as_completed(futures):
+                yield fut.result()
+
+    failed = 0
+    for i, (filename, error, chart_error) in enumerate(results(), start=1):
+        if error:
+            failed += 1
+            print(f"[{i}/{len(specs)}] FAILED {filename}: {error}", file=sys.stderr)
+            continue
+        print(f"[{i}/{len(specs)}] {out_dir / filename}")
+        if chart_error:
+            print(f"    charts: {chart_error}", file=sys.stderr)
+    print(f"Wrote {len(specs) - failed} report(s) to {out_dir} in {time.perf_counter() - t0:.1f}s")
+    return 1 if failed else 0
+
+if REPORT_BATCH_CLI:
+    sys.exit(report_batch_main(sys.argv[2:]))
 
 nav_suggestions = []
 nav_suggestion_map = {}
-if nav_query and len(nav_query) >= 2 and not is_bill_query(nav_query):
+if nav_query and len(nav_query) >= 2:
     if PATH and (_is_url(PATH) or os.path.exists(PATH)):
         data = load_workbook(PATH)
-        client_index = build_client_index(data.get("Lobby_TFL_Client_All", pd.DataFrame()))
-        author_bills_all = build_author_bill_index(data.get("Bill_Status_All", pd.DataFrame()))
-        member_index = build_member_index(author_bills_all)
-
-        _, client_suggestions = resolve_client_name(nav_query, client_index)
-        _, member_suggestions = resolve_member_name(nav_query, member_index)
-        lobby_candidates = lobbyist_autocomplete_candidates(nav_query, data.get("lobbyist_index", pd.DataFrame()))
-        lobby_suggestions = []
-        if not lobby_candidates:
-            _, lobby_suggestions = resolve_lobbyshort(
-                nav_query,
-                data.get("lobby_index", pd.DataFrame()),
-                data.get("name_to_short", {}),
-                data.get("known_shorts", set()),
-                data.get("short_to_names", {}),
-            )
-
-        for s in client_suggestions:
-            label = f"Client: {s}"
-            nav_suggestions.append(label)
-            nav_suggestion_map[label] = ("client", s)
-        for s in member_suggestions:
-            label = f"Legislator: {s}"
-            nav_suggestions.append(label)
-            nav_suggestion_map[label] = ("member", s)
-        if lobby_candidates:
-            for cand in lobby_candidates[:10]:
-                label = f"Lobbyist: {cand['label']}"
-                nav_suggestions.append(label)
-                nav_suggestion_map[label] = ("lobbyist", cand)
-        else:
-            for s in lobby_suggestions:
-                short_code = s.split(" - ")[0]
-                label = f"Lobbyist: {s}"
-                nav_suggestions.append(label)
-                nav_suggestion_map[label] = ("lobbyist", {"lobbyshort": short_code, "name": short_code, "label": s, "filerid": None})
+        for hit in nav_search_suggestions(nav_query, data["nav_search_index"]):
+            nav_suggestions.append(hit["label"])
+            nav_suggestion_map[hit["label"]] = (hit["kind"], hit["value"])
 
 if nav_suggestions:
     nav_pick = nav_suggest_slot.selectbox(
@@ -15050,6 +17076,12 @@ if nav_suggestions:
             if _active_page != _member_page:
                 st.switch_page(_member_page)
                 st.stop()
+        elif target == "bill":
+            st.session_state.search_query = value
+            st.session_state.lobbyshort = ""
+            if _active_page != _lobby_page:
+                st.switch_page(_lobby_page)
+                st.stop()
         else:
             sel = value if isinstance(value, dict) else {"lobbyshort": value, "name": value, "label": value, "filerid": None}
             sel_name = sel.get("name", "") or sel.get("lobbyshort", "")
@@ -15089,14 +17121,14 @@ if nav_search_submitted and not nav_skip_submit:
             with st.spinner("Loading search data..."):
                 data = load_workbook(PATH)
 
-            client_index = build_client_index(data.get("Lobby_TFL_Client_All", pd.DataFrame()))
-            author_bills_all = build_author_bill_index(data.get("Bill_Status_All", pd.DataFrame()))
-            member_index = build_member_index(author_bills_all)
-
-            resolved_client, client_suggestions = resolve_client_name(nav_query, client_index)
-            resolved_member, member_suggestions = resolve_member_name(nav_query, member_index)
+            nav_index = data["nav_search_index"]
+            client_entry, member_entry, lobby_entry = nav_index["client"], nav_index["member"], nav_index["lobbyist"]
+            resolved_client, client_suggestions = resolve_client_name(nav_query, client_entry["frame"], client_entry["index"])
+            resolved_member, member_suggestions = resolve_member_name(nav_query, member_entry["frame"], member_entry["index"])
 
-            lobby_candidates = lobbyist_autocomplete_candidates(nav_query, data.get("lobbyist_index", pd.DataFrame()))
+            lobby_candidates = lobbyist_autocomplete_candidates(
+                nav_query, lobby_entry["frame"], search_index=lobby_entry["index"]
+            )
             resolved_lobby = ""
             resolved_lobby_filer = None
             resolved_lobby_name = ""
@@ -15338,6 +17370,8 @@ with st.sidebar.expander("Data health", expanded=False):
     st.caption(f"Data path: {PATH}")
     health = data_health_table(data)
     st.dataframe(health, width="stretch", height=260, hide_index=True)
+    st.caption("Load timings")
+    st.dataframe(load_report_table(data), width="stretch", height=260, hide_index=True)
 
 
 # =========================================================
@@ -15792,6 +17826,10 @@ focus_lookups = {
     "name_to_short": name_to_short,
     "short_to_names": short_to_names,
     "filerid_to_short": data.get("filerid_to_short", {}),
+    "filer_row_index": data.get("filer_row_index", {}),
+    "recipient_row_index": data.get("recipient_row_index", {}),
+    "activity_facts": data.get("activity_facts"),
+    "disclosure_facts": data.get("disclosure_facts"),
 }
 
 focus_context = {
@@ -15838,16 +17876,12 @@ _ = _render_pdf_report_section(
 # =========================================================
 # FAST ALL-LOBBYISTS OVERVIEW (cached and uses Low_num/High_num)
 # =========================================================
-@st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+@st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
 def build_all_lobbyists_overview_fast(df: pd.DataFrame, session_val: str | None, scope_val: str) -> tuple[pd.DataFrame, dict]:
     if df.empty:
         return pd.DataFrame(), {}
 
-    d = df.copy()
-    d["Session"] = d["Session"].astype(str).str.strip()
-
-    if scope_val == "This Session" and session_val is not None:
-        d = d[d["Session"] == str(session_val)].copy()
+    d = session_scope(df, session_val if scope_val == "This Session" else None)
 
     d = ensure_cols(d, {"IsTFL": 0, "LobbyShort": "", "Client": "", "Low_num": 0.0, "High_num": 0.0})
 
@@ -15856,7 +17890,7 @@ def build_all_lobbyists_overview_fast(df: pd.DataFrame, session_val: str | None,
          .agg(
              Low=("Low_num", "sum"),
              High=("High_num", "sum"),
-             Clients=("Client", lambda s: s.dropna().astype(str).nunique()),
+             Clients=("Client", "nunique"),
          )
     )
 
@@ -16180,10 +18214,7 @@ with tab_all:
 
         with t2:
             st.markdown('<div class="section-title">Top 5 Taxpayer Funding<br>Governments/Entities</div>', unsafe_allow_html=True)
-            clients = Lobby_TFL_Client_All.copy()
-            clients["Session"] = clients["Session"].astype(str).str.strip()
-            if st.session_state.scope == "This Session" and tfl_session_val is not None:
-                clients = clients[clients["Session"] == str(tfl_session_val)].copy()
+            clients = session_scope(Lobby_TFL_Client_All, tfl_session_val if st.session_state.scope == "This Session" else None)
             clients = ensure_cols(clients, {"IsTFL": 0, "Client": "", "Low_num": 0.0, "High_num": 0.0})
             clients = clients[clients["IsTFL"] == 1].copy()
             if not clients.empty:
@@ -16420,15 +18451,12 @@ else:
 
         # Wit_All filtered
         lobbyshort_norm = norm_name(lobbyshort)
-        wit_all = ensure_cols(
-            Wit_All,
+        base_wit = ensure_cols(
+            session_rows(Wit_All, session) if "Session" in Wit_All.columns else Wit_All.iloc[0:0],
             {"Session": "", "Bill": "", "LobbyShort": "", "IsFor": 0, "IsAgainst": 0, "IsOn": 0},
         )
-        if "LobbyShortNorm" not in wit_all.columns:
-            wit_all = wit_all.copy()
-            wit_all["LobbyShortNorm"] = norm_name_series(wit_all["LobbyShort"])
-        session_col = wit_all["Session"].astype(str).str.strip()
-        base_wit = wit_all[session_col == session].copy()
+        if "LobbyShortNorm" not in base_wit.columns:
+            base_wit["LobbyShortNorm"] = norm_name_series(base_wit["LobbyShort"])
         witness_match_note = ""
         if selected_names:
             name_variants = set()
@@ -16495,9 +18523,7 @@ else:
             and {"Session", "Bill"}.issubset(bills.columns)
             and not bills.empty
         ):
-            bill_subjects = Bill_Sub_All[
-                Bill_Sub_All["Session"].astype(str).str.strip() == session
-            ].merge(
+            bill_subjects = session_rows(Bill_Sub_All, session).merge(
                 bills[["Session", "Bill"]].drop_duplicates(),
                 on=["Session", "Bill"],
                 how="inner",
@@ -16517,10 +18543,8 @@ else:
 
         # Lobbyist clients + totals (use precomputed Low_num/High_num)
         tfl_session = str(tfl_session_val) if tfl_session_val is not None else session
-        lt = Lobby_TFL_Client_All[
-            (Lobby_TFL_Client_All["Session"].astype(str).str.strip() == tfl_session) &
-            (Lobby_TFL_Client_All["LobbyShort"].astype(str).str.strip() == lobbyshort)
-        ].copy()
+        lt = session_rows(Lobby_TFL_Client_All, tfl_session)
+        lt = lt[lt["LobbyShort"].astype(str).str.strip() == lobbyshort].copy()
         if selected_filer_ids and "FilerID" in lt.columns:
             fid = pd.to_numeric(lt["FilerID"], errors="coerce").fillna(-1).astype(int)
             lt = lt[fid.isin(selected_filer_ids)].copy()
@@ -16563,14 +18587,14 @@ else:
         staff_pick = staff_df[match_mask].copy()
         staff_pick_session = staff_df[staff_session & match_mask].copy()
 
-        @st.cache_data(show_spinner=False, ttl=300, max_entries=4)
+        @st.cache_data(show_spinner=False, ttl=300, max_entries=4, hash_funcs=DATASET_HASH_FUNCS)
         def staff_metrics(staff_rows: pd.DataFrame, bills_df: pd.DataFrame, session_val: str, bs_all: pd.DataFrame) -> pd.DataFrame:
             if staff_rows.empty or bills_df.empty:
                 return pd.DataFrame(columns=["Legislator", "% Against that Failed", "% For that Passed"])
 
             legs = sorted(staff_rows["Legislator"].dropna().astype(str).unique().tolist())
             out = []
-            bs = bs_all[bs_all["Session"].astype(str).str.strip() == str(session_val)].copy()
+            bs = session_rows(bs_all, session_val)
 
             for leg in legs:
                 authored = bs[bs["Author"].fillna("").astype(str).str.contains(leg, case=False, na=False)][["Session", "Bill", "Status"]]
@@ -16605,6 +18629,8 @@ else:
             lobbyist_norms_tuple=typed_norms_tuple,
             filerid_to_short=data.get("filerid_to_short", {}),
             filer_ids=tuple(sorted(selected_filer_ids)) if selected_filer_ids else None,
+            _row_indexes=data.get("filer_row_index"),
+            _facts=data.get("activity_facts"),
         )
 
         disclosures = build_disclosures(
@@ -16615,6 +18641,8 @@ else:
             lobbyist_norms_tuple=typed_norms_tuple,
             filerid_to_short=data.get("filerid_to_short", {}),
             filer_ids=tuple(sorted(selected_filer_ids)) if selected_filer_ids else None,
+            _row_indexes=data.get("filer_row_index"),
+            _facts=data.get("disclosure_facts"),
         )
 
         # ---- Overview tab
@@ -0,0 +1,29 @@
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+APP_PATH = Path(__file__).resolve().parents[1] / "main.py"
+# main.py is a Streamlit script; the report-batch CLI hook marks where its
+# definitions end and the page body begins.
+_BODY_MARKER = "\nif REPORT_BATCH_CLI:\n    sys.exit(report_batch_main(sys.argv[2:]))\n"
+
+
+@pytest.fixture(scope="session")
+def app():
+    """main.py's helpers without the page body.
+
+    The script runs in its headless report-batch mode (no page chrome, no
+    Streamlit runtime) and stops where the CLI would take over.
+    """
+    src = APP_PATH.read_text(encoding="utf-8")
+    head, marker, _ = src.partition(_BODY_MARKER)
+    assert marker, "report-batch hook not found in main.py"
+    mod = types.ModuleType("tfl_app")
+    mod.__file__ = str(APP_PATH)
+    mod.__dict__["__name__"] = "__main__"
+    with mock.patch.object(sys, "argv", [str(APP_PATH), "report-batch"]):
+        exec(compile(head, str(APP_PATH), "exec"), mod.__dict__)
+    return mod
@@ -0,0 +1,111 @@
+"""Concurrent ArcGIS layer prefetch against a local stand-in server (ARCGIS_BASE_URL)."""
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+PAGED_LAYER = "county_boundaries"  # default page_size 500
+FAILING_LAYER = "school_district_boundaries"
+SMALL_LAYER = "city_boundaries"
+PAGED_FEATURES = 1234
+SERVER_MAX_RECORDS = 200  # below page_size, so each page is filled over several requests
+
+
+def _square(i: int) -> list:
+    x, y = -100.0 + i * 0.001, 30.0
+    return [[[x, y], [x + 0.001, y], [x + 0.001, y + 0.001], [x, y + 0.001], [x, y]]]
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    routes: dict = {}
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: dict) -> None:
+        raw = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        layer = self.routes.get(parts.path)
+        if layer is None:
+            return self._send(404, {"error": {"code": 404}})
+        if layer == FAILING_LAYER:
+            return self._send(500, {"error": {"code": 500}})
+        total = PAGED_FEATURES if layer == PAGED_LAYER else 3
+        if query.get("returnCountOnly") == "true":
+            return self._send(200, {"count": total})
+        offset = int(query.get("resultOffset", 0))
+        count = min(int(query.get("resultRecordCount", SERVER_MAX_RECORDS)), SERVER_MAX_RECORDS)
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            # Earlier offsets answer last, so results arrive out of order.
+            time.sleep(0.02 * (total - offset) / total)
+            features = [
+                {"attributes": {"FENAME": f"County {i}", "FIPS": str(i), "NAME": f"City {i}", "BASENAME": "", "GEOID": str(i)},
+                 "geometry": {"rings": _square(i)}}
+                for i in range(offset, min(offset + count, total))
+            ]
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+        self._send(200, {"features": features})
+
+
+@pytest.fixture
+def stand_in(app, monkeypatch):
+    routes = {
+        urllib.parse.urlsplit(app.BOUNDARY_LAYER_SPECS[name]["url"]).path + "/query": name
+        for name in (PAGED_LAYER, FAILING_LAYER, SMALL_LAYER)
+    }
+    handler = type("Handler", (_StandIn,), {"routes": routes, "in_flight": 0, "max_in_flight": 0, "lock": threading.Lock()})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(app, "ARCGIS_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(app, "LAYER_STORE_DIR", "off")
+    app._load_subdivision_layer.clear()
+    yield handler
+    app._load_subdivision_layer.clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_prefetch_pages_in_order_and_isolates_failures(app, stand_in):
+    out = app.prefetch_subdivision_layers(names=[PAGED_LAYER, FAILING_LAYER, SMALL_LAYER])
+
+    paged = out[PAGED_LAYER]
+    assert len(paged) == PAGED_FEATURES
+    assert paged["FIPS"].tolist() == [str(i) for i in range(PAGED_FEATURES)]
+    assert paged["feature"].tolist() == list(range(PAGED_FEATURES))
+    assert stand_in.max_in_flight > 1
+
+    assert out[FAILING_LAYER].empty
+    assert out[SMALL_LAYER]["GEOID"].tolist() == ["0", "1", "2"]
+
+
+def test_query_features_fills_capped_pages(app, stand_in):
+    url = app.BOUNDARY_LAYER_SPECS[PAGED_LAYER]["url"]
+    features = app._arcgis_query_features(url, params={"where": "1=1", "f": "json"}, page_size=500)
+    assert [f["attributes"]["FIPS"] for f in features] == [str(i) for i in range(PAGED_FEATURES)]
+
+
+def test_query_features_failure_raises(app, stand_in):
+    url = app.BOUNDARY_LAYER_SPECS[FAILING_LAYER]["url"]
+    with pytest.raises(Exception):
+        app._arcgis_query_features(url, params={"where": "1=1", "f": "json"}, page_size=500)
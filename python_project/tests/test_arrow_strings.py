@@ -0,0 +1,86 @@
+"""Parity of the Arrow-kernel name helpers (ARROW_STRINGS) with the object-dtype path."""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+HELPERS = ("norm_name_series", "clean_filer_name_series", "last_name_norm_series", "first_name_norm_series")
+
+EDGE_CASES = [
+    # plain names and separators
+    "Smith, John",
+    "  John   Smith  ",
+    "Smith,John",
+    "O'Brien, Mary-Kate",
+    "3M Co",
+    "Dr_Smith",
+    # Unicode whitespace that RE2's \s does not cover
+    "\u3000Yamada,\u2003Taro\u00a0",
+    "Jones\u2028Line\u2029Sep",
+    "\x1cFile\x1dSep\x1e\x1f",
+    "\u2007\u202fGarcia\u205fMaria",
+    "Lee\u0085Ann\u1680",
+    # characters whose str.upper() expands
+    "Stra\u00dfe, J\u00f6rg",
+    "\u00df",
+    "\ufb01nn \ufb02oyd",
+    "\u0130stanbul, Ay\u015fe",
+    # title words next to punctuation and non-ASCII letters
+    "Dr. Smith",
+    "Hon. Dr Smith (Ret.)",
+    "Hon Dr Mr Smith",
+    "MR.SMITH",
+    "Smith, Jr.",
+    "Sr.-Jones",
+    "(Acting) Mrs M\u00fcller",
+    "\u00c9ric DR",
+    "\u00c9DR Holdings",
+    "drake",
+    "Jr",
+    "Miss,Ms",
+    # missing and blank values
+    None,
+    np.nan,
+    "",
+    "   ",
+    " ",
+]
+
+
+def _object(values) -> pd.Series:
+    return pd.Series(values, dtype=object)
+
+
+def _arrow(values) -> pd.Series:
+    values = [None if isinstance(v, float) and np.isnan(v) else v for v in values]
+    return pd.Series(values, dtype=pd.ArrowDtype(pa.string()))
+
+
+@pytest.mark.parametrize("helper", HELPERS)
+def test_arrow_string_input_matches_object_path(app, helper):
+    fn = getattr(app, helper)
+    expected = fn(_object(EDGE_CASES))
+    got = fn(_arrow(EDGE_CASES))
+    assert app.is_arrow_string(got)
+    pd.testing.assert_series_equal(got.astype(object), expected.astype(object), check_dtype=False)
+
+
+@pytest.mark.parametrize("helper", HELPERS)
+def test_arrow_strings_mode_on_object_input_matches(app, helper, monkeypatch):
+    fn = getattr(app, helper)
+    expected = fn(_object(EDGE_CASES))
+    monkeypatch.setattr(app, "ARROW_STRINGS", True)
+    got = fn(_object(EDGE_CASES))
+    pd.testing.assert_series_equal(got.astype(object), expected.astype(object), check_dtype=False)
+
+
+@pytest.mark.parametrize("helper", HELPERS)
+def test_empty_series(app, helper):
+    fn = getattr(app, helper)
+    assert fn(_arrow([])).empty
+    assert fn(_object([])).empty
+
+
+def test_norm_name_series_matches_scalar_norm_name(app):
+    got = app.norm_name_series(_arrow(EDGE_CASES)).astype(object).tolist()
+    assert got == [app.norm_name(v) for v in EDGE_CASES]
@@ -0,0 +1,23 @@
+"""The sidebar Data health table must not force lazy tables to load."""
+import pandas as pd
+
+
+def test_data_health_table_skips_unloaded_tables(app):
+    calls = []
+
+    def loader(key):
+        def load(wb):
+            calls.append(key)
+            return pd.DataFrame({"Session": ["89R", "88R"], "LobbyShort": ["Smith, J", "Doe, A"]})
+        return load
+
+    data = app.LazyTables({"Wit_All": loader("Wit_All"), "LaFood": loader("LaFood")})
+    _ = data["Wit_All"]
+
+    health = app.data_health_table(data)
+    statuses = dict(zip(health["Source"], health["Status"]))
+    assert calls == ["Wit_All"]
+    assert len(health) == 17
+    assert statuses[app._source_label("Wit_All")] == "Loaded"
+    assert statuses[app._source_label("LaFood")] == "Not loaded yet"
+    assert statuses[app._source_label("LaSub")] == "Missing"
@@ -0,0 +1,57 @@
+"""Load-time fact tables are sliced only for the tables they were built from."""
+import pandas as pd
+
+
+def _setup(app):
+    src = pd.DataFrame({"Amount": [1, 2, 3]})
+    facts = pd.DataFrame({
+        "Source": pd.Categorical(["LaFood"] * 3, categories=list(app.ACTIVITY_TYPES)),
+        "Row": [0, 1, 2],
+    })
+    rebuilt = []
+
+    def build(tables):
+        rebuilt.append(tables)
+        return pd.DataFrame({"Row": [-1]})
+
+    return src, facts, build, rebuilt
+
+
+def _select(app, facts, src, build):
+    parts = app._select_fact_rows(facts, {"LaFood": src}, {"LaFood": src.iloc[[0, 2]]}, app.ACTIVITY_TYPES, build)
+    return pd.concat(parts)["Row"].tolist()
+
+
+def test_facts_sliced_for_same_dataset(app):
+    src, facts, build, rebuilt = _setup(app)
+    generation = []
+    app.register_dataset_object(facts, "feedc0de00000001:activity_facts", generation)
+    app.register_dataset_object(src, "feedc0de00000001:LaFood", generation)
+    assert _select(app, facts, src, build) == [0, 2]
+    assert not rebuilt
+
+
+def test_facts_rebuilt_for_edited_table_with_same_rows(app):
+    src, facts, build, rebuilt = _setup(app)
+    generation = []
+    app.register_dataset_object(facts, "feedc0de00000001:activity_facts", generation)
+    app.register_dataset_object(src, "feedc0de00000002:LaFood", generation)
+    assert _select(app, facts, src, build) == [-1]
+    assert rebuilt
+
+
+def test_facts_rebuilt_for_unregistered_frames(app):
+    src, facts, build, rebuilt = _setup(app)
+    assert _select(app, facts, src, build) == [-1]
+
+
+def test_disclosure_entity_separator_per_page(app):
+    i4e = pd.DataFrame({
+        "onbehalfName": ["Acme", "Beta", None],
+        "onbehalfMailingCity": ["Austin", "", "Dallas"],
+        "filerName": ["A", "B", "C"],
+    })
+    facts = app.build_disclosure_facts({"LaI4E": i4e})
+    parts = app.select_disclosure_facts(facts, {"LaI4E": i4e}, {"LaI4E": i4e})
+    assert app._disclosure_entity(parts, " -- ").tolist() == ["Acme -- Austin", "Beta", " -- Dallas"]
+    assert app._disclosure_entity(parts, " - ").tolist() == ["Acme - Austin", "Beta", " - Dallas"]
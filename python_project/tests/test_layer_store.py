@@ -0,0 +1,27 @@
+"""Stored boundary layers are re-read when the store file changes."""
+import os
+
+import pandas as pd
+
+LAYER = "county"
+
+
+def test_edited_store_file_is_reread(app, monkeypatch, tmp_path):
+    fetched = pd.DataFrame({"objectid": [1, 2], "name": ["Travis", "Harris"], "lon": [-97.7, -95.4], "lat": [30.3, 29.8]})
+    url = app._SUBDIVISION_LAYERS[LAYER][1]
+    monkeypatch.setattr(app, "LAYER_STORE_DIR", str(tmp_path))
+    monkeypatch.setitem(app._SUBDIVISION_LAYERS, LAYER, (lambda: fetched, url))
+    app._load_subdivision_layer.clear()
+    try:
+        assert app.subdivision_layer(LAYER)["name"].tolist() == ["Travis", "Harris"]
+        assert (tmp_path / f"{LAYER}.parquet").exists()
+        assert app.subdivision_layer(LAYER)["name"].tolist() == ["Travis", "Harris"]
+
+        # Same row count, new contents: not served from the in-memory cache.
+        target = tmp_path / f"{LAYER}.parquet"
+        before = target.stat()
+        fetched.assign(name=["Bexar", "Dallas"]).to_parquet(target, index=False)
+        os.utime(target, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000_000))
+        assert app.subdivision_layer(LAYER)["name"].tolist() == ["Bexar", "Dallas"]
+    finally:
+        app._load_subdivision_layer.clear()
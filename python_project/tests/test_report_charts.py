@@ -0,0 +1,10 @@
+"""Pooled Kaleido scopes render with the same settings as the default scope."""
+import pytest
+
+pytest.importorskip("kaleido")
+
+
+def test_pool_scope_has_mathjax_disabled(app):
+    scope = app._checkout_kaleido_scope(app._kaleido_scope_pool())
+    assert scope.mathjax is None
+    assert scope.default_format == "png"
@@ -0,0 +1,44 @@
+"""Background report jobs are shared only by requests that would build the same PDF."""
+import pandas as pd
+
+
+def _kwargs(focus_context, **overrides):
+    frame = pd.DataFrame({"Session": ["89R"], "Client": ["City of Houston"]})
+    kwargs = dict(
+        session_val="89R",
+        scope_label="This Session",
+        focus_label="All Lobbyists",
+        Lobby_TFL_Client_All=frame,
+        Wit_All=frame,
+        Bill_Status_All=frame,
+        Bill_Sub_All=frame,
+        tfl_session_val="89R",
+        focus_context=focus_context,
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _context(**fields):
+    tables = {"Staff_All": pd.DataFrame({"Session": ["89R"], "Member": ["Bettencourt"]})}
+    return {"type": "", "report_title": "Lobbyist Report", "tables": tables, "lookups": {}, **fields}
+
+
+def test_report_job_id_is_stable(app):
+    assert app._report_job_id("lobby", _kwargs(_context())) == app._report_job_id("lobby", _kwargs(_context()))
+
+
+def test_report_job_id_covers_focus_context(app):
+    base = app._report_job_id("lobby", _kwargs(_context(type="lobbyist", lobbyshort="Smith, J", display_name="Smith, John")))
+    for other in (
+        _context(type="lobbyist", lobbyshort="Smith, K", display_name="Smith, John"),
+        _context(type="lobbyist", lobbyshort="Smith, J", display_name="Smith, Jane"),
+        _context(type="bill", bill="HB 2", query="HB 2"),
+    ):
+        assert app._report_job_id("lobby", _kwargs(other)) != base
+
+
+def test_report_job_id_covers_focus_tables(app):
+    changed = _context()
+    changed["tables"] = {"Staff_All": pd.DataFrame({"Session": ["89R"], "Member": ["Hughes"]})}
+    assert app._report_job_id("lobby", _kwargs(changed)) != app._report_job_id("lobby", _kwargs(_context()))
@@ -0,0 +1,36 @@
+"""Load-time row indexes apply only to the exact table they were built from."""
+import pandas as pd
+
+
+def _filer_table(app, names):
+    df = pd.DataFrame({"FilerID": [101 + i for i in range(len(names))], "filerName": names, "Session": ["89R"] * len(names)})
+    return app.add_filer_norm_columns(df, {}, {})
+
+
+def test_filer_index_used_for_its_table(app):
+    df = _filer_table(app, ["Smith, John", "Doe, Jane", "Smith, John"])
+    index = app.build_filer_row_index(df)
+    cand = app._filer_index_candidates(df, index, set(), set(), {app.norm_name("Smith, John")})
+    assert cand is not None
+    assert cand.index.tolist() == [0, 2]
+
+
+def test_filer_index_skipped_after_same_size_edit(app):
+    df = _filer_table(app, ["Smith, John", "Doe, Jane", "Smith, John"])
+    index = app.build_filer_row_index(df)
+    edited = _filer_table(app, ["Doe, Jane", "Smith, John", "Smith, John"])
+    assert len(edited) == len(df)
+    assert app._filer_index_candidates(edited, index, set(), set(), {app.norm_name("Smith, John")}) is None
+
+
+def _recipient_table(app, members):
+    return app.add_recipient_norm_columns(pd.DataFrame({"recipientName": members, "Session": ["89R"] * len(members)}))
+
+
+def test_recipient_index_skipped_after_same_size_edit(app):
+    df = _recipient_table(app, ["Whitmire, John", "Hughes, Bryan"])
+    index = app.build_recipient_row_index(df)
+    info = app.parse_member_name("Whitmire, John")
+    assert app._member_index_candidates(df, index, info) is not None
+    edited = _recipient_table(app, ["Hughes, Bryan", "Whitmire, John"])
+    assert app._member_index_candidates(edited, index, info) is None